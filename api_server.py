@@ -0,0 +1,287 @@
+"""Local call API.
+
+ApiServer accepts hall calls, car-button presses and status queries from other processes over TCP
+or a Unix socket. It runs an asyncio event loop on its own thread and never touches the cars:
+calls go through the system's CallAdmission queue, which the control loop drains once per tick, and
+status is read from the latest immutable FleetSnapshot. A slow or flooding client therefore costs
+the control loop nothing but the admission lock.
+
+Every message, in both directions, is a frame: a 4-byte big-endian length followed by that many
+bytes of UTF-8 JSON. Clients may pipeline requests; responses come back in request order.
+
+    {"id": 1, "op": "call", "floor": 3, "direction": "UP"}
+    {"id": 2, "op": "call_batch", "calls": [[3, "UP"], [7, "DOWN"]]}
+    {"id": 3, "op": "car_call", "car_id": 0, "floor": 9}
+    {"id": 4, "op": "status"}                    (optionally with "car_id")
+
+Each response is {"id": ..., "ok": true, "result": ...} or {"id": ..., "ok": false, "error": "..."}.
+Call results are Admission names ("ADMITTED", "COALESCED", "RATE_LIMITED" or "QUEUE_FULL").
+"""
+import asyncio
+import json
+import logging
+import socket
+import struct
+import threading
+from enums import Direction
+
+logger = logging.getLogger(__name__)
+
+FRAME_HEADER = struct.Struct('>I')
+MAX_FRAME = 1 << 20 # bytes; a client sending a larger frame is disconnected
+_CALL_DIRECTIONS = {"UP": Direction.UP, "DOWN": Direction.DOWN}
+
+
+def encode_frame(message: dict) -> bytes:
+    """Encodes a message as a length-prefixed JSON frame.
+
+    Args:
+        message (dict): The message.
+
+    Returns:
+        bytes: The frame.
+    """
+    body = json.dumps(message, separators=(",", ":")).encode()
+    return FRAME_HEADER.pack(len(body)) + body
+
+
+class ApiServer:
+    """Serves the call API for an ElevatorSystem on a background thread."""
+    def __init__(self, system, host: str = "127.0.0.1", port: int = 0, unix_path: str = None,
+                 max_frame: int = MAX_FRAME) -> None:
+        """Initializes an ApiServer. Enables admission control on the system if it is not already on.
+
+        Args:
+            system (ElevatorSystem): The system to serve.
+            host (str, optional): The TCP address to bind. Defaults to loopback only.
+            port (int, optional): The TCP port; 0 picks a free one. Defaults to 0.
+            unix_path (str, optional): Serve on this Unix socket instead of TCP. Defaults to None.
+            max_frame (int, optional): The largest request frame accepted, in bytes. Defaults to MAX_FRAME.
+        """
+        self.system = system
+        self.host = host
+        self.port = port
+        self.unix_path = unix_path
+        self.max_frame = max_frame
+        self.address = None # Bound (host, port) or Unix path, set by start()
+        self.requests_served = 0
+        if system.call_admission is None:
+            system.enable_call_admission()
+        self._status = (None, None) # (snapshot version, snapshot dict), converted once per tick
+        self._loop = None
+        self._stopping = None
+        self._writers = set() # Open client connections
+        self._thread = None
+        self._ready = threading.Event()
+        self._error = None
+
+    def start(self) -> tuple | str:
+        """Starts serving on a daemon thread and waits until the socket is bound.
+
+        Returns:
+            tuple | str: The bound (host, port), or the Unix socket path.
+
+        Raises:
+            OSError: If the socket could not be bound.
+        """
+        self._thread = threading.Thread(target=self._run, name="api-server", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._error is not None:
+            raise self._error
+        logger.info("Serving the call API on %s", self.address)
+        return self.address
+
+    def stop(self) -> None:
+        """Stops accepting requests, closes the connections and waits for the server thread to exit."""
+        if self._loop is not None and self._thread.is_alive():
+            self._loop.call_soon_threadsafe(self._stopping.set)
+            self._thread.join()
+
+    def _run(self) -> None:
+        """Runs the server's event loop until stop()."""
+        try:
+            asyncio.run(self._serve())
+        except OSError as e:
+            self._error = e
+            self._ready.set()
+
+    async def _serve(self) -> None:
+        """Binds the socket and serves connections until stopped."""
+        self._loop = asyncio.get_running_loop()
+        self._stopping = asyncio.Event()
+        if self.unix_path:
+            server = await asyncio.start_unix_server(self._handle_connection, path=self.unix_path)
+            self.address = self.unix_path
+        else:
+            server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+            self.address = server.sockets[0].getsockname()[:2]
+        self._ready.set()
+        async with server:
+            await self._stopping.wait()
+            server.close()
+            for writer in list(self._writers):
+                writer.close() # Lets wait_closed() finish without waiting for clients to hang up
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Answers one client's frames in order until it disconnects."""
+        peer = writer.get_extra_info("peername")
+        source = f"api:{peer[0]}:{peer[1]}" if isinstance(peer, tuple) else f"api:unix:{id(writer)}"
+        self._writers.add(writer)
+        try:
+            while True:
+                header = await reader.readexactly(FRAME_HEADER.size)
+                (length,) = FRAME_HEADER.unpack(header)
+                if length > self.max_frame:
+                    logger.warning("Dropping API client %s: %s-byte frame", source, length)
+                    break
+                writer.write(self.handle_frame(await reader.readexactly(length), source))
+                await writer.drain() # Only waits when the client is not reading its responses
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass # Client went away
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    def handle_frame(self, body: bytes, source: str) -> bytes:
+        """Answers one request frame.
+
+        Args:
+            body (bytes): The JSON request, without its length prefix.
+            source (str): The client, for rate limiting.
+
+        Returns:
+            bytes: The response frame.
+        """
+        request_id = None
+        try:
+            request = json.loads(body)
+            request_id = request.get("id")
+            result = self.handle(request, source)
+            response = {"id": request_id, "ok": True, "result": result}
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            response = {"id": request_id, "ok": False, "error": f"{type(e).__name__}: {e}"}
+        self.requests_served += 1
+        return encode_frame(response)
+
+    def handle(self, request: dict, source: str = "api"):
+        """Executes one decoded request.
+
+        Args:
+            request (dict): The request, with an "op" and its fields.
+            source (str, optional): The client, for rate limiting. Defaults to "api".
+
+        Returns:
+            The operation's result: an Admission name, a list of them, or a status dict.
+
+        Raises:
+            ValueError: If the operation, a floor, a direction or a car ID is invalid.
+            KeyError: If a required field is missing.
+        """
+        op = request["op"]
+        if op == "call":
+            return self.system.call_elevator(self._floor(request["floor"]), self._direction(request["direction"]), source).name
+        if op == "call_batch":
+            calls = [(self._floor(floor), self._direction(direction)) for floor, direction in request["calls"]]
+            return [admission.name for admission in self.system.call_elevator_many(calls, source)]
+        if op == "car_call":
+            return self.system.press_car_button(request["car_id"], self._floor(request["floor"]), source).name
+        if op == "status":
+            return self._status_of(request.get("car_id"))
+        raise ValueError(f"Unknown operation: {op}")
+
+    @staticmethod
+    def _direction(direction) -> Direction:
+        """Validates a call direction name from a request."""
+        if direction not in _CALL_DIRECTIONS:
+            raise ValueError(f"Invalid direction: {direction}")
+        return _CALL_DIRECTIONS[direction]
+
+    def _floor(self, floor) -> int:
+        """Validates a floor number from a request."""
+        if type(floor) is not int or not 0 <= floor < self.system.num_floors:
+            raise ValueError(f"Invalid floor: {floor}")
+        return floor
+
+    def _status_of(self, car_id) -> dict:
+        """Returns the latest snapshot, or one car of it, as a dict."""
+        snapshot = self.system.get_snapshot()
+        version, status = self._status
+        if version != snapshot.version:
+            status = snapshot.to_dict()
+            self._status = (snapshot.version, status)
+        if car_id is None:
+            return status
+        for car in status["cars"]:
+            if car["car_id"] == car_id:
+                return car
+        raise ValueError(f"Unknown elevator car: {car_id}")
+
+
+class ApiClient:
+    """A blocking client for the call API, for scripts, tests and integrations."""
+    def __init__(self, address, timeout: float = 5.0) -> None:
+        """Connects to an ApiServer.
+
+        Args:
+            address (tuple | str): The server's (host, port), or its Unix socket path.
+            timeout (float, optional): Socket timeout in seconds. Defaults to 5.0.
+        """
+        if isinstance(address, str):
+            self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        else:
+            self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._sock.settimeout(timeout)
+        self._sock.connect(address)
+        self._file = self._sock.makefile("rb")
+        self._next_id = 0
+
+    def request(self, op: str, **fields) -> dict:
+        """Sends one request and waits for its response.
+
+        Args:
+            op (str): The operation.
+            **fields: The operation's fields.
+
+        Returns:
+            dict: The response.
+        """
+        return self.pipeline([dict(fields, op=op)])[0]
+
+    def pipeline(self, requests: list[dict]) -> list[dict]:
+        """Sends a batch of requests in one write, then reads all their responses.
+
+        Args:
+            requests (list[dict]): The requests; each is given an "id" if it has none.
+
+        Returns:
+            list[dict]: The responses, in request order.
+        """
+        frames = []
+        for request in requests:
+            if "id" not in request:
+                request = dict(request, id=self._next_id)
+                self._next_id += 1
+            frames.append(encode_frame(request))
+        self._sock.sendall(b"".join(frames))
+        return [self._read_response() for _ in requests]
+
+    def _read_response(self) -> dict:
+        """Reads one response frame."""
+        header = self._file.read(FRAME_HEADER.size)
+        if len(header) < FRAME_HEADER.size:
+            raise ConnectionError("Connection closed by the API server")
+        (length,) = FRAME_HEADER.unpack(header)
+        return json.loads(self._file.read(length))
+
+    def close(self) -> None:
+        """Closes the connection."""
+        self._file.close()
+        self._sock.close()
+
+    def __enter__(self) -> 'ApiClient':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
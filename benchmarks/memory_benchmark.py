@@ -0,0 +1,81 @@
+"""Measures the memory footprint of elevator cars and floors.
+
+Builds a simulated building with tracemalloc running and reports the bytes allocated per car
+(including its door, panel buttons and display) and per floor (including its hall panel and display),
+then the cost of a lazy FloorDirectory of the same height after touching only a few floors.
+
+Usage:
+    python3 benchmarks/memory_benchmark.py --floors 500 --cars 48 --visited 20
+"""
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+# Add the parent directory to the sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from database_manager import DatabaseManager
+from elevator_car import ElevatorCar
+from elevator_component_factory import ElevatorComponentFactory
+from floor import Floor, FloorDirectory
+
+
+def measure(build) -> tuple[object, int]:
+    """Runs a builder under tracemalloc and returns its result and the bytes it kept allocated.
+
+    Args:
+        build: A zero-argument callable that builds the objects to measure.
+
+    Returns:
+        tuple[object, int]: The built objects and the net bytes allocated.
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--floors", type=int, default=500, help="Number of floors in the building.")
+    parser.add_argument("--cars", type=int, default=48, help="Number of elevator cars.")
+    parser.add_argument("--visited", type=int, default=20, help="Floors to touch in the lazy FloorDirectory.")
+    args = parser.parse_args()
+
+    database_manager = DatabaseManager(":memory:")
+    factory = ElevatorComponentFactory()
+
+    def build_cars() -> list[ElevatorCar]:
+        return [ElevatorCar(car_id=i, num_floors=args.floors,
+                            **factory.create_elevator_car_dependencies(args.floors, database_manager))
+                for i in range(args.cars)]
+
+    def build_floors() -> list[Floor]:
+        return [Floor(i, args.floors, factory) for i in range(args.floors)]
+
+    def build_lazy_floors() -> FloorDirectory:
+        directory = FloorDirectory(args.floors, factory)
+        for i in range(0, args.floors, max(1, args.floors // max(1, args.visited))):
+            directory[i]
+        return directory
+
+    cars, car_bytes = measure(build_cars)
+    floors, floor_bytes = measure(build_floors)
+    lazy_floors, lazy_bytes = measure(build_lazy_floors)
+
+    print(f"Building: {args.floors} floors, {args.cars} cars")
+    print(f"Cars:   {car_bytes:>12,} bytes total, {car_bytes // max(1, len(cars)):>10,} bytes per car")
+    print(f"Floors: {floor_bytes:>12,} bytes total, {floor_bytes // max(1, len(floors)):>10,} bytes per floor")
+    print(f"Total:  {car_bytes + floor_bytes:>12,} bytes")
+    print(f"Lazy floors: {lazy_bytes:>7,} bytes total with {lazy_floors.materialized_count()} of {len(lazy_floors)} floors built")
+    database_manager.close()
+
+
+if __name__ == "__main__":
+    main()
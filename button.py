@@ -3,6 +3,8 @@ from enums import Direction
 
 class Button(ABC):
     """Abstract base class for all buttons in the elevator system."""
+    __slots__ = ("pressed",)
+
     def __init__(self) -> None:
         """Initializes a new Button instance.
 
@@ -30,6 +32,8 @@ class Button(ABC):
 
 class DoorButton(Button):
     """Represents a button for controlling the elevator door (open/close)."""
+    __slots__ = ()
+
     def is_pressed(self) -> bool:
         """Checks if the door button is currently pressed.
 
@@ -40,6 +44,8 @@ class DoorButton(Button):
 
 class HallButton(Button):
     """Represents a button on a floor's hall panel (up/down call button)."""
+    __slots__ = ("direction",)
+
     def __init__(self, direction: Direction) -> None:
         """Initializes a new HallButton instance.
 
@@ -67,6 +73,8 @@ class HallButton(Button):
 
 class ElevatorButton(Button):
     """Represents a button inside the elevator car for selecting a destination floor."""
+    __slots__ = ("destination_floor",)
+
     def __init__(self, floor: int) -> None:
         """Initializes a new ElevatorButton instance.
 
@@ -94,6 +102,8 @@ class ElevatorButton(Button):
 
 class EmergencyButton(Button):
     """Represents an emergency button inside the elevator car."""
+    __slots__ = ()
+
     def is_pressed(self) -> bool:
         """Checks if the emergency button is currently pressed.
 
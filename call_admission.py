@@ -0,0 +1,183 @@
+"""Admission control for hall calls and car-button presses.
+
+CallAdmission sits in front of ElevatorSystem's request handling. A press is coalesced if the same
+call was admitted within the debounce window, is already queued or (for hall calls) is already lit.
+Otherwise it is charged to its source's token bucket and put on a bounded intake queue. Presses
+over a source's rate or arriving at a full queue are rejected straight away, so the caller gets
+backpressure instead of waiting on a lock. The control loop drains the queue once per tick. Only
+the queue's own lock is taken on the press path.
+"""
+from collections import deque
+from threading import Lock
+from enums import Direction, Admission
+from time_provider import TimeProvider
+from metrics import MetricsRegistry, REGISTRY
+
+
+class _TokenBucket:
+    """A token bucket: `burst` presses at once, refilled at `rate` presses per second."""
+    __slots__ = ("tokens", "updated")
+
+    def __init__(self, burst: float, now: float) -> None:
+        self.tokens = burst
+        self.updated = now
+
+
+class CallAdmission:
+    """Debounces, rate-limits and queues hall calls and car calls for the control loop."""
+    def __init__(self, time_provider: TimeProvider = None, debounce_seconds: float = 0.5, rate: float = 5.0,
+                 burst: int = 10, queue_size: int = 256, is_pending=None, metrics: MetricsRegistry = None) -> None:
+        """Initializes a CallAdmission stage.
+
+        Args:
+            time_provider (TimeProvider, optional): The clock for debounce windows and refills. Defaults to a real clock.
+            debounce_seconds (float, optional): Repeat presses of the same call within this window are coalesced. Defaults to 0.5.
+            rate (float, optional): Presses per second each source may sustain. Defaults to 5.0.
+            burst (int, optional): Presses a source may make at once after being quiet. Defaults to 10.
+            queue_size (int, optional): The most calls waiting for the next tick. Defaults to 256.
+            is_pending (callable, optional): is_pending(floor, direction) -> bool, True if the call is already lit.
+                                             Defaults to only checking the queue.
+            metrics (MetricsRegistry, optional): The registry to record admission metrics in. Defaults to REGISTRY.
+
+        Raises:
+            ValueError: If debounce_seconds is negative, or rate, burst or queue_size is not positive.
+        """
+        if debounce_seconds < 0 or rate <= 0 or burst <= 0 or queue_size <= 0:
+            raise ValueError("Debounce must be non-negative and rate, burst and queue size positive")
+        self.time_provider = time_provider if time_provider else TimeProvider()
+        self.debounce_seconds = debounce_seconds
+        self.rate = rate
+        self.burst = burst
+        self.queue_size = queue_size
+        self.is_pending = is_pending
+        self._queue = deque() # (floor, direction) hall calls
+        self._car_queue = deque() # (car_id, floor) car calls
+        self._first_hall_call_at = None # Time the oldest queued hall call was pressed
+        self._queued = set() # Keys of the queued calls: (floor, direction) or ("car", car_id, floor)
+        self._last_admitted = {} # Call key -> time of the last admitted press
+        self._buckets = {} # source -> _TokenBucket
+        self._lock = Lock()
+
+        metrics = metrics if metrics else REGISTRY
+        self._admitted = metrics.counter("elevator_calls_admitted", "Call button presses admitted to the intake queue.")
+        self._coalesced = metrics.counter("elevator_calls_coalesced", "Duplicate call button presses merged into a pending call.")
+        rejected = metrics.counter("elevator_calls_rejected", "Call button presses rejected by admission control.", ("reason",))
+        self._rate_limited = rejected.labels("rate_limited")
+        self._queue_full = rejected.labels("queue_full")
+        self._queue_depth = metrics.gauge("elevator_intake_queue_depth", "Calls waiting in the intake queue.")
+
+    def submit(self, floor: int, direction: Direction, source: str = "local") -> Admission:
+        """Offers a hall call press to the intake queue.
+
+        Args:
+            floor (int): The calling floor.
+            direction (Direction): The requested direction.
+            source (str, optional): Who pressed: a hall panel, an integration, a client address. Defaults to "local".
+
+        Returns:
+            Admission: ADMITTED if queued, COALESCED if merged into an existing call, RATE_LIMITED or QUEUE_FULL if rejected.
+        """
+        now = self.time_provider.get_time()
+        with self._lock:
+            return self._admit_hall_call(floor, direction, source, now)
+
+    def submit_many(self, calls, source: str = "local") -> list[Admission]:
+        """Offers a batch of hall call presses from one source, taking the lock once.
+
+        Args:
+            calls (Iterable[tuple[int, Direction]]): The (floor, direction) presses, in order.
+            source (str, optional): Who pressed. Defaults to "local".
+
+        Returns:
+            list[Admission]: The outcome of each press, as submit() would return it.
+        """
+        now = self.time_provider.get_time()
+        with self._lock:
+            return [self._admit_hall_call(floor, direction, source, now) for floor, direction in calls]
+
+    def submit_car_call(self, car_id: int, floor: int, source: str = "local") -> Admission:
+        """Offers a car-button press to the intake queue.
+
+        Args:
+            car_id (int): The car whose button was pressed.
+            floor (int): The destination floor.
+            source (str, optional): Who pressed. Defaults to "local".
+
+        Returns:
+            Admission: ADMITTED if queued, COALESCED if merged into an existing call, RATE_LIMITED or QUEUE_FULL if rejected.
+        """
+        now = self.time_provider.get_time()
+        with self._lock:
+            return self._admit(("car", car_id, floor), (car_id, floor), self._car_queue, source, now)
+
+    def _admit_hall_call(self, floor: int, direction: Direction, source: str, now: float) -> Admission:
+        """Admits a hall call unless its button is already lit. Called with the lock held."""
+        if self.is_pending is not None and self.is_pending(floor, direction):
+            self._coalesced.inc()
+            return Admission.COALESCED
+        admission = self._admit((floor, direction), (floor, direction), self._queue, source, now)
+        if admission == Admission.ADMITTED and self._first_hall_call_at is None:
+            self._first_hall_call_at = now
+        return admission
+
+    def _admit(self, key: tuple, call: tuple, queue: deque, source: str, now: float) -> Admission:
+        """Debounces a call, charges its source and queues it. Called with the lock held."""
+        last = self._last_admitted.get(key)
+        if key in self._queued or (last is not None and now - last < self.debounce_seconds):
+            self._coalesced.inc()
+            return Admission.COALESCED
+        bucket = self._buckets.get(source)
+        if bucket is None:
+            bucket = self._buckets[source] = _TokenBucket(self.burst, now)
+        else:
+            bucket.tokens = min(self.burst, bucket.tokens + (now - bucket.updated) * self.rate)
+            bucket.updated = now
+        if bucket.tokens < 1:
+            self._rate_limited.inc()
+            return Admission.RATE_LIMITED
+        depth = len(self._queue) + len(self._car_queue)
+        if depth >= self.queue_size:
+            self._queue_full.inc()
+            return Admission.QUEUE_FULL
+        bucket.tokens -= 1
+        queue.append(call)
+        self._queued.add(key)
+        self._last_admitted[key] = now
+        self._queue_depth.set(depth + 1)
+        self._admitted.inc()
+        return Admission.ADMITTED
+
+    def drain(self) -> tuple[list[tuple[int, Direction]], list[tuple[int, int]]]:
+        """Takes every queued call, oldest first, and forgets state that can no longer affect a press.
+
+        Returns:
+            tuple[list[tuple[int, Direction]], list[tuple[int, int]]]: The admitted (floor, direction) hall calls
+                                                                       and (car_id, floor) car calls.
+        """
+        hall_calls, car_calls, _ = self.drain_timed()
+        return hall_calls, car_calls
+
+    def drain_timed(self) -> tuple[list[tuple[int, Direction]], list[tuple[int, int]], float]:
+        """Takes every queued call, as drain() does, along with when the oldest hall call was pressed.
+
+        Returns:
+            tuple[list[tuple[int, Direction]], list[tuple[int, int]], float]: The admitted hall calls and car calls,
+                and the press time of the first hall call (None if no hall call was queued).
+        """
+        now = self.time_provider.get_time()
+        with self._lock:
+            calls = (list(self._queue), list(self._car_queue), self._first_hall_call_at)
+            self._first_hall_call_at = None
+            self._queue.clear()
+            self._car_queue.clear()
+            self._queued.clear()
+            self._queue_depth.set(0)
+            # Debounce windows that have closed, and buckets that have refilled, behave like new ones
+            self._last_admitted = {key: at for key, at in self._last_admitted.items() if now - at < self.debounce_seconds}
+            refill = self.burst / self.rate
+            self._buckets = {source: bucket for source, bucket in self._buckets.items() if now - bucket.updated < refill}
+        return calls
+
+    def pending(self) -> int:
+        """Returns the number of calls waiting for the next drain."""
+        return len(self._queue) + len(self._car_queue)
@@ -0,0 +1,118 @@
+"""Per-car stop scheduling.
+
+A CarScheduler orders all of a car's pending stops, in both directions, into one stop sequence.
+The car caches the sequence and only asks its scheduler for a new one when a stop is added or
+removed, so the movement states look up the next stop in O(1) on every tick.
+"""
+from abc import ABC, abstractmethod
+from enums import Direction
+
+
+class CarScheduler(ABC):
+    """Abstract base class for the order in which a car serves its stops."""
+    name = ""
+
+    @abstractmethod
+    def plan(self, car: object) -> tuple[int, ...]:
+        """Orders the car's pending stops.
+
+        Args:
+            car (object): The ElevatorCar to plan for.
+
+        Returns:
+            tuple[int, ...]: Every pending stop exactly once, in the order they will be served.
+        """
+        pass
+
+    @staticmethod
+    def _stops(car: object) -> set[int]:
+        """Returns the car's pending stops, whichever request list they are in."""
+        return set(car.up_requests).union(car.down_requests)
+
+
+class LookScheduler(CarScheduler):
+    """LOOK: sweep on in the direction of travel to the last stop that way, then sweep back.
+
+    Stops behind the car, and stops ahead of a moving car that it can no longer brake for, are
+    served on the return sweep. An idle car sweeps up first if anything is above it.
+    """
+    name = "look"
+
+    def plan(self, car: object) -> tuple[int, ...]:
+        """Orders the car's stops into an outbound and a return sweep."""
+        current_floor = car.current_floor
+        if car.direction == Direction.DOWN:
+            ahead = [floor for floor in self._stops(car) if floor <= current_floor and car.can_stop_at(floor)]
+            ahead.sort(reverse=True)
+        else:
+            ahead = [floor for floor in self._stops(car) if floor >= current_floor and car.can_stop_at(floor)]
+            ahead.sort()
+        behind = sorted(self._stops(car).difference(ahead), reverse=car.direction != Direction.DOWN)
+        return tuple(ahead + behind)
+
+
+class CLookScheduler(CarScheduler):
+    """C-LOOK: serve stops on upward sweeps only.
+
+    After the highest stop the car runs down without stopping to the lowest pending stop and
+    sweeps up again, which evens out waits between the ends of the building.
+    """
+    name = "c-look"
+
+    def plan(self, car: object) -> tuple[int, ...]:
+        """Orders the car's stops into upward sweeps."""
+        current_floor = car.current_floor
+        stops = self._stops(car)
+        if car.direction == Direction.DOWN:
+            # Running down to start the next sweep: stops it cannot brake for wait for the sweep after
+            return tuple(sorted(stops, key=lambda floor: (not car.can_stop_at(floor), floor)))
+        ahead = sorted(floor for floor in stops if floor >= current_floor and car.can_stop_at(floor))
+        return tuple(ahead + sorted(stops.difference(ahead)))
+
+
+class ShortestTimeFirstScheduler(CarScheduler):
+    """Shortest time first: always head for the stop that is quickest to reach from the last one.
+
+    Travel times come from the car's motion model if it has one, and from floor distance otherwise.
+    Fewer total travel seconds, at the cost of possibly starving a far stop while nearer ones keep coming.
+    """
+    name = "stf"
+
+    def plan(self, car: object) -> tuple[int, ...]:
+        """Orders the car's stops greedily by travel time."""
+        motion = car.motion
+        if motion is not None:
+            cost = motion.travel_time
+        else:
+            cost = lambda from_floor, to_floor: abs(to_floor - from_floor)
+        remaining = self._stops(car)
+        reachable = {floor for floor in remaining if car.can_stop_at(floor)} or remaining
+        position = car.current_floor
+        order = []
+        candidates = reachable # A moving car's first stop must be one it can still brake for
+        while remaining:
+            position = min(candidates, key=lambda floor: (cost(position, floor), floor))
+            order.append(position)
+            remaining.discard(position)
+            candidates = remaining
+        return tuple(order)
+
+
+SCHEDULERS = {scheduler.name: scheduler for scheduler in (LookScheduler, CLookScheduler, ShortestTimeFirstScheduler)}
+
+
+def create_scheduler(name: str) -> CarScheduler:
+    """Creates a scheduler by name.
+
+    Args:
+        name (str): "look", "c-look" or "stf".
+
+    Returns:
+        CarScheduler: A new scheduler.
+
+    Raises:
+        ValueError: If the name is unknown.
+    """
+    if name not in SCHEDULERS:
+        raise ValueError(f"Unknown car scheduler: {name}")
+    return SCHEDULERS[name]()
@@ -1,12 +1,19 @@
-from enum import Enum
+from enum import IntEnum
 
-class Command(Enum):
-    SET_DIRECTION = "set_direction"
-    SET_STATE = "set_state"
-    INCREMENT_FLOOR = "increment_floor"
-    DECREMENT_FLOOR = "decrement_floor"
-    ADD_UP_REQUEST = "add_up_request"
-    ADD_DOWN_REQUEST = "add_down_request"
-    REMOVE_UP_REQUEST = "remove_up_request"
-    REMOVE_DOWN_REQUEST = "remove_down_request"
-    OPEN_DOOR_AND_NOTIFY = "open_door_and_notify"
+class Command(IntEnum):
+    """Commands an ElevatorState emits for its ElevatorCar to execute.
+
+    Values are dense integer opcodes, so a car can index its handler table with them directly.
+    States write commands into the car's reusable buffer as flat (command, argument) pairs,
+    with None as the argument of commands that take none.
+    """
+    SET_DIRECTION = 0
+    SET_STATE = 1
+    INCREMENT_FLOOR = 2
+    DECREMENT_FLOOR = 3
+    ADD_UP_REQUEST = 4
+    ADD_DOWN_REQUEST = 5
+    REMOVE_UP_REQUEST = 6
+    REMOVE_DOWN_REQUEST = 7
+    OPEN_DOOR_AND_NOTIFY = 8
+    TRAVEL_TO = 9
@@ -3,3 +3,87 @@
 NUM_FLOORS = 13
 NUM_CARS = 3
 DOOR_OPEN_DURATION = 2.0 # seconds
+# Adaptive door dwell: sized per stop instead of DOOR_OPEN_DURATION everywhere
+ADAPTIVE_DWELL_ENABLED = True
+CAR_CALL_DWELL = 1.0 # seconds, when passengers only get out
+HALL_CALL_DWELL = 2.0 # seconds, when passengers board
+LOBBY_FLOOR = 0
+LOBBY_PEAK_DWELL = 4.0 # seconds, at the lobby during peak hours
+PEAK_HOURS = ((7, 10), (16, 19)) # Local (start, end) hours
+MIN_DWELL = 0.5 # seconds; the close button cannot end a stop sooner
+CAR_SCHEDULER = "look" # Order in which each car serves its stops: "look", "c-look" or "stf" (shortest time first)
+CAR_CAPACITY = 13 # passengers
+LOAD_PENALTY_FLOORS = 4.0 # Dispatch cost of a nearly full car, in floors of extra distance (scaled by its load factor)
+
+# Logging
+LOG_LEVEL = "INFO"
+LOG_LEVELS = { # Per-subsystem levels, keyed by module (logger) name
+    "sqlite3": "WARNING",
+    "database_manager": "INFO",
+    "elevator_car": "INFO",
+    "elevator_system": "INFO",
+    "request_manager": "INFO",
+}
+LOG_QUEUE_ENABLED = True # Hand records to a listener thread so log I/O never blocks a tick
+LOG_FILE = None # e.g. "elevator.log" to also log to a file
+
+# Metrics export (set to None to disable)
+METRICS_TEXTFILE_PATH = None # e.g. "elevator_metrics.prom" for a node_exporter textfile collector
+METRICS_HTTP_PORT = None # e.g. 9108 to serve /metrics on localhost
+
+# Tick profiling (opt-in; adds per-phase timers and sampled cProfile captures of slow ticks)
+TICK_PROFILING_ENABLED = False
+TICK_PROFILE_DIR = "tick_profiles"
+TICK_PROFILE_OUTLIER_SECONDS = 0.05
+TICK_PROFILE_SAMPLE_EVERY = 10
+
+# Journey tracking (opt-in; keeps every hall call's wait and ride times in memory, growing with traffic)
+JOURNEY_TRACKING_ENABLED = False
+
+# Terminal dashboard (opt-in; replaces the per-tick display prints with a diff-redrawn table)
+DASHBOARD_ENABLED = False # Set LOG_FILE too, so log lines do not scroll the table
+DASHBOARD_MAX_FPS = 10
+
+# Traffic trace (set to None to disable): append every hall call and car call for later replay
+TRAFFIC_TRACE_PATH = None # e.g. "traffic.trace"; replay with: python3 traffic_trace.py traffic.trace
+
+# Telemetry history (set TELEMETRY_DIR to None to disable): per-tick car rows in rolling columnar segments
+TELEMETRY_DIR = None # e.g. "telemetry"
+TELEMETRY_SEGMENT_SECONDS = 3600 # Start a new segment every hour
+TELEMETRY_RETENTION_SECONDS = 7 * 24 * 3600 # Delete segments older than a week
+
+# Hot standby (set CONTROLLER_LEASE_PATH to None to disable): run a second main.py as a warm replica
+CONTROLLER_LEASE_PATH = None # e.g. "controller.lease"
+CONTROLLER_LEASE_SECONDS = 3.0 # The standby takes over this long after the primary's last heartbeat
+
+# Kinematic motion (opt-in; cars travel continuously between floors under jerk-limited profiles)
+KINEMATIC_MOTION_ENABLED = False
+FLOOR_HEIGHT = 3.5 # metres
+MAX_VELOCITY = 2.5 # m/s
+MAX_ACCELERATION = 1.0 # m/s^2
+MAX_JERK = 1.5 # m/s^3
+
+# Flight recorder (always on): ring buffer of packed command/dispatch/hall-call records
+FLIGHT_RECORDER_CAPACITY = 262144 # records of 16 bytes
+FLIGHT_RECORDER_DUMP_PATH = "flight_recorder.bin" # written on crash or SIGUSR1
+
+# Debug validation of the commands elevator states emit (logs unknown commands; slower)
+DEBUG_VALIDATE_COMMANDS = False
+
+# Hall call admission control (see call_admission.py)
+CALL_ADMISSION_ENABLED = False
+CALL_DEBOUNCE_SECONDS = 0.5 # Repeat presses of a floor and direction within this window are coalesced
+CALL_RATE_PER_SOURCE = 5.0 # Sustained presses per second per source
+CALL_BURST_PER_SOURCE = 10 # Presses a quiet source may make at once
+CALL_INTAKE_QUEUE_SIZE = 256 # Calls waiting for the next tick; presses beyond it are rejected
+DISPATCH_BATCH_WINDOW = 0.0 # seconds; e.g. 0.005 to assign bursts of hall calls together
+
+# Local call API (see api_server.py); calls it receives go through admission control
+API_SERVER_PORT = None # e.g. 8765 to serve on TCP
+API_SERVER_HOST = "127.0.0.1"
+API_SERVER_UNIX_PATH = None # e.g. "elevator.sock" to serve on a Unix socket instead
+
+# Idle sleeping: once every car is at rest with no call waiting, the main loop stops ticking (and saving)
+# and sleeps until a call, a button press or ElevatorSystem.notify_activity() wakes it
+IDLE_WAIT_ENABLED = True
+IDLE_WAIT_SECONDS = 60.0 # Longest idle sleep, so metrics and the standby lease are still refreshed
@@ -0,0 +1,126 @@
+import sys
+import time
+
+_CLEAR_SCREEN = "\x1b[2J\x1b[H"
+_HIDE_CURSOR = "\x1b[?25l"
+_SHOW_CURSOR = "\x1b[?25h"
+
+
+def _move_to(row: int, column: int) -> str:
+    """Returns the ANSI sequence that moves the cursor to a 1-based row and column."""
+    return f"\x1b[{row};{column}H"
+
+
+class TerminalDashboard:
+    """A diff-based terminal view of the fleet: one row per car under a hall-call header.
+
+    Each frame only formats the rows of cars whose Display is dirty, compares every row with what is
+    already on screen and rewrites just the changed span of characters, collecting all cursor moves
+    and text into a single write. Frames are capped at max_fps independently of the tick rate; a
+    skipped frame leaves the displays dirty, so their changes are drawn by the next one.
+    """
+    def __init__(self, stream=None, max_fps: float = 10.0, clock=time.monotonic) -> None:
+        """Initializes a TerminalDashboard.
+
+        Args:
+            stream (file-like, optional): Where frames are written. Defaults to sys.stdout.
+            max_fps (float, optional): The maximum number of frames drawn per second; 0 draws every frame. Defaults to 10.
+            clock (callable, optional): Monotonic clock used for the frame cap. Defaults to time.monotonic.
+        """
+        self.stream = stream if stream is not None else sys.stdout
+        self.frame_interval = 1.0 / max_fps if max_fps > 0 else 0.0
+        self.clock = clock
+        self.frames_drawn = 0
+        self._rows = [] # Rows currently on screen; row 0 is the header
+        self._last_frame = None
+
+    @staticmethod
+    def format_header(up_calls, down_calls) -> str:
+        """Formats the hall-call header row.
+
+        Args:
+            up_calls (Iterable[int]): The pending up hall calls.
+            down_calls (Iterable[int]): The pending down hall calls.
+
+        Returns:
+            str: The header row.
+        """
+        up = " ".join(map(str, sorted(up_calls))) or "-"
+        down = " ".join(map(str, sorted(down_calls))) or "-"
+        return f"Hall calls  up: {up}  down: {down}"
+
+    @staticmethod
+    def format_car(car_id: int, display) -> str:
+        """Formats one car's row as fixed-width cells, so a change only touches its own cells.
+
+        Args:
+            car_id (int): The ID of the car.
+            display (Display): The car's display.
+
+        Returns:
+            str: The car's row.
+        """
+        state = display.state.__class__.__name__ if display.state is not None else "-"
+        return f"Car {car_id:>3}  Floor {display.floor:>3}  {display.direction.name:<4}  {state:<20}"
+
+    def render(self, cars: list, up_calls=(), down_calls=()) -> bool:
+        """Draws a frame unless the previous one was drawn less than a frame interval ago.
+
+        Args:
+            cars (list): The ElevatorCar instances, in display order.
+            up_calls (Iterable[int], optional): The pending up hall calls. Defaults to none.
+            down_calls (Iterable[int], optional): The pending down hall calls. Defaults to none.
+
+        Returns:
+            bool: True if a frame was drawn, False if it was skipped by the frame cap.
+        """
+        now = self.clock()
+        if self._last_frame is not None and now - self._last_frame < self.frame_interval:
+            return False
+        self._last_frame = now
+
+        previous = self._rows
+        redraw = len(previous) != len(cars) + 1 # First frame, or the fleet changed size
+        rows = [self.format_header(up_calls, down_calls)]
+        for index, car in enumerate(cars, start=1):
+            display = car.display
+            if redraw or display.dirty:
+                rows.append(self.format_car(car.car_id, display))
+                display.mark_clean()
+            else:
+                rows.append(previous[index])
+
+        if redraw:
+            parts = [_HIDE_CURSOR, _CLEAR_SCREEN, "\n".join(rows)]
+        else:
+            parts = []
+            for index, (old, new) in enumerate(zip(previous, rows)):
+                if old != new:
+                    parts.extend(self._diff_row(index + 1, old, new))
+        if parts:
+            parts.append(_move_to(len(rows) + 1, 1)) # Park the cursor below the table
+            self.stream.write("".join(parts))
+            self.stream.flush()
+        self._rows = rows
+        self.frames_drawn += 1
+        return True
+
+    @staticmethod
+    def _diff_row(row: int, old: str, new: str) -> list[str]:
+        """Returns the writes that turn an on-screen row into a new one, covering only the changed span."""
+        if len(new) < len(old):
+            new = new.ljust(len(old)) # Blank out the tail of a row that got shorter
+        start = 0
+        limit = min(len(old), len(new))
+        while start < limit and old[start] == new[start]:
+            start += 1
+        end = len(new)
+        while end > start and end <= len(old) and old[end - 1] == new[end - 1]:
+            end -= 1
+        return [_move_to(row, start + 1), new[start:end]]
+
+    def close(self) -> None:
+        """Restores the cursor below the last frame."""
+        if self._rows:
+            self.stream.write(_move_to(len(self._rows) + 1, 1) + _SHOW_CURSOR + "\n")
+            self.stream.flush()
@@ -1,18 +1,42 @@
 import sqlite3
+import time
+import functools
 from threading import Lock
 from enums import Direction, DoorState # Assuming these are needed for state representation
+from metrics import MetricsRegistry, REGISTRY
 import logging
 
+logger = logging.getLogger(__name__)
+
+
+def _timed_write(operation: str):
+    """Decorator that records the latency of a DatabaseManager write in the DB write histogram.
+
+    Args:
+        operation (str): The operation label to record the latency under.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                self._db_write_latency.labels(operation).observe(time.perf_counter() - start)
+        return wrapper
+    return decorator
+
 class DatabaseManager:
     """Manages all database interactions for the elevator system, implemented as a Singleton."""
     _instance = None
     _lock = Lock()
 
-    def __new__(cls, db_path: str = 'elevator_state.db'):
+    def __new__(cls, db_path: str = 'elevator_state.db', metrics: MetricsRegistry = None):
         """Ensures only one instance of DatabaseManager exists (Singleton pattern).
 
         Args:
             db_path (str): The path to the SQLite database file.
+            metrics (MetricsRegistry, optional): The registry to record write latency in. Defaults to REGISTRY.
 
         Returns:
             DatabaseManager: The singleton instance of DatabaseManager.
@@ -23,17 +47,20 @@ class DatabaseManager:
                 instance.db_path = db_path
                 instance.conn = None
                 instance.cursor = None
+                instance._db_write_latency = (metrics if metrics else REGISTRY).histogram(
+                    "elevator_db_write_duration_seconds", "Latency of database writes.", ("operation",))
                 instance._connect()
                 instance._create_tables()
                 cls._instance = instance
             return cls._instance
 
-    def __init__(self, db_path: str = 'elevator_state.db') -> None:
+    def __init__(self, db_path: str = 'elevator_state.db', metrics: MetricsRegistry = None) -> None:
         """Initializes the DatabaseManager. This method is a no-op for subsequent calls
         after the first instance creation due to the Singleton pattern.
 
         Args:
             db_path (str): The path to the SQLite database file.
+            metrics (MetricsRegistry, optional): The registry to record write latency in. Defaults to REGISTRY.
         """
         # __init__ is called every time __new__ is called, but we only want to initialize once.
         # The actual initialization is now handled in __new__ to ensure it happens only once.
@@ -44,9 +71,9 @@ class DatabaseManager:
         try:
             self.conn = sqlite3.connect(self.db_path, check_same_thread=False) # Allow multi-thread access for simplicity in simulation
             self.cursor = self.conn.cursor()
-            logging.info(f"Connected to database: {self.db_path}")
+            logger.info("Connected to database: %s", self.db_path)
         except sqlite3.Error as e:
-            logging.error(f"Database connection error: {e}")
+            logger.error("Database connection error: %s", e)
 
     def _create_tables(self) -> None:
         """Creates the necessary tables in the database if they don't already exist."""
@@ -65,11 +92,16 @@ class DatabaseManager:
                     car_id INTEGER PRIMARY KEY,
                     current_floor INTEGER,
                     direction TEXT,
-                    current_state TEXT,
+                    current_state INTEGER,
                     door_state TEXT,
-                    door_open_time REAL
+                    door_open_time REAL,
+                    retiring INTEGER DEFAULT 0
                 )
             ''')
+            # Databases created before cars could be retired lack the retiring flag
+            self.cursor.execute("PRAGMA table_info(elevator_car_state)")
+            if "retiring" not in {row[1] for row in self.cursor.fetchall()}:
+                self.cursor.execute("ALTER TABLE elevator_car_state ADD COLUMN retiring INTEGER DEFAULT 0")
             # Elevator Car Requests (internal to car)
             self.cursor.execute('''
                 CREATE TABLE IF NOT EXISTS elevator_car_requests (
@@ -88,26 +120,76 @@ class DatabaseManager:
                     direction TEXT
                 )
             ''')
+            # Revision counter, bumped with every published tick so a hot standby can follow cheaply
+            self.cursor.execute('''
+                CREATE TABLE IF NOT EXISTS state_revision (
+                    id INTEGER PRIMARY KEY,
+                    revision INTEGER,
+                    updated_at REAL
+                )
+            ''')
             self.conn.commit()
-            logging.info("Database tables created/verified.")
+            logger.info("Database tables created/verified.")
         except sqlite3.Error as e:
-            logging.error(f"Error creating tables: {e}")
+            logger.error("Error creating tables: %s", e)
 
+    @_timed_write("commit")
     def commit(self) -> None:
         """Commits the current transaction to the database."""
         if self.conn:
             try:
                 self.conn.commit()
-                logging.debug("Database transaction committed.")
+                logger.debug("Database transaction committed.")
             except sqlite3.Error as e:
-                logging.error(f"Error committing transaction: {e}")
+                logger.error("Error committing transaction: %s", e)
+
+    def enable_wal(self) -> None:
+        """Switches the database to write-ahead logging, so a standby process can read while the primary writes."""
+        try:
+            self.cursor.execute("PRAGMA journal_mode=WAL")
+        except sqlite3.Error as e:
+            logger.error("Error enabling WAL mode: %s", e)
+
+    @_timed_write("publish_revision")
+    def publish_revision(self, timestamp: float) -> int:
+        """Bumps the state revision and commits, making everything saved since the last commit visible at once.
+
+        Args:
+            timestamp (float): The time of the published state.
+
+        Returns:
+            int: The new revision, or -1 if it could not be written.
+        """
+        try:
+            self.cursor.execute("INSERT INTO state_revision (id, revision, updated_at) VALUES (1, 1, ?) "
+                                "ON CONFLICT(id) DO UPDATE SET revision = revision + 1, updated_at = excluded.updated_at",
+                                (timestamp,))
+            self.conn.commit()
+            return self.load_revision()
+        except sqlite3.Error as e:
+            logger.error("Error publishing state revision: %s", e)
+            return -1
+
+    def load_revision(self) -> int:
+        """Loads the state revision last published by the primary controller.
+
+        Returns:
+            int: The revision, or 0 if none was published yet.
+        """
+        try:
+            self.cursor.execute("SELECT revision FROM state_revision WHERE id = 1")
+            row = self.cursor.fetchone()
+            return row[0] if row else 0
+        except sqlite3.Error as e:
+            logger.error("Error loading state revision: %s", e)
+            return 0
 
     def close(self) -> None:
         """Closes the database connection."""
         if self.conn:
             self.commit() # Commit any pending changes before closing
             self.conn.close()
-            logging.info(f"Disconnected from database: {self.db_path}")
+            logger.info("Disconnected from database: %s", self.db_path)
 
     def clear_all_data(self) -> None:
         """Clears all data from the elevator system tables. Useful for testing."""
@@ -116,12 +198,14 @@ class DatabaseManager:
             self.cursor.execute("DELETE FROM elevator_car_state")
             self.cursor.execute("DELETE FROM elevator_car_requests")
             self.cursor.execute("DELETE FROM system_requests")
+            self.cursor.execute("DELETE FROM state_revision")
             self.conn.commit()
-            logging.info("All database data cleared.")
+            logger.info("All database data cleared.")
         except sqlite3.Error as e:
-            logging.error(f"Error clearing database data: {e}")
+            logger.error("Error clearing database data: %s", e)
 
     # --- Save Methods ---
+    @_timed_write("save_system_state")
     def save_system_state(self, num_floors: int, num_cars: int) -> None:
         """Saves the overall elevator system configuration state.
 
@@ -133,25 +217,29 @@ class DatabaseManager:
             self.cursor.execute("INSERT OR REPLACE INTO elevator_system_state (id, num_floors, num_cars) VALUES (?, ?, ?)",
                                 (1, num_floors, num_cars))
         except sqlite3.Error as e:
-            logging.error(f"Error saving system state: {e}")
+            logger.error("Error saving system state: %s", e)
 
-    def save_car_state(self, car_id: int, current_floor: int, direction: Direction, current_state: str, door_state: DoorState, door_open_time: float) -> None:
+    @_timed_write("save_car_state")
+    def save_car_state(self, car_id: int, current_floor: int, direction: Direction, current_state: int, door_state: DoorState, door_open_time: float,
+                       retiring: bool = False) -> None:
         """Saves the state of a specific elevator car.
 
         Args:
             car_id (int): The ID of the elevator car.
             current_floor (int): The current floor of the car.
             direction (Direction): The current direction of the car.
-            current_state (str): The current operational state of the car (e.g., "IdleState").
+            current_state (int): The integer code of the car's operational state (e.g., IdleState.code).
             door_state (DoorState): The current state of the car's door.
             door_open_time (float): The timestamp when the door was opened.
+            retiring (bool, optional): The car is draining before leaving the fleet. Defaults to False.
         """
         try:
-            self.cursor.execute("INSERT OR REPLACE INTO elevator_car_state (car_id, current_floor, direction, current_state, door_state, door_open_time) VALUES (?, ?, ?, ?, ?, ?)",
-                                (car_id, current_floor, direction.name, current_state, door_state.name, door_open_time))
+            self.cursor.execute("INSERT OR REPLACE INTO elevator_car_state (car_id, current_floor, direction, current_state, door_state, door_open_time, retiring) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                                (car_id, current_floor, direction.name, current_state, door_state.name, door_open_time, int(retiring)))
         except sqlite3.Error as e:
-            logging.error(f"Error saving car state for car {car_id}: {e}")
+            logger.error("Error saving car state for car %s: %s", car_id, e)
 
+    @_timed_write("save_car_requests")
     def save_car_requests(self, car_id: int, requests: list[tuple[int, Direction]]) -> None:
         """Saves the internal requests (car calls) for a specific elevator car.
 
@@ -165,8 +253,9 @@ class DatabaseManager:
                 self.cursor.execute("INSERT INTO elevator_car_requests (car_id, floor, direction) VALUES (?, ?, ?)",
                                     (car_id, req_floor, req_direction.name))
         except sqlite3.Error as e:
-            logging.error(f"Error saving car requests for car {car_id}: {e}")
+            logger.error("Error saving car requests for car %s: %s", car_id, e)
 
+    @_timed_write("save_system_requests")
     def save_system_requests(self, requests: list[tuple[int, Direction]]) -> None:
         """Saves the system-wide hall call requests.
 
@@ -179,7 +268,20 @@ class DatabaseManager:
                 self.cursor.execute("INSERT INTO system_requests (floor, direction) VALUES (?, ?)",
                                     (req_floor, req_direction.name))
         except sqlite3.Error as e:
-            logging.error(f"Error saving system requests: {e}")
+            logger.error("Error saving system requests: %s", e)
+
+    @_timed_write("delete_car")
+    def delete_car(self, car_id: int) -> None:
+        """Deletes a retired car's state and requests.
+
+        Args:
+            car_id (int): The ID of the elevator car.
+        """
+        try:
+            self.cursor.execute("DELETE FROM elevator_car_requests WHERE car_id = ?", (car_id,))
+            self.cursor.execute("DELETE FROM elevator_car_state WHERE car_id = ?", (car_id,))
+        except sqlite3.Error as e:
+            logger.error("Error deleting car %s: %s", car_id, e)
 
     # --- Load Methods ---
     def load_system_state(self) -> dict | None:
@@ -195,9 +297,22 @@ class DatabaseManager:
                 return {"num_floors": row[0], "num_cars": row[1]}
             return None
         except sqlite3.Error as e:
-            logging.error(f"Error loading system state: {e}")
+            logger.error("Error loading system state: %s", e)
             return None
 
+    def load_car_ids(self) -> list[int]:
+        """Loads the IDs of the cars whose state has been saved.
+
+        Returns:
+            list[int]: The car IDs in ascending order.
+        """
+        try:
+            self.cursor.execute("SELECT car_id FROM elevator_car_state ORDER BY car_id")
+            return [row[0] for row in self.cursor.fetchall()]
+        except sqlite3.Error as e:
+            logger.error("Error loading car IDs: %s", e)
+            return []
+
     def load_car_state(self, car_id: int) -> dict | None:
         """Loads the state of a specific elevator car.
 
@@ -208,7 +323,7 @@ class DatabaseManager:
             dict | None: A dictionary containing the car's state, or None if not found.
         """
         try:
-            self.cursor.execute("SELECT car_id, current_floor, direction, current_state, door_state, door_open_time FROM elevator_car_state WHERE car_id = ?", (car_id,))
+            self.cursor.execute("SELECT car_id, current_floor, direction, current_state, door_state, door_open_time, retiring FROM elevator_car_state WHERE car_id = ?", (car_id,))
             row = self.cursor.fetchone()
             if row:
                 return {
@@ -217,11 +332,12 @@ class DatabaseManager:
                     "direction": Direction[row[2]],
                     "current_state": row[3],
                     "door_state": DoorState[row[4]],
-                    "door_open_time": row[5]
+                    "door_open_time": row[5],
+                    "retiring": bool(row[6])
                 }
             return None
         except sqlite3.Error as e:
-            logging.error(f"Error loading car state for car {car_id}: {e}")
+            logger.error("Error loading car state for car %s: %s", car_id, e)
             return None
 
     def load_car_requests(self, car_id: int) -> list[tuple[int, Direction]]:
@@ -241,7 +357,7 @@ class DatabaseManager:
                 requests.append((row[0], Direction[row[1]]))
             return requests
         except sqlite3.Error as e:
-            logging.error(f"Error loading car requests for car {car_id}: {e}")
+            logger.error("Error loading car requests for car %s: %s", car_id, e)
             return []
 
     def load_system_requests(self) -> list[tuple[int, Direction]]:
@@ -258,5 +374,5 @@ class DatabaseManager:
                 requests.append((row[0], Direction[row[1]]))
             return requests
         except sqlite3.Error as e:
-            logging.error(f"Error loading system requests: {e}")
+            logger.error("Error loading system requests: %s", e)
             return []
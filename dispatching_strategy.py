@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from enums import Direction
+from config import LOAD_PENALTY_FLOORS
 
 class DispatchingStrategy(ABC):
     """Abstract base class for elevator dispatching strategies."""
@@ -18,7 +19,19 @@ class DispatchingStrategy(ABC):
         pass
 
 class ClosestCarStrategy(DispatchingStrategy):
-    """A dispatching strategy that assigns the closest suitable elevator car to a request."""
+    """A dispatching strategy that assigns the closest suitable elevator car to a request.
+
+    Full cars are never assigned hall calls, and fuller cars look farther away than they are.
+    """
+    def __init__(self, load_penalty: float = LOAD_PENALTY_FLOORS) -> None:
+        """Initializes a ClosestCarStrategy.
+
+        Args:
+            load_penalty (float, optional): Floors of extra distance charged to a car at full load, scaled
+                                            by its load factor. Defaults to config.LOAD_PENALTY_FLOORS.
+        """
+        self.load_penalty = load_penalty
+
     def find_best_car(self, cars: list, floor: int, direction: Direction) -> object | None:
         """Finds the closest suitable elevator car to serve a given request.
 
@@ -54,11 +67,14 @@ class ClosestCarStrategy(DispatchingStrategy):
                                 is_suitable is True if the car can serve the request, False otherwise.
                                 distance is the calculated cost/distance, or float('inf') if not suitable.
         """
+        if car.is_full():
+            return False, float('inf') # Nobody could board
         car_current_floor = car.get_current_floor()
         car_direction = car.get_direction()
-        
+        load_penalty = self.load_penalty * car.get_load_factor()
+
         if car.is_idle():
-            return True, abs(car_current_floor - requested_floor) + 0.1 # Small penalty for idle cars
+            return True, abs(car_current_floor - requested_floor) + 0.1 + load_penalty # Small penalty for idle cars
         
         if car_direction == requested_direction:
             if requested_direction == Direction.UP:
@@ -67,14 +83,14 @@ class ClosestCarStrategy(DispatchingStrategy):
                     if requested_floor in car.get_up_requests() or \
                        (not car.get_up_requests() and car_current_floor <= requested_floor) or \
                        (car.get_up_requests() and requested_floor <= max(car.get_up_requests())):
-                        return True, abs(car_current_floor - requested_floor)
+                        return True, abs(car_current_floor - requested_floor) + load_penalty
             elif requested_direction == Direction.DOWN:
                 if car_current_floor >= requested_floor:
                     # Check if request is on the way or already in requests
                     if requested_floor in car.get_down_requests() or \
                        (not car.get_down_requests() and car_current_floor >= requested_floor) or \
                        (car.get_down_requests() and requested_floor >= min(car.get_down_requests())):
-                        return True, abs(car_current_floor - requested_floor)
+                        return True, abs(car_current_floor - requested_floor) + load_penalty
         
         return False, float('inf') # Not suitable
 
@@ -3,6 +3,8 @@ from enums import Direction
 
 class Display:
     """Represents the display panel inside an elevator car, showing current floor, direction, and state."""
+    __slots__ = ("floor", "direction", "state", "dirty")
+
     def __init__(self) -> None:
         """Initializes a new Display instance.
 
@@ -14,18 +16,38 @@ class Display:
         self.floor = 0
         self.direction = Direction.STOP
         self.state = None  # Will be set by ElevatorCar's initial update
+        self.dirty = True # Changed since a renderer last drew it
 
-    def update(self, floor: int, direction: Direction, state: object) -> None:
-        """Updates the display with new elevator information.
+    def update(self, floor: int, direction: Direction, state: object) -> bool:
+        """Updates the display with new elevator information, marking it dirty if anything changed.
 
         Args:
             floor (int): The new current floor number.
             direction (Direction): The new direction.
             state (object): The current state object of the elevator car. Its class name will be used for display.
+
+        Returns:
+            bool: True if any of the values changed.
         """
+        if floor == self.floor and direction is self.direction and state is self.state:
+            return False
         self.floor = floor
         self.direction = direction
         self.state = state # Store the actual state object
+        self.dirty = True
+        return True
+
+    def is_dirty(self) -> bool:
+        """Checks whether the display changed since it was last marked clean.
+
+        Returns:
+            bool: True if a renderer needs to redraw it.
+        """
+        return self.dirty
+
+    def mark_clean(self) -> None:
+        """Marks the display as drawn."""
+        self.dirty = False
 
     def show_elevator_display(self, car_id: int) -> None:
         """Prints the current display information to the console.
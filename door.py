@@ -2,6 +2,8 @@ from enums import DoorState
 
 class Door:
     """Represents an elevator door, managing its open and closed states."""
+    __slots__ = ("state",)
+
     def __init__(self) -> None:
         """Initializes a new Door instance with its state set to CLOSED."""
         self.state = DoorState.CLOSED
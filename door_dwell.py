@@ -0,0 +1,79 @@
+import time
+from abc import ABC, abstractmethod
+
+
+class DwellPolicy(ABC):
+    """Abstract base class for deciding how long a car's door stays open at a stop."""
+    min_dwell = 0.0 # The shortest dwell the close button can cut a stop down to
+
+    @abstractmethod
+    def dwell_time(self, floor: int, car_call: bool, hall_call: bool, now: float) -> float:
+        """Returns the dwell time for a stop.
+
+        Args:
+            floor (int): The floor of the stop.
+            car_call (bool): Someone aboard asked to get out here.
+            hall_call (bool): Someone on the floor is waiting to board.
+            now (float): The time the door opens.
+
+        Returns:
+            float: Seconds the door stays open.
+        """
+        pass
+
+
+class FixedDwellPolicy(DwellPolicy):
+    """The same dwell at every stop."""
+    def __init__(self, duration: float) -> None:
+        """Initializes a FixedDwellPolicy.
+
+        Args:
+            duration (float): Seconds the door stays open at every stop.
+        """
+        self.duration = duration
+
+    def dwell_time(self, floor: int, car_call: bool, hall_call: bool, now: float) -> float:
+        """Returns the fixed dwell time."""
+        return self.duration
+
+
+class AdaptiveDwellPolicy(DwellPolicy):
+    """Dwell sized to the stop: short for drop-offs, longer for pickups and longest at the lobby in peaks."""
+    def __init__(self, car_call_dwell: float = 1.0, hall_call_dwell: float = 2.0, lobby_peak_dwell: float = 4.0,
+                 lobby_floor: int = 0, peak_hours: tuple = ((7, 10), (16, 19)), min_dwell: float = 0.5) -> None:
+        """Initializes an AdaptiveDwellPolicy.
+
+        Args:
+            car_call_dwell (float, optional): Dwell when passengers only get out. Defaults to 1.0.
+            hall_call_dwell (float, optional): Dwell when passengers board. Defaults to 2.0.
+            lobby_peak_dwell (float, optional): Dwell at the lobby during peak hours. Defaults to 4.0.
+            lobby_floor (int, optional): The lobby floor. Defaults to 0.
+            peak_hours (tuple, optional): (start, end) local hours of the peaks, end exclusive. Defaults to 7-10 and 16-19.
+            min_dwell (float, optional): The shortest dwell the close button can cut a stop down to. Defaults to 0.5.
+        """
+        self.car_call_dwell = car_call_dwell
+        self.hall_call_dwell = hall_call_dwell
+        self.lobby_peak_dwell = lobby_peak_dwell
+        self.lobby_floor = lobby_floor
+        self.peak_hours = peak_hours
+        self.min_dwell = min_dwell
+
+    def is_peak(self, now: float) -> bool:
+        """Checks whether a time falls in one of the peak periods.
+
+        Args:
+            now (float): Seconds since the epoch.
+
+        Returns:
+            bool: True during a peak.
+        """
+        hour = time.localtime(now).tm_hour
+        return any(start <= hour < end for start, end in self.peak_hours)
+
+    def dwell_time(self, floor: int, car_call: bool, hall_call: bool, now: float) -> float:
+        """Returns the dwell time for a stop."""
+        if floor == self.lobby_floor and self.is_peak(now):
+            return self.lobby_peak_dwell
+        if car_call and not hall_call:
+            return self.car_call_dwell
+        return self.hall_call_dwell
@@ -1,18 +1,45 @@
 from enums import Direction, DoorState
 from door import Door
-from elevator_panel import ElevatorPanel
+from elevator_panel import ElevatorPanel, HallCallBoard
 from display import Display
-from elevator_state import IdleState, MaintenanceState, MovingUpState, MovingDownState
+from elevator_state import IdleState, MaintenanceState, MovingUpState, MovingDownState, IDLE, MAINTENANCE
 from elevator_state_factory import ElevatorStateFactory # Import ElevatorStateFactory
 import time
 from time_provider import TimeProvider
 from observer import Subject
 from database_manager import DatabaseManager # Import DatabaseManager
+from metrics import MetricsRegistry, REGISTRY
+from motion_model import KinematicMotion
+from event_bus import EventBus, RequestFulfilled
+from flight_recorder import FlightRecorder
+from door_dwell import DwellPolicy, FixedDwellPolicy
+from car_scheduler import CarScheduler, LookScheduler
+from config import DEBUG_VALIDATE_COMMANDS, CAR_CAPACITY
 import logging
 from commands import Command # Import Command
 
+logger = logging.getLogger(__name__)
+
+# Commands each entry point may execute; only checked when command validation is enabled
+_MOVE_COMMANDS = frozenset({
+    Command.SET_DIRECTION, Command.SET_STATE, Command.INCREMENT_FLOOR, Command.DECREMENT_FLOOR,
+    Command.OPEN_DOOR_AND_NOTIFY, Command.REMOVE_UP_REQUEST, Command.REMOVE_DOWN_REQUEST, Command.TRAVEL_TO,
+})
+_REGISTER_REQUEST_COMMANDS = frozenset({
+    Command.ADD_UP_REQUEST, Command.ADD_DOWN_REQUEST, Command.OPEN_DOOR_AND_NOTIFY,
+})
+
 class ElevatorCar(Subject):
     """Represents an individual elevator car in the system."""
+    __slots__ = (
+        "car_id", "num_floors", "door_open_duration", "time_provider", "door", "panel", "display",
+        "_observers", "database_manager", "validate_commands", "_move_commands", "_request_commands",
+        "_command_handlers", "_door_cycles", "_stops", "_floor_gauge", "motion", "event_bus", "recorder",
+        "capacity", "load", "_boarded", "_alighted", "dwell_policy", "hall_calls", "door_dwell", "scheduler",
+        "_stop_plan", "current_floor", "direction", "state", "door_open_time", "up_requests", "down_requests",
+        "retiring",
+    )
+
     def __init__(self,
                  car_id: int,
                  num_floors: int,
@@ -21,7 +48,16 @@ class ElevatorCar(Subject):
                  door: Door,
                  panel: ElevatorPanel,
                  display: Display,
-                 database_manager: DatabaseManager) -> None:
+                 database_manager: DatabaseManager,
+                 metrics: MetricsRegistry = None,
+                 validate_commands: bool = DEBUG_VALIDATE_COMMANDS,
+                 motion: KinematicMotion = None,
+                 event_bus: EventBus = None,
+                 recorder: FlightRecorder = None,
+                 capacity: int = CAR_CAPACITY,
+                 dwell_policy: DwellPolicy = None,
+                 hall_calls: HallCallBoard = None,
+                 scheduler: CarScheduler = None) -> None:
         """Initializes a new ElevatorCar instance.
 
         Args:
@@ -33,7 +69,26 @@ class ElevatorCar(Subject):
             panel (ElevatorPanel): The control panel inside the elevator car.
             display (Display): The display unit inside the elevator car.
             database_manager (DatabaseManager): Manager for database operations.
+            metrics (MetricsRegistry, optional): The registry to record car metrics in. Defaults to REGISTRY.
+            validate_commands (bool, optional): Check every command a state emits and log unknown ones.
+                                                Defaults to config.DEBUG_VALIDATE_COMMANDS.
+            motion (KinematicMotion, optional): Continuous motion model. When set, move(dt) travels any distance
+                                                per call instead of exactly one floor. Defaults to None.
+            event_bus (EventBus, optional): Bus to publish RequestFulfilled events on instead of notifying
+                                            observers synchronously. Defaults to None.
+            recorder (FlightRecorder, optional): Flight recorder that logs every executed command. Defaults to None.
+            capacity (int, optional): The most passengers the car carries. Defaults to config.CAR_CAPACITY.
+            dwell_policy (DwellPolicy, optional): Decides how long the door stays open at each stop.
+                                                  Defaults to door_open_duration at every stop.
+            hall_calls (HallCallBoard, optional): The building's hall buttons, used to tell pickups from drop-offs.
+                                                  Defaults to None (stops without a car call count as pickups).
+            scheduler (CarScheduler, optional): Orders the car's stops. Defaults to LOOK.
+
+        Raises:
+            ValueError: If capacity is not positive.
         """
+        if capacity <= 0:
+            raise ValueError("Car capacity must be positive")
         self.car_id = car_id
         self.num_floors = num_floors
         self.door_open_duration = door_open_duration
@@ -42,48 +97,149 @@ class ElevatorCar(Subject):
         self.panel = panel
         self.display = display
         self._observers = []
+        self.event_bus = event_bus
+        self.recorder = recorder
         self.database_manager = database_manager
+        self.validate_commands = validate_commands
+        # Reusable command buffers (one per entry point, so register_request can run while move executes)
+        self._move_commands = []
+        self._request_commands = []
+        self._command_handlers = self._build_command_handlers()
+
+        metrics = metrics if metrics else REGISTRY
+        self._door_cycles = metrics.counter("elevator_door_cycles", "Completed door open/close cycles.", ("car",)).labels(str(car_id))
+        self._stops = metrics.counter("elevator_car_stops", "Stops made with the door opened.", ("car",)).labels(str(car_id))
+        self._floor_gauge = metrics.gauge("elevator_car_floor", "Current floor of the car.", ("car",)).labels(str(car_id))
+        self._boarded = metrics.counter("elevator_passengers_boarded", "Passengers who boarded the car.", ("car",)).labels(str(car_id))
+        self._alighted = metrics.counter("elevator_passengers_alighted", "Passengers who left the car.", ("car",)).labels(str(car_id))
+        self.capacity = capacity
+        self.load = 0 # Passengers aboard, as reported by the load sensor at each stop
+        self.dwell_policy = dwell_policy if dwell_policy else FixedDwellPolicy(door_open_duration)
+        self.hall_calls = hall_calls
+        self.door_dwell = door_open_duration # Dwell of the current stop, set when the door opens
+        self.scheduler = scheduler if scheduler else LookScheduler()
+        self._stop_plan = None # Cached scheduler output; None until planned or after the stops change
 
         # Load state from DB or initialize
+        self.motion = motion
         loaded_car_state = self.database_manager.load_car_state(self.car_id)
+        loaded_requests = self.database_manager.load_car_requests(self.car_id)
+        self.current_floor = 0
+        self.direction = Direction.STOP
+        self.state = IDLE
+        self.door_open_time = 0
+        self.up_requests = []
+        self.down_requests = []
+        self.retiring = False # Draining its car calls before leaving the fleet; set by ElevatorSystem.retire_car()
+        self.apply_persisted_state(loaded_car_state, loaded_requests)
         if loaded_car_state:
-            self.current_floor = loaded_car_state["current_floor"]
-            self.direction = loaded_car_state["direction"]
-            # Re-instantiate state object using the factory
-            state_str = loaded_car_state["current_state"]
-            self.state = ElevatorStateFactory.create_state(state_str, self)
-            self.door.state = loaded_car_state["door_state"]
-            self.door_open_time = loaded_car_state["door_open_time"]
-            logging.info(f"Loaded car {self.car_id} state: Floor {self.current_floor}, Dir {self.direction.name}, State {state_str}")
+            logger.info("Loaded car %s state: Floor %s, Dir %s, State %s", self.car_id, self.current_floor, self.direction.name, type(self.state).__name__)
         else:
-            self.current_floor = 0
-            self.direction = Direction.STOP
-            self.up_requests = []
-            self.down_requests = []
-            self.state = IdleState(self)
-            self.door_open_time = 0
-            logging.info(f"Initialized new car {self.car_id} state.")
-        
-        # Load requests from DB
-        loaded_requests = self.database_manager.load_car_requests(self.car_id)
-        self.up_requests = [req[0] for req in loaded_requests if req[1] == Direction.UP]
-        self.down_requests = [req[0] for req in loaded_requests if req[1] == Direction.DOWN]
-        self.up_requests.sort()
-        self.down_requests.sort(reverse=True)
+            logger.info("Initialized new car %s state.", self.car_id)
         if loaded_requests:
-            logging.info(f"Loaded car {self.car_id} requests: Up - {self.up_requests}, Down - {self.down_requests}")
+            logger.info("Loaded car %s requests: Up - %s, Down - %s", self.car_id, self.up_requests, self.down_requests)
 
         # Initial state will be saved by a higher-level orchestrator
 
+    def _build_command_handlers(self) -> list:
+        """Builds the dispatch table mapping each Command opcode to the bound method that executes it.
+
+        Returns:
+            list: Handlers indexed by Command value.
+        """
+        handlers = [None] * len(Command)
+        handlers[Command.SET_DIRECTION] = self.set_direction
+        handlers[Command.SET_STATE] = self.set_state
+        handlers[Command.INCREMENT_FLOOR] = self.increment_floor
+        handlers[Command.DECREMENT_FLOOR] = self.decrement_floor
+        handlers[Command.ADD_UP_REQUEST] = self.add_up_request
+        handlers[Command.ADD_DOWN_REQUEST] = self.add_down_request
+        handlers[Command.REMOVE_UP_REQUEST] = self.remove_up_request
+        handlers[Command.REMOVE_DOWN_REQUEST] = self.remove_down_request
+        handlers[Command.OPEN_DOOR_AND_NOTIFY] = self.open_door_and_notify
+        handlers[Command.TRAVEL_TO] = self.travel_to
+        return handlers
+
+    def _execute_commands(self, commands: list) -> None:
+        """Executes the flat (command, argument) pairs in a command buffer.
+
+        Args:
+            commands (list): The buffer filled by the current state.
+        """
+        handlers = self._command_handlers
+        recorder = self.recorder
+        for i in range(0, len(commands), 2):
+            command = commands[i]
+            arg = commands[i + 1]
+            if recorder is not None:
+                recorder.record_command(self.car_id, command, arg)
+            if arg is None:
+                handlers[command]()
+            else:
+                handlers[command](arg)
+
+    def _execute_validated_commands(self, commands: list, allowed: frozenset, context: str) -> None:
+        """Executes a command buffer, skipping and logging commands not allowed in this context.
+
+        Args:
+            commands (list): The buffer filled by the current state.
+            allowed (frozenset): The commands valid for this entry point.
+            context (str): The entry point name, for the log message.
+        """
+        valid_commands = []
+        for i in range(0, len(commands), 2):
+            command = commands[i]
+            if command in allowed:
+                valid_commands.append(command)
+                valid_commands.append(commands[i + 1])
+            else:
+                logger.warning("Unknown command received in %s: %s", context, command)
+        self._execute_commands(valid_commands)
+
+    def apply_persisted_state(self, car_state: dict | None, requests: list[tuple[int, Direction]]) -> bool:
+        """Overwrites the car with a persisted state, as loaded by DatabaseManager.
+
+        Used at construction and by a hot standby following another controller's saves. A trip in
+        flight is not persisted, so a kinematic car is placed at rest on the persisted floor.
+
+        Args:
+            car_state (dict | None): The result of load_car_state(), or None to keep the current state.
+            requests (list[tuple[int, Direction]]): The result of load_car_requests().
+
+        Returns:
+            bool: True if anything changed.
+        """
+        before = self._persisted_fields()
+        if car_state:
+            self.current_floor = car_state["current_floor"]
+            self.direction = car_state["direction"]
+            # Re-instantiate state object using the factory
+            self.state = ElevatorStateFactory.create_state(car_state["current_state"])
+            self.door.state = car_state["door_state"]
+            self.door_open_time = car_state["door_open_time"]
+            self.retiring = car_state.get("retiring", False)
+        self.up_requests = sorted(floor for floor, direction in requests if direction == Direction.UP)
+        self.down_requests = sorted((floor for floor, direction in requests if direction == Direction.DOWN), reverse=True)
+        self._stop_plan = None
+        if self.motion is not None:
+            self.motion.stop_at(self.current_floor) # Trips in flight are not persisted; resume from rest
+        return self._persisted_fields() != before
+
+    def _persisted_fields(self) -> tuple:
+        """Returns the fields save_state() writes, for change detection."""
+        return (self.current_floor, self.direction, self.state, self.door.get_state(), self.door_open_time,
+                self.up_requests, self.down_requests, self.retiring)
+
     def save_state(self) -> None:
         """Saves the current state and requests of the elevator car to the database."""
         self.database_manager.save_car_state(
             self.car_id,
             self.current_floor,
             self.direction,
-            self.state.__class__.__name__,
+            self.state.code,
             self.door.get_state(),
-            self.door_open_time
+            self.door_open_time,
+            self.retiring
         )
         all_car_requests = []
         for floor in self.up_requests:
@@ -93,9 +249,43 @@ class ElevatorCar(Subject):
         self.database_manager.save_car_requests(self.car_id, all_car_requests)
 
     def _open_door_at_current_floor(self) -> None:
-        """Opens the door and records the time."""
+        """Opens (or holds open) the door, sizes this stop's dwell and clears the car's button for this floor.
+
+        Opening an already open door restarts its dwell, which is how a new call at the floor extends the stop.
+        """
+        floor = self.current_floor
+        now = self.time_provider.get_time()
+        car_call = bool(self.panel.is_floor_button_pressed(floor))
+        if self.hall_calls is not None:
+            hall_call = self.hall_calls.is_pressed(floor, Direction.UP) or self.hall_calls.is_pressed(floor, Direction.DOWN)
+        else:
+            hall_call = not car_call
+        self.door_dwell = self.dwell_policy.dwell_time(floor, car_call, hall_call, now)
+        if self.door.get_state() != DoorState.OPEN:
+            self._stops.inc()
         self.door.open()
-        self.door_open_time = self.time_provider.get_time()
+        self.panel.clear_floor_button(floor)
+        self.door_open_time = now
+
+    def press_close_button(self) -> None:
+        """Handles the door close button: the current stop ends once the policy's minimum dwell has passed."""
+        self.panel.press_close_button()
+        if self.door.get_state() == DoorState.OPEN:
+            elapsed = self.time_provider.get_time() - self.door_open_time
+            self.door_dwell = min(self.door_dwell, max(self.dwell_policy.min_dwell, elapsed))
+
+    def is_serving_floor(self, floor: int, direction: Direction) -> bool:
+        """Checks whether the car stands at a floor with its door open, ready to take passengers going a direction.
+
+        Args:
+            floor (int): The floor number.
+            direction (Direction): The direction the passengers want to go.
+
+        Returns:
+            bool: True if a hall call there could board this car right now.
+        """
+        return (self.current_floor == floor and self.door.get_state() == DoorState.OPEN
+                and self.direction in (direction, Direction.STOP) and self.load < self.capacity)
 
     def get_id(self) -> int:
         """Gets the ID of the elevator car.
@@ -127,7 +317,7 @@ class ElevatorCar(Subject):
         Returns:
             bool: True if the car is idle, False otherwise.
         """
-        return isinstance(self.state, IdleState)
+        return self.state.code == IdleState.code
 
     def get_direction(self) -> Direction:
         """Gets the current direction of the elevator car.
@@ -177,6 +367,118 @@ class ElevatorCar(Subject):
         """Decrements the current floor of the elevator car."""
         self.current_floor -= 1
 
+    def travel_to(self, floor: int) -> None:
+        """Starts or retargets a continuous trip to a floor (kinematic mode only).
+
+        Args:
+            floor (int): The target floor.
+        """
+        self.motion.travel_to(floor)
+
+    def can_stop_at(self, floor: int) -> bool:
+        """Checks whether the car can still stop at a floor. Always True without a kinematic motion model.
+
+        Args:
+            floor (int): The floor number.
+
+        Returns:
+            bool: False if a moving car has passed the floor or its braking point.
+        """
+        return self.motion is None or self.motion.can_stop_at(floor)
+
+    def update_load(self, boarded: int, alighted: int) -> int:
+        """Records the passengers who boarded and left the car at a stop.
+
+        Args:
+            boarded (int): The number of passengers who got in.
+            alighted (int): The number of passengers who got out.
+
+        Returns:
+            int: The new load, clamped to [0, capacity].
+
+        Raises:
+            ValueError: If either count is negative.
+        """
+        if boarded < 0 or alighted < 0:
+            raise ValueError("Boarding and alighting counts must not be negative")
+        self.load = min(self.capacity, max(0, self.load + boarded - alighted))
+        self._boarded.inc(boarded)
+        self._alighted.inc(alighted)
+        return self.load
+
+    def is_full(self) -> bool:
+        """Checks whether nobody else can board.
+
+        Returns:
+            bool: True if the load has reached the capacity.
+        """
+        return self.load >= self.capacity
+
+    def get_load_factor(self) -> float:
+        """Gets the fraction of the capacity in use.
+
+        Returns:
+            float: The load divided by the capacity, from 0.0 to 1.0.
+        """
+        return self.load / self.capacity
+
+    def skips_stop(self, floor: int) -> bool:
+        """Checks whether the car should pass a requested floor without opening: it is full and nobody aboard
+        wants to get out there, so the stop can only be a hall call that no one could board.
+
+        Args:
+            floor (int): The floor number.
+
+        Returns:
+            bool: True if the stop would be wasted.
+        """
+        return self.load >= self.capacity and not self.panel.is_floor_button_pressed(floor)
+
+    def get_arrival_time(self) -> float:
+        """Gets the time at which the car will come to rest at its current target floor.
+
+        Returns:
+            float: The arrival time per the car's time provider; now if the car is at rest or not kinematic.
+        """
+        now = self.time_provider.get_time()
+        return now if self.motion is None else now + self.motion.time_to_arrival()
+
+    def get_stop_plan(self) -> tuple[int, ...]:
+        """Gets the order in which the car will serve its pending stops.
+
+        The plan is computed by the car's scheduler when first needed after the stops change, and
+        cached until they change again.
+
+        Returns:
+            tuple[int, ...]: The pending stops in service order; empty if there are none.
+        """
+        plan = self._stop_plan
+        if plan is None:
+            plan = self._stop_plan = self.scheduler.plan(self)
+        return plan
+
+    def next_stop(self) -> int | None:
+        """Gets the next stop of the car's plan.
+
+        Returns:
+            int | None: The floor the car is heading for, or None if it has no stops.
+        """
+        plan = self.get_stop_plan()
+        return plan[0] if plan else None
+
+    def set_scheduler(self, scheduler: CarScheduler) -> None:
+        """Replaces the car's scheduler; its stops are replanned at the next move.
+
+        Args:
+            scheduler (CarScheduler): The new scheduler.
+        """
+        self.scheduler = scheduler
+        self._stop_plan = None
+
+    def invalidate_stop_plan(self) -> None:
+        """Forces a replan after the request lists were edited directly."""
+        self._stop_plan = None
+
     def add_up_request(self, floor: int) -> None:
         """Adds an up request to the elevator car's requests.
 
@@ -186,6 +488,7 @@ class ElevatorCar(Subject):
         if floor not in self.up_requests:
             self.up_requests.append(floor)
             self.up_requests.sort()
+            self._stop_plan = None
 
     def add_down_request(self, floor: int) -> None:
         """Adds a down request to the elevator car's requests.
@@ -196,6 +499,7 @@ class ElevatorCar(Subject):
         if floor not in self.down_requests:
             self.down_requests.append(floor)
             self.down_requests.sort(reverse=True)
+            self._stop_plan = None
 
     def remove_up_request(self, floor: int) -> None:
         """Removes an up request from the elevator car's requests.
@@ -205,6 +509,7 @@ class ElevatorCar(Subject):
         """
         if floor in self.up_requests:
             self.up_requests.remove(floor)
+            self._stop_plan = None
 
     def remove_down_request(self, floor: int) -> None:
         """Removes a down request from the elevator car's requests.
@@ -214,11 +519,19 @@ class ElevatorCar(Subject):
         """
         if floor in self.down_requests:
             self.down_requests.remove(floor)
+            self._stop_plan = None
 
     def open_door_and_notify(self) -> None:
-        """Opens the door, records the time, and notifies observers that a request was fulfilled."""
+        """Opens the door, records the time, and announces that a request was fulfilled.
+
+        With an event bus the announcement is a RequestFulfilled event delivered at the next flush;
+        otherwise observers are notified synchronously.
+        """
         self._open_door_at_current_floor()
-        self.notify("request_fulfilled", {"floor": self.current_floor})
+        if self.event_bus is not None:
+            self.event_bus.publish(RequestFulfilled(self.car_id, self.current_floor, self.door_open_time))
+        else:
+            self.notify("request_fulfilled", {"floor": self.current_floor})
 
     def register_request(self, floor: int) -> None:
         """Registers a new request for the elevator car.
@@ -226,50 +539,66 @@ class ElevatorCar(Subject):
         Args:
             floor (int): The floor number to register as a request.
         """
-        commands = self.state.register_request(floor)
-        command_map = {
-            Command.ADD_UP_REQUEST: self.add_up_request,
-            Command.ADD_DOWN_REQUEST: self.add_down_request,
-            Command.OPEN_DOOR_AND_NOTIFY: self.open_door_and_notify,
-        }
-        for command, *args in commands:
-            if command in command_map:
-                command_map[command](*args)
-            else:
-                logging.warning(f"Unknown command received in register_request: {command}")
+        commands = self._request_commands
+        commands.clear()
+        self.state.register_request(self, floor, commands)
+        if self.validate_commands:
+            self._execute_validated_commands(commands, _REGISTER_REQUEST_COMMANDS, "register_request")
+        else:
+            self._execute_commands(commands)
         # State will be saved by a higher-level orchestrator
 
-    def move(self) -> None:
+    def _run_state_move(self) -> None:
+        """Lets the current state fill the move command buffer, then executes it."""
+        commands = self._move_commands
+        commands.clear()
+        self.state.move(self, commands)
+        if self.validate_commands:
+            self._execute_validated_commands(commands, _MOVE_COMMANDS, "move")
+        else:
+            self._execute_commands(commands)
+
+    def move(self, dt: float = None) -> None:
         """Executes one step of the elevator car's movement logic.
         Handles door operations and delegates movement to the current state.
+
+        Without a motion model the car moves exactly one floor per call. With one, the car travels
+        continuously for dt seconds, passing any number of floors.
+
+        Args:
+            dt (float, optional): Seconds to advance a kinematic car by. Defaults to the time elapsed since its last move.
         """
+        now = self.time_provider.get_time()
         # If door is open and enough time has passed, close it
-        if self.door.get_state() == DoorState.OPEN and (self.time_provider.get_time() - self.door_open_time) > self.door_open_duration:
+        if self.door.get_state() == DoorState.OPEN and (now - self.door_open_time) > self.door_dwell:
             self.door.close()
+            self.panel.close_button.reset()
             self.door_open_time = 0
+            self._door_cycles.inc()
             # State will be saved by a higher-level orchestrator
 
+        motion = self.motion
+        if motion is not None:
+            if dt is None:
+                dt = 0.0 if motion.last_update is None else now - motion.last_update
+            motion.last_update = now
+
         # If door is closed, proceed with state-based movement
         if self.door.get_state() == DoorState.CLOSED:
-            commands = self.state.move()
-            command_map = {
-                Command.SET_DIRECTION: self.set_direction,
-                Command.SET_STATE: self.set_state,
-                Command.INCREMENT_FLOOR: self.increment_floor,
-                Command.DECREMENT_FLOOR: self.decrement_floor,
-                Command.OPEN_DOOR_AND_NOTIFY: self.open_door_and_notify,
-                Command.REMOVE_UP_REQUEST: self.remove_up_request,
-                Command.REMOVE_DOWN_REQUEST: self.remove_down_request,
-            }
-            for command, *args in commands:
-                if command in command_map:
-                    command_map[command](*args)
-                else:
-                    logging.warning(f"Unknown command received in move: {command}")
+            self._run_state_move()
+            if motion is not None and motion.is_moving():
+                motion.advance(dt)
+                self.current_floor = motion.floor_passed()
+                if not motion.is_moving():
+                    self._run_state_move() # Arrived during this step: let the state open the door
             # State will be saved by a higher-level orchestrator
 
-        # Update display after potential state/floor/direction change
-        self.display.update(self.current_floor, self.direction, self.state)
+        # Update display only after an actual state/floor/direction change, so idle cars stay clean
+        display = self.display
+        if (display.floor != self.current_floor or display.direction is not self.direction
+                or display.state is not self.state):
+            display.update(self.current_floor, self.direction, self.state)
+        self._floor_gauge.set(self.current_floor)
 
     def show_display(self) -> None:
         """Instructs the elevator's display to show its current information."""
@@ -277,12 +606,12 @@ class ElevatorCar(Subject):
 
     def enter_maintenance(self) -> None:
         """Sets the elevator car to maintenance mode."""
-        self.state = MaintenanceState(self)
+        self.state = MAINTENANCE
         # State will be saved by a higher-level orchestrator
 
     def exit_maintenance(self) -> None:
         """Exits maintenance mode and sets the elevator car to idle."""
-        self.state = IdleState(self)
+        self.state = IDLE
         # State will be saved by a higher-level orchestrator
 
     def attach(self, observer: object) -> None:
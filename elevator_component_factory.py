@@ -1,9 +1,13 @@
 from door import Door
-from elevator_panel import ElevatorPanel, HallPanel
+from elevator_panel import ElevatorPanel, HallPanel, HallCallBoard
 from display import Display
 from time_provider import TimeProvider
 from database_manager import DatabaseManager
-from config import DOOR_OPEN_DURATION
+from motion_model import KinematicMotion
+from door_dwell import DwellPolicy, FixedDwellPolicy, AdaptiveDwellPolicy
+from car_scheduler import CarScheduler, create_scheduler
+from config import ADAPTIVE_DWELL_ENABLED, CAR_CALL_DWELL, HALL_CALL_DWELL, LOBBY_PEAK_DWELL, LOBBY_FLOOR, PEAK_HOURS, MIN_DWELL
+from config import DOOR_OPEN_DURATION, CAR_CAPACITY, CAR_SCHEDULER, KINEMATIC_MOTION_ENABLED, FLOOR_HEIGHT, MAX_VELOCITY, MAX_ACCELERATION, MAX_JERK
 
 class ElevatorComponentFactory:
     """
@@ -11,6 +15,17 @@ class ElevatorComponentFactory:
     This helps in decoupling the creation of components from their usage,
     making the system more flexible and testable.
     """
+    kinematic_motion = KINEMATIC_MOTION_ENABLED # Set to True on an instance to give its cars continuous motion
+    adaptive_dwell = ADAPTIVE_DWELL_ENABLED # Set to False on an instance for a fixed DOOR_OPEN_DURATION dwell
+    car_scheduler = CAR_SCHEDULER # Name of the stop scheduler given to new cars: "look", "c-look" or "stf"
+
+    def __init__(self, time_provider: TimeProvider = None) -> None:
+        """
+        Initializes the factory. A given time provider is shared by the system and every car, so a
+        MockTimeProvider can drive a whole simulation (e.g. a trace replay); otherwise each gets a real clock.
+        """
+        self.time_provider = time_provider
+
     def create_door(self) -> Door:
         return Door()
 
@@ -21,11 +36,36 @@ class ElevatorComponentFactory:
         return Display()
 
     def create_time_provider(self) -> TimeProvider:
-        return TimeProvider()
+        return self.time_provider if self.time_provider is not None else TimeProvider()
 
     def get_door_open_duration(self) -> float:
         return DOOR_OPEN_DURATION
 
+    def get_car_capacity(self) -> int:
+        return CAR_CAPACITY
+
+    def create_dwell_policy(self) -> DwellPolicy:
+        """
+        Creates the door dwell policy for a car: adaptive per stop, or DOOR_OPEN_DURATION at every stop.
+        """
+        if not self.adaptive_dwell:
+            return FixedDwellPolicy(self.get_door_open_duration())
+        return AdaptiveDwellPolicy(CAR_CALL_DWELL, HALL_CALL_DWELL, LOBBY_PEAK_DWELL, LOBBY_FLOOR, PEAK_HOURS, MIN_DWELL)
+
+    def create_car_scheduler(self) -> CarScheduler:
+        """
+        Creates the stop scheduler for a car, as named by car_scheduler.
+        """
+        return create_scheduler(self.car_scheduler)
+
+    def create_motion_model(self) -> KinematicMotion | None:
+        """
+        Creates the kinematic motion model for a car, or returns None for classic one-floor-per-move cars.
+        """
+        if not self.kinematic_motion:
+            return None
+        return KinematicMotion(FLOOR_HEIGHT, MAX_VELOCITY, MAX_ACCELERATION, MAX_JERK)
+
     def create_elevator_car_dependencies(self, num_floors: int, database_manager: DatabaseManager) -> dict:
         """
         Creates and returns a dictionary of dependencies required for an ElevatorCar.
@@ -36,14 +76,18 @@ class ElevatorComponentFactory:
             "display": self.create_display(),
             "time_provider": self.create_time_provider(),
             "door_open_duration": self.get_door_open_duration(),
-            "database_manager": database_manager
+            "database_manager": database_manager,
+            "motion": self.create_motion_model(),
+            "capacity": self.get_car_capacity(),
+            "dwell_policy": self.create_dwell_policy(),
+            "scheduler": self.create_car_scheduler()
         }
 
-    def create_hall_panel(self, floor_number: int, top_floor: int) -> HallPanel:
+    def create_hall_panel(self, floor_number: int, top_floor: int, board: HallCallBoard = None) -> HallPanel:
         """
-        Creates and returns a HallPanel instance.
+        Creates and returns a HallPanel instance backed by the given building-wide HallCallBoard.
         """
-        return HallPanel(floor_number, top_floor)
+        return HallPanel(floor_number, top_floor, board)
 
     def create_floor_display(self) -> Display:
         """
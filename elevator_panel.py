@@ -1,9 +1,64 @@
+from threading import Lock
 from button import ElevatorButton, DoorButton, EmergencyButton, HallButton
 from enums import Direction
 
 
+def _lowest_floor(mask: int) -> int:
+    """Returns the floor of the lowest set bit in a non-empty floor bitmask."""
+    return (mask & -mask).bit_length() - 1
+
+
+class _PanelFloorButton(ElevatorButton):
+    """An ElevatorButton view onto one bit of an ElevatorPanel's floor bitmask."""
+    __slots__ = ("_panel",)
+
+    def __init__(self, panel: 'ElevatorPanel', floor: int) -> None:
+        """Initializes a view of the panel's button for one floor.
+
+        Args:
+            panel (ElevatorPanel): The panel holding the button state.
+            floor (int): The destination floor of the button.
+        """
+        self._panel = panel
+        self.destination_floor = floor
+
+    @property
+    def pressed(self) -> bool:
+        return bool(self._panel._floor_mask >> self.destination_floor & 1)
+
+    @pressed.setter
+    def pressed(self, value: bool) -> None:
+        if value:
+            self._panel.press_floor_button(self.destination_floor)
+        else:
+            self._panel.clear_floor_button(self.destination_floor)
+
+
+class _FloorButtons:
+    """A read-only sequence of ElevatorButton views over an ElevatorPanel's floor bitmask."""
+    __slots__ = ("_panel",)
+
+    def __init__(self, panel: 'ElevatorPanel') -> None:
+        self._panel = panel
+
+    def __len__(self) -> int:
+        return self._panel.num_floors
+
+    def __getitem__(self, floor: int) -> ElevatorButton:
+        if floor < 0:
+            floor += self._panel.num_floors
+        if not 0 <= floor < self._panel.num_floors:
+            raise IndexError("floor button index out of range")
+        return _PanelFloorButton(self._panel, floor)
+
+
 class ElevatorPanel:
-    """Represents the control panel inside an elevator car."""
+    """Represents the control panel inside an elevator car.
+
+    Floor button state is held in a single integer bitmask (bit N set = floor N requested), so a
+    panel costs the same whatever the building height and pressed-button queries are bit operations.
+    """
+    __slots__ = ("num_floors", "_floor_mask", "open_button", "close_button", "emergency_button")
 
     def __init__(self, num_floors: int) -> None:
         """Initializes a new ElevatorPanel instance.
@@ -11,16 +66,22 @@ class ElevatorPanel:
         Args:
             num_floors (int): The total number of floors in the building.
         """
-        self.floor_buttons = [ElevatorButton(i) for i in range(num_floors)]
+        self.num_floors = num_floors
+        self._floor_mask = 0
         self.open_button = DoorButton()
         self.close_button = DoorButton()
         self.emergency_button = EmergencyButton()
 
-    def get_floor_buttons(self) -> list[ElevatorButton]:
-        """Gets the list of floor selection buttons.
+    @property
+    def floor_buttons(self) -> _FloorButtons:
+        """The floor selection buttons, as ElevatorButton views created on access."""
+        return _FloorButtons(self)
+
+    def get_floor_buttons(self) -> _FloorButtons:
+        """Gets the floor selection buttons.
 
         Returns:
-            list[ElevatorButton]: A list of ElevatorButton instances.
+            _FloorButtons: A sequence of ElevatorButton views, one per floor.
         """
         return self.floor_buttons
 
@@ -53,8 +114,78 @@ class ElevatorPanel:
 
         Args:
             floor_number (int): The number of the floor button to press.
+
+        Raises:
+            IndexError: If the floor does not exist.
+        """
+        if not 0 <= floor_number < self.num_floors:
+            raise IndexError(f"No floor button for floor {floor_number}")
+        self._floor_mask |= 1 << floor_number
+
+    def clear_floor_button(self, floor_number: int) -> None:
+        """Clears a floor selection button, e.g. when the car arrives at that floor.
+
+        Args:
+            floor_number (int): The number of the floor button to clear.
+        """
+        self._floor_mask &= ~(1 << floor_number)
+
+    def is_floor_button_pressed(self, floor_number: int) -> bool:
+        """Checks whether a floor selection button is pressed.
+
+        Args:
+            floor_number (int): The floor number.
+
+        Returns:
+            bool: True if the button is pressed.
         """
-        self.floor_buttons[floor_number].press_down()
+        return bool(self._floor_mask >> floor_number & 1)
+
+    def any_floor_button_pressed(self) -> bool:
+        """Checks whether any floor selection button is pressed.
+
+        Returns:
+            bool: True if at least one floor is requested.
+        """
+        return self._floor_mask != 0
+
+    def next_pressed_above(self, floor_number: int) -> int | None:
+        """Finds the nearest pressed floor button above a floor.
+
+        Args:
+            floor_number (int): The floor to search from (exclusive).
+
+        Returns:
+            int | None: The nearest requested floor above, or None.
+        """
+        mask = self._floor_mask >> (floor_number + 1)
+        return floor_number + 1 + _lowest_floor(mask) if mask else None
+
+    def next_pressed_below(self, floor_number: int) -> int | None:
+        """Finds the nearest pressed floor button below a floor.
+
+        Args:
+            floor_number (int): The floor to search from (exclusive).
+
+        Returns:
+            int | None: The nearest requested floor below, or None.
+        """
+        mask = self._floor_mask & ((1 << max(floor_number, 0)) - 1)
+        return mask.bit_length() - 1 if mask else None
+
+    def get_pressed_floors(self) -> list[int]:
+        """Lists every floor whose button is pressed.
+
+        Returns:
+            list[int]: The requested floors in ascending order.
+        """
+        floors = []
+        mask = self._floor_mask
+        while mask:
+            low_bit = mask & -mask
+            floors.append(low_bit.bit_length() - 1)
+            mask ^= low_bit
+        return floors
 
     def press_open_button(self) -> None:
         """Simulates pressing the door open button."""
@@ -69,22 +200,205 @@ class ElevatorPanel:
         self.emergency_button.press_down()
 
 
+class HallCallBoard:
+    """Building-wide hall button state: one bitmask of pressed UP buttons and one of DOWN buttons.
+
+    Writes take a lock so presses from other threads are not lost; reads are lock-free.
+    """
+    __slots__ = ("_up_mask", "_down_mask", "_lock")
+
+    def __init__(self) -> None:
+        """Initializes a board with no hall buttons pressed."""
+        self._up_mask = 0
+        self._down_mask = 0
+        self._lock = Lock()
+
+    def _mask(self, direction: Direction | None) -> int:
+        """Returns the bitmask for a direction, or both combined for None."""
+        if direction == Direction.UP:
+            return self._up_mask
+        if direction == Direction.DOWN:
+            return self._down_mask
+        return self._up_mask | self._down_mask
+
+    def press(self, floor: int, direction: Direction) -> None:
+        """Marks a hall button as pressed.
+
+        Args:
+            floor (int): The floor of the button.
+            direction (Direction): UP or DOWN.
+        """
+        bit = 1 << floor
+        with self._lock:
+            if direction == Direction.UP:
+                self._up_mask |= bit
+            elif direction == Direction.DOWN:
+                self._down_mask |= bit
+
+    def press_many(self, calls: list[tuple[int, Direction]]) -> None:
+        """Marks a batch of hall buttons as pressed, taking the lock once.
+
+        Args:
+            calls (list[tuple[int, Direction]]): The (floor, direction) buttons.
+        """
+        up_bits = down_bits = 0
+        for floor, direction in calls:
+            if direction == Direction.UP:
+                up_bits |= 1 << floor
+            elif direction == Direction.DOWN:
+                down_bits |= 1 << floor
+        with self._lock:
+            self._up_mask |= up_bits
+            self._down_mask |= down_bits
+
+    def clear(self, floor: int, direction: Direction) -> None:
+        """Clears a hall button.
+
+        Args:
+            floor (int): The floor of the button.
+            direction (Direction): UP or DOWN.
+        """
+        bit = ~(1 << floor)
+        with self._lock:
+            if direction == Direction.UP:
+                self._up_mask &= bit
+            elif direction == Direction.DOWN:
+                self._down_mask &= bit
+
+    def clear_floor(self, floor: int) -> None:
+        """Clears both hall buttons on a floor.
+
+        Args:
+            floor (int): The floor whose buttons to clear.
+        """
+        bit = ~(1 << floor)
+        with self._lock:
+            self._up_mask &= bit
+            self._down_mask &= bit
+
+    def reset(self, requests: list[tuple[int, Direction]]) -> None:
+        """Replaces the whole board with the given pressed buttons.
+
+        Args:
+            requests (list[tuple[int, Direction]]): The (floor, direction) buttons that are pressed.
+        """
+        up_mask = down_mask = 0
+        for floor, direction in requests:
+            if direction == Direction.UP:
+                up_mask |= 1 << floor
+            elif direction == Direction.DOWN:
+                down_mask |= 1 << floor
+        with self._lock:
+            self._up_mask = up_mask
+            self._down_mask = down_mask
+
+    def is_pressed(self, floor: int, direction: Direction) -> bool:
+        """Checks whether a hall button is pressed.
+
+        Args:
+            floor (int): The floor of the button.
+            direction (Direction): UP or DOWN.
+
+        Returns:
+            bool: True if the button is pressed.
+        """
+        return bool(self._mask(direction) >> floor & 1)
+
+    def any_pressed(self, direction: Direction = None) -> bool:
+        """Checks whether any hall button is pressed.
+
+        Args:
+            direction (Direction, optional): Restrict to UP or DOWN buttons. Defaults to both.
+
+        Returns:
+            bool: True if at least one matching button is pressed.
+        """
+        return self._mask(direction) != 0
+
+    def next_pressed_above(self, floor: int, direction: Direction = None) -> int | None:
+        """Finds the nearest floor above with a pressed hall button.
+
+        Args:
+            floor (int): The floor to search from (exclusive).
+            direction (Direction, optional): Restrict to UP or DOWN buttons. Defaults to both.
+
+        Returns:
+            int | None: The nearest such floor, or None.
+        """
+        mask = self._mask(direction) >> (floor + 1)
+        return floor + 1 + _lowest_floor(mask) if mask else None
+
+    def next_pressed_below(self, floor: int, direction: Direction = None) -> int | None:
+        """Finds the nearest floor below with a pressed hall button.
+
+        Args:
+            floor (int): The floor to search from (exclusive).
+            direction (Direction, optional): Restrict to UP or DOWN buttons. Defaults to both.
+
+        Returns:
+            int | None: The nearest such floor, or None.
+        """
+        mask = self._mask(direction) & ((1 << max(floor, 0)) - 1)
+        return mask.bit_length() - 1 if mask else None
+
+
+class _BoardHallButton(HallButton):
+    """A HallButton view onto one bit of a HallCallBoard."""
+    __slots__ = ("_board", "_floor")
+
+    def __init__(self, board: HallCallBoard, floor: int, direction: Direction) -> None:
+        """Initializes a view of one hall button.
+
+        Args:
+            board (HallCallBoard): The board holding the button state.
+            floor (int): The floor of the button.
+            direction (Direction): UP or DOWN.
+        """
+        self._board = board
+        self._floor = floor
+        self.direction = direction
+
+    @property
+    def pressed(self) -> bool:
+        return self._board.is_pressed(self._floor, self.direction)
+
+    @pressed.setter
+    def pressed(self, value: bool) -> None:
+        if value:
+            self._board.press(self._floor, self.direction)
+        else:
+            self._board.clear(self._floor, self.direction)
+
+
 class HallPanel:
-    """Represents a hall panel on a specific floor, with up and down call buttons."""
-    def __init__(self, floor_number: int, top_floor: int) -> None:
+    """Represents a hall panel on a specific floor, with up and down call buttons.
+
+    Button state lives in a HallCallBoard, normally shared by every floor of the building.
+    """
+    __slots__ = ("floor_number", "board", "_has_up", "_has_down")
+
+    def __init__(self, floor_number: int, top_floor: int, board: HallCallBoard = None) -> None:
         """Initializes a new HallPanel instance.
 
         Args:
             floor_number (int): The number of the floor this panel is on.
             top_floor (int): The highest floor number in the building.
+            board (HallCallBoard, optional): The building-wide hall button state. Defaults to a new, private board.
         """
         self.floor_number = floor_number
-        self.up = None
-        self.down = None
-        if floor_number < top_floor:
-            self.up = HallButton(Direction.UP)
-        if floor_number > 0:
-            self.down = HallButton(Direction.DOWN)
+        self.board = board if board else HallCallBoard()
+        self._has_up = floor_number < top_floor
+        self._has_down = floor_number > 0
+
+    @property
+    def up(self) -> HallButton | None:
+        """The up call button, or None if this floor has none."""
+        return _BoardHallButton(self.board, self.floor_number, Direction.UP) if self._has_up else None
+
+    @property
+    def down(self) -> HallButton | None:
+        """The down call button, or None if this floor has none."""
+        return _BoardHallButton(self.board, self.floor_number, Direction.DOWN) if self._has_down else None
 
     def get_up_button(self) -> HallButton | None:
         """Gets the up call button for this floor.
@@ -104,13 +418,13 @@ class HallPanel:
 
     def press_up_button(self) -> None:
         """Simulates pressing the up call button."""
-        if self.up:
-            self.up.press_down()
+        if self._has_up:
+            self.board.press(self.floor_number, Direction.UP)
 
     def press_down_button(self) -> None:
         """Simulates pressing the down call button."""
-        if self.down:
-            self.down.press_down()
+        if self._has_down:
+            self.board.press(self.floor_number, Direction.DOWN)
 
     def __repr__(self) -> str:
         """Returns a string representation of the HallPanel.
@@ -1,163 +1,249 @@
-
 from abc import ABC, abstractmethod
-from typing import List, Tuple, Any
 from enums import Direction, DoorState
 from commands import Command
 
 class ElevatorState(ABC):
-    """Abstract base class for all states of an elevator car (State pattern)."""
-    def __init__(self, car: object) -> None:
-        """Initializes an ElevatorState instance.
+    """Abstract base class for all states of an elevator car (State pattern).
+
+    States hold no per-car data, so each concrete class is a flyweight: constructing it always
+    returns the same shared instance, and the car is passed to every method instead.
+    Each state class has a compact integer `code` used for persistence and transition tables.
+
+    State methods do not return commands; they append flat (Command, argument) pairs to a buffer
+    owned by the car, which the car then executes and reuses on the next call.
+    """
+    code = -1
+
+    def __new__(cls, car: object = None) -> 'ElevatorState':
+        """Returns the shared instance of the state class, creating it on first use.
 
         Args:
-            car (object): The ElevatorCar instance this state belongs to.
+            car (object, optional): Accepted for compatibility with the old per-car states; ignored.
         """
-        self.car = car
+        instance = cls.__dict__.get("_flyweight")
+        if instance is None:
+            instance = super().__new__(cls)
+            cls._flyweight = instance
+        return instance
+
+    def __init__(self, car: object = None) -> None:
+        """Initializes an ElevatorState instance. States are stateless, so this does nothing.
+
+        Args:
+            car (object, optional): Accepted for compatibility with the old per-car states; ignored.
+        """
+        pass
 
     @abstractmethod
-    def move(self) -> List[Tuple[Command, Any]]:
+    def move(self, car: object, out: list) -> None:
         """Abstract method to define the movement behavior for the current state.
-        Returns a list of commands for the ElevatorCar to execute.
+        Appends the commands for the ElevatorCar to execute to `out`.
+
+        Args:
+            car (object): The ElevatorCar this state is driving.
+            out (list): The car's command buffer, to append (Command, argument) pairs to.
         """
         pass
 
     @abstractmethod
-    def register_request(self, floor: int) -> List[Tuple[Command, Any]]:
+    def register_request(self, car: object, floor: int, out: list) -> None:
         """Abstract method to define how a new request is handled in the current state.
-        Returns a list of commands for the ElevatorCar to execute.
+        Appends the commands for the ElevatorCar to execute to `out`.
 
         Args:
+            car (object): The ElevatorCar this state is driving.
             floor (int): The floor number of the new request.
+            out (list): The car's command buffer, to append (Command, argument) pairs to.
         """
         pass
 
 class IdleState(ElevatorState):
     """Represents the idle state of an elevator car."""
-    def move(self) -> List[Tuple[Command, Any]]:
-        """Determines the next movement based on pending requests when idle."""
-        commands = []
-        if self.car.get_up_requests():
-            commands.append((Command.SET_DIRECTION, Direction.UP))
-            commands.append((Command.SET_STATE, MovingUpState(self.car)))
-        elif self.car.get_down_requests():
-            commands.append((Command.SET_DIRECTION, Direction.DOWN))
-            commands.append((Command.SET_STATE, MovingDownState(self.car)))
-        return commands
-
-    def register_request(self, floor: int) -> List[Tuple[Command, Any]]:
+    code = 0
+
+    def move(self, car: object, out: list) -> None:
+        """Departs towards the first stop of the car's plan, if there is one."""
+        destination = car.next_stop()
+        if destination is None:
+            return
+        current_floor = car.get_current_floor()
+        if destination == current_floor: # A stop restored at the floor the car rests on
+            _serve_stop(car, destination, out)
+        else:
+            out += TO_MOVING_UP if destination > current_floor else TO_MOVING_DOWN
+
+    def register_request(self, car: object, floor: int, out: list) -> None:
         """Registers a new request when the elevator is idle.
 
         Args:
+            car (object): The ElevatorCar this state is driving.
             floor (int): The floor number of the new request.
+            out (list): The car's command buffer.
         """
-        commands = []
-        current_floor = self.car.get_current_floor()
+        current_floor = car.get_current_floor()
         if floor > current_floor:
-            commands.append((Command.ADD_UP_REQUEST, floor))
+            out.append(Command.ADD_UP_REQUEST)
+            out.append(floor)
         elif floor < current_floor:
-            commands.append((Command.ADD_DOWN_REQUEST, floor))
+            out.append(Command.ADD_DOWN_REQUEST)
+            out.append(floor)
         else:
-            commands.append((Command.OPEN_DOOR_AND_NOTIFY,))
-        return commands
+            out += _OPEN_DOOR_AND_NOTIFY
 
 class MovingUpState(ElevatorState):
     """Represents the state of an elevator car moving upwards."""
-    def move(self) -> List[Tuple[Command, Any]]:
-        """Moves the elevator car one floor up, handling stops at requested floors."""
-        commands = []
-        up_requests = self.car.get_up_requests()
-        current_floor = self.car.get_current_floor()
-
-        if not up_requests:
-            commands.append((Command.SET_STATE, IdleState(self.car)))
-            commands.append((Command.SET_DIRECTION, Direction.STOP))
-            return commands
-
-        destination = up_requests[0]
-        if current_floor < destination:
-            commands.append((Command.INCREMENT_FLOOR,))
-        
-        if current_floor + 1 == destination: # Check if next floor is destination
-            commands.append((Command.REMOVE_UP_REQUEST, destination))
-            commands.append((Command.OPEN_DOOR_AND_NOTIFY,))
-            if len(up_requests) == 1: # Check if this is the last up request
-                if self.car.get_down_requests():
-                    commands.append((Command.SET_DIRECTION, Direction.DOWN))
-                    commands.append((Command.SET_STATE, MovingDownState(self.car)))
-                else:
-                    commands.append((Command.SET_STATE, IdleState(self.car)))
-                    commands.append((Command.SET_DIRECTION, Direction.STOP))
-        return commands
-
-    def register_request(self, floor: int) -> List[Tuple[Command, Any]]:
+    code = 1
+
+    def move(self, car: object, out: list) -> None:
+        """Moves the elevator car up (one floor, or continuously in kinematic mode) towards the next stop of its plan."""
+        plan = car.get_stop_plan()
+        if not plan:
+            out += TO_IDLE
+            return
+
+        current_floor = car.get_current_floor()
+        destination = plan[0]
+        if destination < current_floor: # The plan turns around here
+            out += TO_MOVING_DOWN
+            return
+        if car.motion is not None:
+            arrived = current_floor == destination and not car.motion.is_moving()
+            if not arrived:
+                out.append(Command.TRAVEL_TO)
+                out.append(destination)
+        elif current_floor < destination:
+            out += _INCREMENT_FLOOR
+            arrived = current_floor + 1 == destination # Check if next floor is destination
+        else:
+            arrived = True
+
+        if arrived:
+            _serve_stop(car, destination, out)
+            out += SWEEP_END[self.code][_next_leg(plan, destination)]
+
+    def register_request(self, car: object, floor: int, out: list) -> None:
         """Registers a new request when the elevator is moving upwards.
 
+        Floors the car has passed, or can no longer brake for, are kept for the return sweep.
+
         Args:
+            car (object): The ElevatorCar this state is driving.
             floor (int): The floor number of the new request.
+            out (list): The car's command buffer.
         """
-        commands = []
-        current_floor = self.car.get_current_floor()
-        if floor == current_floor:
-            commands.append((Command.OPEN_DOOR_AND_NOTIFY,))
-        elif floor > current_floor:
-            commands.append((Command.ADD_UP_REQUEST, floor))
-        # Ignore requests for floors below the current floor while moving up
-        return commands
+        current_floor = car.get_current_floor()
+        if floor == current_floor and car.can_stop_at(floor):
+            out += _OPEN_DOOR_AND_NOTIFY
+        elif floor > current_floor and car.can_stop_at(floor):
+            out.append(Command.ADD_UP_REQUEST)
+            out.append(floor)
+        else:
+            out.append(Command.ADD_DOWN_REQUEST)
+            out.append(floor)
 
 class MovingDownState(ElevatorState):
     """Represents the state of an elevator car moving downwards."""
-    def move(self) -> List[Tuple[Command, Any]]:
-        """Moves the elevator car one floor down, handling stops at requested floors."""
-        commands = []
-        down_requests = self.car.get_down_requests()
-        current_floor = self.car.get_current_floor()
-
-        if not down_requests:
-            commands.append((Command.SET_STATE, IdleState(self.car)))
-            commands.append((Command.SET_DIRECTION, Direction.STOP))
-            return commands
-
-        destination = down_requests[0]
-        if current_floor > destination:
-            commands.append((Command.DECREMENT_FLOOR,))
-
-        if current_floor - 1 == destination: # Check if next floor is destination
-            commands.append((Command.REMOVE_DOWN_REQUEST, destination))
-            commands.append((Command.OPEN_DOOR_AND_NOTIFY,))
-            if len(down_requests) == 1: # Check if this is the last down request
-                if self.car.get_up_requests():
-                    commands.append((Command.SET_DIRECTION, Direction.UP))
-                    commands.append((Command.SET_STATE, MovingUpState(self.car)))
-                else:
-                    commands.append((Command.SET_STATE, IdleState(self.car)))
-                    commands.append((Command.SET_DIRECTION, Direction.STOP))
-        return commands
-
-    def register_request(self, floor: int) -> List[Tuple[Command, Any]]:
+    code = 2
+
+    def move(self, car: object, out: list) -> None:
+        """Moves the elevator car down (one floor, or continuously in kinematic mode) towards the next stop of its plan."""
+        plan = car.get_stop_plan()
+        if not plan:
+            out += TO_IDLE
+            return
+
+        current_floor = car.get_current_floor()
+        destination = plan[0]
+        if destination > current_floor: # The plan turns around here
+            out += TO_MOVING_UP
+            return
+        if car.motion is not None:
+            arrived = current_floor == destination and not car.motion.is_moving()
+            if not arrived:
+                out.append(Command.TRAVEL_TO)
+                out.append(destination)
+        elif current_floor > destination:
+            out += _DECREMENT_FLOOR
+            arrived = current_floor - 1 == destination # Check if next floor is destination
+        else:
+            arrived = True
+
+        if arrived:
+            _serve_stop(car, destination, out)
+            out += SWEEP_END[self.code][_next_leg(plan, destination)]
+
+    def register_request(self, car: object, floor: int, out: list) -> None:
         """Registers a new request when the elevator is moving downwards.
 
+        Floors the car has passed, or can no longer brake for, are kept for the return sweep.
+
         Args:
+            car (object): The ElevatorCar this state is driving.
             floor (int): The floor number of the new request.
+            out (list): The car's command buffer.
         """
-        commands = []
-        current_floor = self.car.get_current_floor()
-        if floor == current_floor:
-            commands.append((Command.OPEN_DOOR_AND_NOTIFY,))
-        elif floor < current_floor:
-            commands.append((Command.ADD_DOWN_REQUEST, floor))
-        # Ignore requests for floors above the current floor while moving down
-        return commands
+        current_floor = car.get_current_floor()
+        if floor == current_floor and car.can_stop_at(floor):
+            out += _OPEN_DOOR_AND_NOTIFY
+        elif floor < current_floor and car.can_stop_at(floor):
+            out.append(Command.ADD_DOWN_REQUEST)
+            out.append(floor)
+        else:
+            out.append(Command.ADD_UP_REQUEST)
+            out.append(floor)
+
+def _serve_stop(car: object, floor: int, out: list) -> None:
+    """Appends the commands that clear a stop the car has arrived at and open its door."""
+    out.append(Command.REMOVE_UP_REQUEST)
+    out.append(floor)
+    out.append(Command.REMOVE_DOWN_REQUEST)
+    out.append(floor)
+    if not car.skips_stop(floor): # A full car passes hall calls nobody could board
+        out += _OPEN_DOOR_AND_NOTIFY
+
+def _next_leg(plan: tuple, floor: int) -> int:
+    """Classifies the leg after the stop at plan[0]: 0 = no more stops, 1 = further up, 2 = further down."""
+    if len(plan) == 1:
+        return 0
+    return 1 if plan[1] > floor else 2
 
 class MaintenanceState(ElevatorState):
     """Represents the maintenance state of an elevator car."""
-    def move(self) -> List[Tuple[Command, Any]]:
+    code = 3
+
+    def move(self, car: object, out: list) -> None:
         """In maintenance mode, the elevator does not move."""
-        return [] # Do nothing in maintenance mode
+        pass # Do nothing in maintenance mode
 
-    def register_request(self, floor: int) -> List[Tuple[Command, Any]]:
+    def register_request(self, car: object, floor: int, out: list) -> None:
         """In maintenance mode, the elevator does not accept new requests.
 
         Args:
+            car (object): The ElevatorCar this state is driving.
             floor (int): The floor number of the new request.
+            out (list): The car's command buffer.
         """
-        return [] # Do not accept requests in maintenance mode
+        pass # Do not accept requests in maintenance mode
+
+# Shared flyweight instances, indexed by state code
+IDLE = IdleState()
+MOVING_UP = MovingUpState()
+MOVING_DOWN = MovingDownState()
+MAINTENANCE = MaintenanceState()
+STATES_BY_CODE = (IDLE, MOVING_UP, MOVING_DOWN, MAINTENANCE)
+
+# Precomputed flat (command, argument) sequences, so ticks never allocate state objects or command tuples
+_INCREMENT_FLOOR = (Command.INCREMENT_FLOOR, None)
+_DECREMENT_FLOOR = (Command.DECREMENT_FLOOR, None)
+_OPEN_DOOR_AND_NOTIFY = (Command.OPEN_DOOR_AND_NOTIFY, None)
+TO_IDLE = (Command.SET_STATE, IDLE, Command.SET_DIRECTION, Direction.STOP)
+TO_MOVING_UP = (Command.SET_DIRECTION, Direction.UP, Command.SET_STATE, MOVING_UP)
+TO_MOVING_DOWN = (Command.SET_DIRECTION, Direction.DOWN, Command.SET_STATE, MOVING_DOWN)
+
+# Transition after a moving state serves a stop, indexed by [state code][next leg: none, up, down]
+SWEEP_END = (
+    None,
+    (TO_IDLE, (), TO_MOVING_DOWN),
+    (TO_IDLE, TO_MOVING_UP, ()),
+    None,
+)
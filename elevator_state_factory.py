@@ -1,9 +1,9 @@
-from elevator_state import IdleState, MovingUpState, MovingDownState, MaintenanceState
+from elevator_state import IdleState, MovingUpState, MovingDownState, MaintenanceState, STATES_BY_CODE
 
 class ElevatorStateFactory:
     """
-    A factory for creating ElevatorState objects based on their string names.
-    This centralizes the logic for re-instantiating state objects from persistence.
+    A factory for resolving persisted ElevatorState values back to their shared state objects.
+    States are persisted as integer codes; class names written by older versions are still accepted.
     """
     _state_map = {
         "IdleState": IdleState,
@@ -13,22 +13,44 @@ class ElevatorStateFactory:
     }
 
     @classmethod
-    def create_state(cls, state_name: str, car: object) -> object:
+    def from_code(cls, code: int) -> object:
         """
-        Creates an ElevatorState object given its string name and the ElevatorCar instance.
+        Returns the ElevatorState flyweight for an integer state code.
 
         Args:
-            state_name (str): The string name of the state (e.g., "IdleState").
-            car (object): The ElevatorCar instance to which the state belongs.
+            code (int): The state code (e.g., IdleState.code).
 
         Returns:
-            object: An instance of the specified ElevatorState.
+            object: The shared ElevatorState instance.
 
         Raises:
-            ValueError: If an unknown state name is provided.
+            ValueError: If an unknown state code is provided.
         """
-        state_class = cls._state_map.get(state_name)
+        if 0 <= code < len(STATES_BY_CODE):
+            return STATES_BY_CODE[code]
+        raise ValueError(f"Unknown elevator state code: {code}")
+
+    @classmethod
+    def create_state(cls, state: int | str, car: object = None) -> object:
+        """
+        Returns the ElevatorState for a persisted value: an integer code, or a legacy class name.
+
+        Args:
+            state (int | str): The state code, its string form as read from a TEXT column, or a class name (e.g., "IdleState").
+            car (object, optional): Unused; states are shared flyweights. Kept for backward compatibility.
+
+        Returns:
+            object: The shared ElevatorState instance.
+
+        Raises:
+            ValueError: If an unknown state is provided.
+        """
+        if isinstance(state, int):
+            return cls.from_code(state)
+        if state.isdigit():
+            return cls.from_code(int(state))
+        state_class = cls._state_map.get(state)
         if state_class:
-            return state_class(car)
+            return state_class()
         else:
-            raise ValueError(f"Unknown elevator state: {state_name}")
+            raise ValueError(f"Unknown elevator state: {state}")
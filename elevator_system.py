@@ -1,18 +1,34 @@
+import time
 from threading import Lock
 from observer import Observer, Subject
 from elevator_car import ElevatorCar
-from floor import Floor
-from enums import Direction
+from elevator_state import IDLE, MAINTENANCE
+from floor import FloorDirectory
+from enums import Direction, DoorState, Admission
 from dispatching_strategy import DispatchingStrategy, ClosestCarStrategy
 from door import Door
-from elevator_panel import ElevatorPanel
+from elevator_panel import ElevatorPanel, HallCallBoard
 from display import Display
 from database_manager import DatabaseManager # Import DatabaseManager
 from time_provider import TimeProvider # Import TimeProvider
 import logging
-from config import NUM_FLOORS, DOOR_OPEN_DURATION # Import configuration values
+from config import NUM_FLOORS, DOOR_OPEN_DURATION, FLIGHT_RECORDER_CAPACITY # Import configuration values
+from config import DISPATCH_BATCH_WINDOW, CALL_DEBOUNCE_SECONDS, CALL_RATE_PER_SOURCE, CALL_BURST_PER_SOURCE, CALL_INTAKE_QUEUE_SIZE
 from elevator_component_factory import ElevatorComponentFactory # Import the new factory
 from request_manager import RequestManager # Import the new RequestManager
+from metrics import MetricsRegistry, REGISTRY
+from tick_profiler import TickProfiler, NULL_PROFILER
+from journey_tracker import JourneyTracker
+from event_bus import EventBus, HallCallRegistered, CarCallRegistered, RequestFulfilled
+from fleet_snapshot import FleetSnapshot
+from car_scheduler import create_scheduler
+from call_admission import CallAdmission
+from quiescence import ActivitySignal
+from dashboard import TerminalDashboard
+from telemetry_store import TelemetryStore
+from flight_recorder import FlightRecorder, DISPATCH_UP, DISPATCH_DOWN, HALL_CALL_UP, HALL_CALL_DOWN, HALL_CALLS_CLEARED, NO_CAR
+
+logger = logging.getLogger(__name__)
 
 class ElevatorSystem(Observer):
     """The central control system for managing multiple elevators and handling requests."""
@@ -24,7 +40,8 @@ class ElevatorSystem(Observer):
                  num_cars: int,
                  dispatching_strategy: DispatchingStrategy = None,
                  database_manager: DatabaseManager = None,
-                 factory: ElevatorComponentFactory = None) -> None:
+                 factory: ElevatorComponentFactory = None,
+                 metrics: MetricsRegistry = None) -> None:
         """Initializes the ElevatorSystem.
 
         Args:
@@ -33,28 +50,67 @@ class ElevatorSystem(Observer):
             dispatching_strategy (DispatchingStrategy, optional): The strategy to use for dispatching elevators.
                                                                  Defaults to ClosestCarStrategy.
             database_manager (DatabaseManager, optional): The database manager instance. Defaults to a new DatabaseManager.
+            factory (ElevatorComponentFactory, optional): The factory for elevator components. Defaults to a new ElevatorComponentFactory.
+            metrics (MetricsRegistry, optional): The registry to record runtime metrics in. Defaults to REGISTRY.
         """
         self.database_manager = database_manager if database_manager else DatabaseManager()
         self.factory = factory if factory else ElevatorComponentFactory() # Store the factory
-        self.request_manager = RequestManager(self.database_manager) # Initialize RequestManager
+        self.metrics = metrics if metrics else REGISTRY
+        self.time_provider = self.factory.create_time_provider()
+        self.request_manager = RequestManager(self.database_manager, self.time_provider, self.metrics) # Initialize RequestManager
+
+        self._tick_duration = self.metrics.histogram("elevator_tick_duration_seconds", "Duration of a full control loop tick.")
+        self._dispatch_duration = self.metrics.histogram("elevator_dispatch_duration_seconds", "Duration of a dispatcher pass.")
+        pending_calls = self.metrics.gauge("elevator_pending_calls", "Hall calls waiting to be fulfilled.", ("direction",))
+        self._pending_up_calls = pending_calls.labels(Direction.UP.name)
+        self._pending_down_calls = pending_calls.labels(Direction.DOWN.name)
+        self.profiler = None # Set by enable_profiling(); None times no phases
+        self.journey_tracker = None # Set by enable_journey_tracking()
+        self.dashboard = None # Set by enable_dashboard(); None keeps the per-car display prints
+        self.telemetry = None # Set by enable_telemetry()
+        self.call_admission = None # Set by enable_call_admission(); None registers hall calls immediately
+        # Seconds new hall calls are collected before the dispatcher assigns them together; 0 assigns every tick
+        self.dispatch_window = DISPATCH_BATCH_WINDOW
+        self._batch_started = None # Time the first hall call of the current batch was registered
+        # Set by anything that can give the cars work; an idle main loop sleeps on it (see wait_for_activity())
+        self.activity = ActivitySignal()
+        self._idle_saved = False # True once the state of a quiescent fleet is saved; later idle ticks skip saving
+        # Cars publish here; events are delivered in per-tick batches so subscribers stay off the movement path
+        self.event_bus = EventBus()
+        self.event_bus.subscribe(RequestFulfilled.topic, self._on_requests_fulfilled)
+        # Always-on binary history of commands, dispatch decisions and hall-call changes
+        self.flight_recorder = FlightRecorder(FLIGHT_RECORDER_CAPACITY, clock=self.time_provider.get_time)
 
         # Try to load system state from DB
         loaded_system_state = self.database_manager.load_system_state()
         if loaded_system_state:
             self.num_floors = loaded_system_state["num_floors"]
-            self.num_cars = loaded_system_state["num_cars"]
-            logging.info(f"Loaded system state: {self.num_floors} floors, {self.num_cars} cars")
+            # Cars added or retired at runtime leave gaps in the IDs, so prefer the saved cars over the count
+            car_ids = self.database_manager.load_car_ids() or list(range(loaded_system_state["num_cars"]))
+            self.num_cars = len(car_ids)
+            logger.info("Loaded system state: %s floors, %s cars", self.num_floors, self.num_cars)
         else:
             self.num_floors = NUM_FLOORS # Use config value
             self.num_cars = num_cars
+            car_ids = list(range(num_cars))
             self.database_manager.save_system_state(self.num_floors, self.num_cars)
-            logging.info(f"Initialized new system state: {self.num_floors} floors, {self.num_cars} cars")
+            logger.info("Initialized new system state: %s floors, %s cars", self.num_floors, self.num_cars)
 
+        # Hall button state for the whole building, shared by every floor's HallPanel and the cars
+        self.hall_calls = HallCallBoard()
+        for floor, direction in self.request_manager.get_all_requests_for_persistence():
+            self.hall_calls.press(floor, direction)
         self.cars = []
-        for i in range(self.num_cars):
-            car = self._create_elevator_car(i, self.database_manager) # Pass database_manager
+        for car_id in car_ids:
+            car = self._create_elevator_car(car_id, self.database_manager) # Pass database_manager
             self.cars.append(car)
-        self.floors = [Floor(i, self.num_floors) for i in range(self.num_floors)]
+        # car_id -> car, and the cars the dispatcher may assign hall calls to (all but retiring ones).
+        # Both are updated in place by add_car() and retire_car().
+        self._cars_by_id = {car.car_id: car for car in self.cars}
+        self._dispatch_cars = [car for car in self.cars if not car.retiring]
+        self._retiring = [car for car in self.cars if car.retiring] # Restored, so a draining car stays out of dispatch
+        # Floors are built on first access, so very tall buildings only pay for the floors in use
+        self.floors = FloorDirectory(self.num_floors, self.factory, self.hall_calls)
         
         # Requests are now managed by RequestManager, so remove loading logic here
         # loaded_system_requests = self.database_manager.load_system_requests()
@@ -74,10 +130,13 @@ class ElevatorSystem(Observer):
         # self._up_requests_lock = Lock()
         # self._down_requests_lock = Lock()
 
-        # Attach self as observer to each car
+        # Attach self as observer to each car, for events notified directly rather than through the bus
         for car in self.cars:
             car.attach(self)
 
+        self._snapshot = None
+        self.publish_snapshot()
+
     def _create_elevator_car(self, car_id: int, database_manager: DatabaseManager) -> ElevatorCar:
         """Helper method to create and initialize an ElevatorCar instance.
 
@@ -89,7 +148,8 @@ class ElevatorSystem(Observer):
             ElevatorCar: The newly created ElevatorCar instance.
         """
         car_dependencies = self.factory.create_elevator_car_dependencies(self.num_floors, database_manager)
-        car = ElevatorCar(car_id=car_id, num_floors=self.num_floors, **car_dependencies)
+        car = ElevatorCar(car_id=car_id, num_floors=self.num_floors, metrics=self.metrics, event_bus=self.event_bus,
+                          recorder=self.flight_recorder, hall_calls=self.hall_calls, **car_dependencies)
         return car
 
     @classmethod
@@ -108,7 +168,7 @@ class ElevatorSystem(Observer):
             return cls._instance
 
     @classmethod
-    def initialize(cls, num_floors: int, num_cars: int, dispatching_strategy: DispatchingStrategy = None, database_manager: DatabaseManager = None, factory: ElevatorComponentFactory = None) -> 'ElevatorSystem':
+    def initialize(cls, num_floors: int, num_cars: int, dispatching_strategy: DispatchingStrategy = None, database_manager: DatabaseManager = None, factory: ElevatorComponentFactory = None, metrics: MetricsRegistry = None) -> 'ElevatorSystem':
         """Initializes the singleton instance of ElevatorSystem.
 
         Args:
@@ -117,6 +177,8 @@ class ElevatorSystem(Observer):
             dispatching_strategy (DispatchingStrategy, optional): The strategy to use for dispatching elevators.
                                                                  Defaults to ClosestCarStrategy.
             database_manager (DatabaseManager, optional): The database manager instance. Defaults to a new DatabaseManager.
+            factory (ElevatorComponentFactory, optional): The factory for elevator components. Defaults to a new ElevatorComponentFactory.
+            metrics (MetricsRegistry, optional): The registry to record runtime metrics in. Defaults to REGISTRY.
 
         Returns:
             ElevatorSystem: The newly initialized (or existing) singleton instance of ElevatorSystem.
@@ -126,7 +188,7 @@ class ElevatorSystem(Observer):
         """
         with cls._lock:
             if cls._instance is None:
-                cls._instance = ElevatorSystem(num_floors, num_cars, dispatching_strategy, database_manager, factory)
+                cls._instance = ElevatorSystem(num_floors, num_cars, dispatching_strategy, database_manager, factory, metrics)
             # Optional: Add logic to check if parameters are consistent if already initialized
             # For now, we'll assume initialize is called once.
             return cls._instance
@@ -139,22 +201,364 @@ class ElevatorSystem(Observer):
         """
         return self.cars
 
-    def call_elevator(self, floor: int, direction: Direction) -> None:
+    def get_car(self, car_id: int) -> ElevatorCar:
+        """Gets an elevator car by its ID.
+
+        Args:
+            car_id (int): The ID of the car.
+
+        Returns:
+            ElevatorCar: The car with this ID.
+
+        Raises:
+            ValueError: If no car has this ID.
+        """
+        car = self._cars_by_id.get(car_id)
+        if car is None:
+            raise ValueError(f"Unknown elevator car: {car_id}")
+        return car
+
+    def add_car(self, car_id: int = None) -> ElevatorCar:
+        """Puts a new car into service without a restart. It starts idle at the ground floor.
+
+        Args:
+            car_id (int, optional): The new car's ID. Defaults to one more than the highest ID now in the fleet
+                                    (a retired car's ID may be reused).
+
+        Returns:
+            ElevatorCar: The new car, already available to the dispatcher.
+
+        Raises:
+            ValueError: If a car with this ID is already in the fleet.
+        """
+        if car_id is None:
+            car_id = max(self._cars_by_id, default=-1) + 1
+        if car_id in self._cars_by_id:
+            raise ValueError(f"Elevator car {car_id} already exists")
+        car = self._add_to_fleet(car_id)
+        # Persist just the new car and the count; the next commit makes both durable
+        car.save_state()
+        self.database_manager.save_system_state(self.num_floors, self.num_cars)
+        logger.info("Added car %s; fleet size %s", car_id, self.num_cars)
+        self.activity.notify()
+        return car
+
+    def retire_car(self, car_id: int) -> None:
+        """Takes a car out of service without a restart.
+
+        The car stops receiving hall calls at once; hall calls it was assigned are dropped from its
+        stops and go back to the dispatcher, which reassigns them to other cars on the next tick.
+        The car keeps running until its passengers' car calls are served, and is removed from the
+        fleet (and the database) at the end of the first tick in which it is idle with its door closed.
+
+        Args:
+            car_id (int): The ID of the car.
+
+        Raises:
+            ValueError: If no car has this ID.
+        """
+        car = self.get_car(car_id)
+        if car.retiring:
+            return
+        car.retiring = True
+        self._track_retirement(car)
+        car_calls = set(car.panel.get_pressed_floors())
+        car.up_requests[:] = [floor for floor in car.up_requests if floor in car_calls]
+        car.down_requests[:] = [floor for floor in car.down_requests if floor in car_calls]
+        car.invalidate_stop_plan()
+        car.save_state() # Persist the flag now, so a restart or takeover keeps the car out of dispatch
+        logger.info("Retiring car %s; draining car calls %s", car_id, sorted(car_calls))
+        self._finish_retirements()
+        self.activity.notify()
+
+    def is_retiring(self, car_id: int) -> bool:
+        """Checks whether a car is draining before leaving the fleet.
+
+        Args:
+            car_id (int): The ID of the car.
+
+        Returns:
+            bool: True if retire_car() was called and the car has not been removed yet.
+        """
+        car = self._cars_by_id.get(car_id)
+        return car is not None and car.retiring
+
+    def _finish_retirements(self) -> None:
+        """Removes retiring cars that have drained from the fleet and the database."""
+        for car in list(self._retiring):
+            if car.up_requests or car.down_requests or car.door.get_state() != DoorState.CLOSED or not car.is_idle():
+                continue
+            self._retiring.remove(car)
+            self._drop_from_fleet(car)
+            self.database_manager.delete_car(car.car_id)
+            self.database_manager.save_system_state(self.num_floors, self.num_cars)
+            logger.info("Retired car %s; fleet size %s", car.car_id, self.num_cars)
+
+    def _add_to_fleet(self, car_id: int) -> ElevatorCar:
+        """Creates a car (from its saved state, if any) and adds it to every fleet index."""
+        car = self._create_elevator_car(car_id, self.database_manager)
+        car.attach(self)
+        self.cars.append(car)
+        self._cars_by_id[car_id] = car
+        self._track_retirement(car)
+        self.num_cars = len(self.cars)
+        return car
+
+    def _track_retirement(self, car: ElevatorCar) -> None:
+        """Files a car under the dispatcher's cars or the draining cars, according to its retiring flag."""
+        if car.retiring:
+            if car in self._dispatch_cars:
+                self._dispatch_cars.remove(car)
+            if car not in self._retiring:
+                self._retiring.append(car)
+        else:
+            if car in self._retiring:
+                self._retiring.remove(car)
+            if car not in self._dispatch_cars:
+                self._dispatch_cars.append(car)
+
+    def _drop_from_fleet(self, car: ElevatorCar) -> None:
+        """Removes a car from every fleet index."""
+        car.detach(self)
+        self.cars.remove(car)
+        del self._cars_by_id[car.car_id]
+        if car in self._dispatch_cars:
+            self._dispatch_cars.remove(car)
+        if car in self._retiring:
+            self._retiring.remove(car)
+        self.num_cars = len(self.cars)
+
+    def enable_journey_tracking(self, tracker: JourneyTracker = None) -> JourneyTracker:
+        """Starts recording passenger journeys for service-level KPIs.
+
+        Args:
+            tracker (JourneyTracker, optional): The tracker to record into. Defaults to a new JourneyTracker on the system clock.
+
+        Returns:
+            JourneyTracker: The active tracker.
+        """
+        self.journey_tracker = tracker if tracker else JourneyTracker(time_provider=self.time_provider)
+        return self.journey_tracker
+
+    def call_elevator(self, floor: int, direction: Direction, source: str = "local") -> Admission:
         """Registers a new elevator call request from a floor.
 
+        With admission control enabled the press is only queued, and registered by the next tick.
+
         Args:
             floor (int): The floor number from which the elevator is called.
             direction (Direction): The direction the caller wishes to go (UP or DOWN).
+            source (str, optional): Who pressed, for per-source rate limits. Defaults to "local".
+
+        Returns:
+            Admission: ADMITTED, or with admission control COALESCED, RATE_LIMITED or QUEUE_FULL.
+
+        Raises:
+            ValueError: If the floor does not exist.
         """
-        self.request_manager.add_request(floor, direction)
+        self._check_floor(floor)
+        self.activity.notify()
+        if self.call_admission is not None:
+            return self.call_admission.submit(floor, direction, source)
+        self._register_hall_call(floor, direction)
+        return Admission.ADMITTED
+
+    def call_elevator_many(self, calls, source: str = "local") -> list[Admission]:
+        """Registers a batch of hall calls, e.g. a burst of presses collected by an integration.
+
+        The batch is merged into the pending requests in one pass per direction, taking each request
+        lock once instead of once per call.
+
+        Args:
+            calls (Iterable[tuple[int, Direction]]): The (floor, direction) calls.
+            source (str, optional): Who pressed, for per-source rate limits. Defaults to "local".
+
+        Returns:
+            list[Admission]: The outcome of each call, as call_elevator() would return it.
+
+        Raises:
+            ValueError: If any floor does not exist; no call of the batch is then registered.
+        """
+        calls = list(calls)
+        for floor, _ in calls:
+            self._check_floor(floor)
+        self.activity.notify()
+        if self.call_admission is not None:
+            return self.call_admission.submit_many(calls, source)
+        self._register_hall_calls(calls)
+        return [Admission.ADMITTED] * len(calls)
+
+    def _check_floor(self, floor: int) -> None:
+        """Raises ValueError unless the floor exists, before a call changes any state."""
+        if not 0 <= floor < self.num_floors:
+            raise ValueError(f"Invalid floor: {floor}")
+
+    def _register_hall_call(self, floor: int, direction: Direction) -> None:
+        """Adds a hall call to the pending requests and lights its button."""
+        self._register_hall_calls(((floor, direction),))
+
+    def _register_hall_calls(self, calls, pressed_at: float = None) -> None:
+        """Adds a batch of hall calls to the pending requests and lights their buttons.
+
+        A dispatch window not yet open opens at pressed_at (the first press, for calls that waited in
+        the admission queue) or else now.
+        """
+        self.request_manager.add_requests(calls)
+        self.hall_calls.press_many(calls)
+        now = self.time_provider.get_time()
+        if self._batch_started is None:
+            self._batch_started = pressed_at if pressed_at is not None else now # Opens the micro-batch dispatch window
+        for floor, direction in calls:
+            self.flight_recorder.record(NO_CAR, HALL_CALL_UP if direction == Direction.UP else HALL_CALL_DOWN, floor)
+            self.event_bus.publish(HallCallRegistered(floor, direction, now))
+            if self.journey_tracker is not None:
+                self.journey_tracker.open_call(floor, direction)
+        # A car already standing at the floor with its door open holds it for the new passengers
+        open_cars = [car for car in self._dispatch_cars if car.door.get_state() == DoorState.OPEN]
+        for floor, direction in calls if open_cars else ():
+            for car in open_cars:
+                if car.is_serving_floor(floor, direction):
+                    car.open_door_and_notify()
+                    break
         # State will be saved by a higher-level orchestrator
 
-    
+    def _register_admitted_calls(self) -> None:
+        """Registers the calls admission control queued since the last tick."""
+        hall_calls, car_calls, first_pressed_at = self.call_admission.drain_timed()
+        if hall_calls:
+            self._register_hall_calls(hall_calls, first_pressed_at) # The window runs from the press, not the drain
+        for car_id, floor in car_calls:
+            if car_id in self._cars_by_id: # The car may have left the fleet since the press
+                self._register_car_call(car_id, floor)
+
+    def enable_call_admission(self, admission: CallAdmission = None) -> CallAdmission:
+        """Puts debounce, per-source rate limits and a bounded intake queue in front of call_elevator().
+
+        Args:
+            admission (CallAdmission, optional): The admission stage. Defaults to one configured from config.py.
+
+        Returns:
+            CallAdmission: The active admission stage.
+        """
+        if admission is None:
+            admission = CallAdmission(self.time_provider, CALL_DEBOUNCE_SECONDS, CALL_RATE_PER_SOURCE, CALL_BURST_PER_SOURCE,
+                                      CALL_INTAKE_QUEUE_SIZE, is_pending=self.hall_calls.is_pressed, metrics=self.metrics)
+        self.call_admission = admission
+        return self.call_admission
+
+    def dispatch_window_remaining(self) -> float:
+        """Gets how long the current micro-batch of hall calls is still held back from dispatch.
+
+        Returns:
+            float: Seconds until the calls are assigned; 0 if there is no open window.
+        """
+        if self._batch_started is None or self.dispatch_window <= 0:
+            return 0.0
+        return max(0.0, self._batch_started + self.dispatch_window - self.time_provider.get_time())
+
+    def has_pending_hall_calls(self, direction: Direction = None) -> bool:
+        """Checks, without taking any lock, whether any hall call is waiting.
+
+        Args:
+            direction (Direction, optional): Restrict to UP or DOWN calls. Defaults to both.
+
+        Returns:
+            bool: True if at least one matching hall button is lit.
+        """
+        return self.hall_calls.any_pressed(direction)
+
+    def press_car_button(self, car_id: int, floor: int, source: str = "local") -> Admission:
+        """Registers a destination chosen on a car's floor panel (a car call).
+
+        With admission control enabled the press is only queued, and registered by the next tick.
+
+        Args:
+            car_id (int): The ID of the car whose button was pressed.
+            floor (int): The destination floor.
+            source (str, optional): Who pressed, for per-source rate limits. Defaults to "local".
+
+        Returns:
+            Admission: ADMITTED, or with admission control COALESCED, RATE_LIMITED or QUEUE_FULL.
+
+        Raises:
+            ValueError: If no car has this ID or the floor does not exist.
+        """
+        self.get_car(car_id)
+        self._check_floor(floor)
+        if self.call_admission is not None:
+            admission = self.call_admission.submit_car_call(car_id, floor, source)
+        else:
+            self._register_car_call(car_id, floor)
+            admission = Admission.ADMITTED
+        self.activity.notify()
+        return admission
+
+    def _register_car_call(self, car_id: int, floor: int) -> None:
+        """Lights a car's floor button and adds the stop to the car."""
+        car = self.get_car(car_id)
+        car.panel.press_floor_button(floor)
+        car.register_request(floor)
+        self.event_bus.publish(CarCallRegistered(car_id, floor, self.time_provider.get_time()))
+        if self.journey_tracker is not None:
+            self.journey_tracker.mark_destination(car_id, floor)
+
+    def set_car_scheduler(self, car_id: int, scheduler: str) -> None:
+        """Changes the order in which a car serves its stops.
+
+        Args:
+            car_id (int): The ID of the car.
+            scheduler (str): "look", "c-look" or "stf".
+
+        Raises:
+            ValueError: If no car has this ID or the scheduler name is unknown.
+        """
+        self.get_car(car_id).set_scheduler(create_scheduler(scheduler))
+
+    def press_door_close(self, car_id: int) -> None:
+        """Handles a press of a car's door close button, ending the current stop early.
+
+        Args:
+            car_id (int): The ID of the car whose button was pressed.
+
+        Raises:
+            ValueError: If no car has this ID.
+        """
+        self.get_car(car_id).press_close_button()
+        self.activity.notify()
+
+    def report_load(self, car_id: int, boarded: int, alighted: int) -> int:
+        """Records a car's load-sensor reading at a stop: who got in and who got out.
+
+        Args:
+            car_id (int): The ID of the car.
+            boarded (int): The number of passengers who boarded.
+            alighted (int): The number of passengers who alighted.
+
+        Returns:
+            int: The car's new load.
+
+        Raises:
+            ValueError: If no car has this ID or a count is negative.
+        """
+        return self.get_car(car_id).update_load(boarded, alighted)
 
     def dispatcher(self) -> None:
-        """Dispatches elevator cars to handle pending requests based on the dispatching strategy."""
+        """Dispatches elevator cars to handle pending requests based on the dispatching strategy.
+
+        With a dispatch window set, new hall calls are not assigned until the window that opened with
+        the first of them has passed, so a burst of calls is assigned together.
+        """
+        start = time.perf_counter()
+        if self.call_admission is not None:
+            self._register_admitted_calls()
+        self.event_bus.flush() # Retire calls served since the last tick before assigning cars
+        if self.dispatch_window_remaining() > 0:
+            self._dispatch_duration.observe(time.perf_counter() - start)
+            return
+        self._batch_started = None
         self._process_requests_for_direction(self.request_manager.get_up_requests(), Direction.UP)
         self._process_requests_for_direction(self.request_manager.get_down_requests(), Direction.DOWN)
+        self._dispatch_duration.observe(time.perf_counter() - start)
 
     def _process_requests_for_direction(self, requests_list: list[int], direction: Direction) -> None:
         """Processes a list of requests for a specific direction.
@@ -165,16 +569,85 @@ class ElevatorSystem(Observer):
         """
         if requests_list:
             requests_to_process = requests_list[:]
+            opcode = DISPATCH_UP if direction == Direction.UP else DISPATCH_DOWN
             for floor in requests_to_process:
-                best_car = self.dispatching_strategy.find_best_car(self.cars, floor, direction)
+                best_car = self.dispatching_strategy.find_best_car(self._dispatch_cars, floor, direction)
                 if best_car:
+                    self.flight_recorder.record(best_car.car_id, opcode, floor)
                     best_car.register_request(floor)
+                    if self.journey_tracker is not None:
+                        self.journey_tracker.mark_assigned(floor, direction, best_car.car_id)
+
+    def publish_snapshot(self) -> FleetSnapshot:
+        """Captures the fleet into a new immutable FleetSnapshot and makes it the current one.
+
+        Called at the end of every tick. Readers on other threads only ever see complete snapshots,
+        because publishing is a single reference assignment.
+
+        Returns:
+            FleetSnapshot: The published snapshot.
+        """
+        version = self._snapshot.version + 1 if self._snapshot is not None else 0
+        snapshot = FleetSnapshot.capture(version, self.time_provider.get_time(), self.cars,
+                                         self.request_manager.get_up_requests(), self.request_manager.get_down_requests())
+        self._snapshot = snapshot
+        return snapshot
+
+    def get_snapshot(self) -> FleetSnapshot:
+        """Gets the fleet snapshot published by the latest tick. Safe to call from any thread; never locks.
+
+        Returns:
+            FleetSnapshot: The current snapshot.
+        """
+        return self._snapshot
 
     def monitoring(self) -> None:
-        """Monitors the status of all elevator cars and displays their information."""
+        """Monitors the status of all elevator cars and displays their information.
+
+        With a dashboard enabled, draws a frame of it (subject to its frame cap) instead of printing
+        every car's display.
+        """
+        if self.dashboard is not None:
+            self.dashboard.render(self.cars, self.request_manager.up_requests, self.request_manager.down_requests)
+            return
         for car in self.cars:
             car.show_display()
 
+    def enable_dashboard(self, dashboard: TerminalDashboard = None) -> TerminalDashboard:
+        """Replaces the per-tick display prints with a diff-based terminal dashboard.
+
+        Args:
+            dashboard (TerminalDashboard, optional): The dashboard to draw. Defaults to a new TerminalDashboard on stdout.
+
+        Returns:
+            TerminalDashboard: The active dashboard.
+        """
+        self.dashboard = dashboard if dashboard else TerminalDashboard()
+        return self.dashboard
+
+    def enable_telemetry(self, store: TelemetryStore) -> TelemetryStore:
+        """Starts appending every car's per-tick telemetry to a columnar history store.
+
+        Args:
+            store (TelemetryStore): The store to record into.
+
+        Returns:
+            TelemetryStore: The active store.
+        """
+        self.telemetry = store
+        return self.telemetry
+
+    def _record_telemetry(self, snapshot: FleetSnapshot) -> None:
+        """Appends the tick described by a freshly published snapshot to the telemetry store."""
+        self.telemetry.record_tick(snapshot.timestamp, self.cars,
+                                   len(snapshot.pending_up_calls), len(snapshot.pending_down_calls))
+
+    def disable_dashboard(self) -> None:
+        """Restores the per-car display prints, leaving the cursor below the last dashboard frame."""
+        if self.dashboard is not None:
+            self.dashboard.close()
+        self.dashboard = None
+
     def update(self, subject: Subject, event: str, data: dict = None) -> None:
         """Receives updates from observed elevator cars (e.g., when a request is fulfilled).
 
@@ -184,15 +657,159 @@ class ElevatorSystem(Observer):
             data (dict, optional): Additional data related to the event. Defaults to None.
         """
         if event == "request_fulfilled":
-            floor = data["floor"]
-            # Determine direction based on car's current direction or request type if available
-            # For simplicity, assuming the fulfilled request was either an UP or DOWN request
-            # This might need refinement based on how requests are tracked in ElevatorCar
-            # For now, we'll try to remove from both, and RequestManager will handle if it exists.
-            self.request_manager.remove_request(floor, Direction.UP)
-            self.request_manager.remove_request(floor, Direction.DOWN)
+            self._on_requests_fulfilled([RequestFulfilled(subject.get_id(), data["floor"], self.time_provider.get_time())])
             # State will be saved by a higher-level orchestrator
 
+    def _on_requests_fulfilled(self, events: list[RequestFulfilled]) -> None:
+        """Retires the hall calls at every floor where a car opened its door.
+
+        The car's direction is not part of the event, so both directions are cleared at each floor.
+
+        Args:
+            events (list[RequestFulfilled]): The batch of fulfilment events, in publish order.
+        """
+        floors = {} # floor -> time the first door opened there
+        for event in events:
+            self.flight_recorder.record(event.car_id, HALL_CALLS_CLEARED, event.floor)
+            floors.setdefault(event.floor, event.timestamp)
+        self.request_manager.remove_requests_at(floors)
+        for floor in floors:
+            self.hall_calls.clear_floor(floor)
+        if self.journey_tracker is not None:
+            for event in events:
+                self.journey_tracker.record_door_open(event.floor, event.car_id)
+
+    def enable_profiling(self, profiler: TickProfiler = None) -> TickProfiler:
+        """Turns on per-phase tick timing and sampled cProfile captures.
+
+        Args:
+            profiler (TickProfiler, optional): The profiler to use. Defaults to a new TickProfiler.
+
+        Returns:
+            TickProfiler: The active profiler.
+        """
+        self.profiler = profiler if profiler else TickProfiler()
+        return self.profiler
+
+    def disable_profiling(self) -> None:
+        """Turns tick profiling off."""
+        self.profiler = None
+
+    def is_quiescent(self) -> bool:
+        """Checks whether a tick would change nothing: no call is waiting anywhere and every car is
+        at rest with its door closed.
+
+        Returns:
+            bool: True if the control loop can sleep until the next activity.
+        """
+        if (self.request_manager.up_requests or self.request_manager.down_requests or self._retiring
+                or self._batch_started is not None or self.event_bus.pending_count()):
+            return False
+        if self.call_admission is not None and self.call_admission.pending():
+            return False
+        for car in self.cars:
+            if (car.up_requests or car.down_requests or car.door.get_state() != DoorState.CLOSED
+                    or (car.state is not IDLE and car.state is not MAINTENANCE)):
+                return False
+        return True
+
+    def notify_activity(self) -> None:
+        """Wakes a control loop sleeping in wait_for_activity(), e.g. for an external timer or maintenance action.
+
+        Calls, car-button and door-close presses and fleet changes already notify it.
+        """
+        self.activity.notify()
+
+    def wait_for_activity(self, timeout: float = None) -> bool:
+        """Blocks the calling (main loop) thread until there is activity or the timeout passes.
+
+        Returns at once if there was activity since the start of the last tick, so a call made while
+        the last tick ran is never slept through.
+
+        Args:
+            timeout (float, optional): The longest wait in seconds. Defaults to waiting indefinitely.
+
+        Returns:
+            bool: True if woken by activity, False if the timeout passed first.
+        """
+        return self.activity.wait(timeout)
+
+    def _save_state_unless_idle(self) -> None:
+        """Saves the state, except on ticks where the fleet is still as quiescent as when it was last saved."""
+        quiescent = self.is_quiescent()
+        if not (quiescent and self._idle_saved):
+            self.save_state()
+        self._idle_saved = quiescent
+
+    def tick(self) -> None:
+        """Runs one step of the control loop: dispatch, move every car, monitor and persist.
+
+        Saving is skipped on ticks where the fleet stays quiescent and its state was already saved.
+        With profiling enabled each phase is timed; otherwise the phase hooks are no-ops.
+        """
+        profiler = self.profiler if self.profiler is not None else NULL_PROFILER
+        start = time.perf_counter()
+        profile = profiler.begin_tick()
+        try:
+            if self.activity.clear():
+                self._idle_saved = False # Something may have changed outside the tick; save at least once more
+            self.dispatcher()
+            mark = profiler.lap("dispatcher", start)
+            for car in self.cars:
+                car.move()
+                mark = profiler.lap_car_move(car.car_id, mark)
+            self.event_bus.flush()
+            if self._retiring:
+                self._finish_retirements()
+            mark = profiler.lap("events", mark)
+            self.monitoring()
+            mark = profiler.lap("monitoring", mark)
+            self._save_state_unless_idle()
+            mark = profiler.lap("save_state", mark)
+            snapshot = self.publish_snapshot()
+            mark = profiler.lap("snapshot", mark)
+            if self.telemetry is not None:
+                self._record_telemetry(snapshot)
+                profiler.lap("telemetry", mark)
+            self._pending_up_calls.set(len(self.request_manager.up_requests))
+            self._pending_down_calls.set(len(self.request_manager.down_requests))
+        finally:
+            # Always ends the tick, so a failing tick never leaves its cProfile sample running
+            duration = time.perf_counter() - start
+            profiler.end_tick(profile, duration)
+        self._tick_duration.observe(duration)
+
+    def load_persisted_state(self) -> int:
+        """Re-reads hall calls and car states from the database, applying only what changed.
+
+        Used by a hot standby to keep this system a warm replica of the primary controller.
+
+        Returns:
+            int: The number of cars whose state changed.
+
+        Raises:
+            ValueError: If a persisted hall call is for a floor that does not exist; nothing is applied then.
+        """
+        requests = self.database_manager.load_system_requests()
+        for floor, _ in requests:
+            self._check_floor(floor)
+        if self.request_manager.apply_persisted_requests(requests):
+            self.hall_calls.reset(requests)
+        car_ids = self.database_manager.load_car_ids()
+        if car_ids: # Follow cars the primary added or retired
+            for car in [car for car in self.cars if car.car_id not in car_ids]:
+                self._drop_from_fleet(car)
+            for car_id in car_ids:
+                if car_id not in self._cars_by_id:
+                    self._add_to_fleet(car_id)
+        changed = 0
+        for car in self.cars:
+            if car.apply_persisted_state(self.database_manager.load_car_state(car.car_id),
+                                         self.database_manager.load_car_requests(car.car_id)):
+                changed += 1
+                self._track_retirement(car) # Follow cars the primary started retiring
+        return changed
+
     def save_state(self) -> None:
         """Explicitly saves the entire system state to the database."""
         self.database_manager.save_system_state(self.num_floors, self.num_cars)
@@ -13,3 +13,10 @@ class DoorState(Enum):
     CLOSED = 2
 
 
+
+class Admission(Enum):
+    """Represents the outcome of offering a hall call press to admission control."""
+    ADMITTED = 1
+    COALESCED = 2
+    RATE_LIMITED = 3
+    QUEUE_FULL = 4
@@ -0,0 +1,148 @@
+import logging
+import queue
+from dataclasses import dataclass
+from threading import Lock, Thread
+from typing import Callable, ClassVar
+from enums import Direction
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class Event:
+    """Base class for events published on the EventBus. Each subclass names its topic."""
+    topic: ClassVar[str] = "event"
+
+
+@dataclass(frozen=True, slots=True)
+class HallCallRegistered(Event):
+    """A hall call was made from a floor."""
+    topic: ClassVar[str] = "hall_call_registered"
+    floor: int
+    direction: Direction
+    timestamp: float
+
+
+@dataclass(frozen=True, slots=True)
+class CarCallRegistered(Event):
+    """A destination button was pressed inside a car."""
+    topic: ClassVar[str] = "car_call_registered"
+    car_id: int
+    floor: int
+    timestamp: float
+
+
+@dataclass(frozen=True, slots=True)
+class RequestFulfilled(Event):
+    """A car opened its door at a floor, serving the requests there."""
+    topic: ClassVar[str] = "request_fulfilled"
+    car_id: int
+    floor: int
+    timestamp: float
+
+
+class EventBus:
+    """Topic-based publish/subscribe with batched delivery.
+
+    publish() only appends the event to a pending list, so it is cheap enough to call from the
+    movement path. flush() (run by ElevatorSystem once per tick) groups pending events by topic and
+    hands each subscriber the whole batch. Synchronous subscribers run inside flush(); asynchronous
+    ones receive their batches on a background worker thread and never delay the control loop.
+    """
+    def __init__(self) -> None:
+        """Initializes an EventBus with no subscribers and no pending events."""
+        self._subscribers = {} # topic -> list of (handler, asynchronous)
+        self._pending = []
+        self._lock = Lock()
+        self._queue = None # Created with the worker thread on the first asynchronous subscription
+        self._worker = None
+
+    def subscribe(self, topic: str, handler: Callable[[list[Event]], None], asynchronous: bool = False) -> None:
+        """Subscribes a handler to a topic.
+
+        Args:
+            topic (str): The topic, e.g. RequestFulfilled.topic.
+            handler (Callable[[list[Event]], None]): Called with each batch of events on the topic, in publish order.
+            asynchronous (bool, optional): Deliver batches on the background worker thread. Defaults to False.
+        """
+        self._subscribers.setdefault(topic, []).append((handler, asynchronous))
+        if asynchronous and self._worker is None:
+            self._queue = queue.Queue()
+            self._worker = Thread(target=self._run_worker, name="event-bus", daemon=True)
+            self._worker.start()
+
+    def unsubscribe(self, topic: str, handler: Callable[[list[Event]], None]) -> None:
+        """Removes a handler from a topic.
+
+        Args:
+            topic (str): The topic.
+            handler (Callable[[list[Event]], None]): The handler to remove.
+        """
+        self._subscribers[topic] = [entry for entry in self._subscribers.get(topic, []) if entry[0] != handler]
+
+    def publish(self, event: Event) -> None:
+        """Queues an event for delivery at the next flush.
+
+        Args:
+            event (Event): The event.
+        """
+        with self._lock:
+            self._pending.append(event)
+
+    def pending_count(self) -> int:
+        """Returns the number of events published since the last flush."""
+        return len(self._pending)
+
+    def flush(self) -> int:
+        """Delivers every pending event, batched per topic.
+
+        Returns:
+            int: The number of events delivered.
+        """
+        with self._lock:
+            if not self._pending:
+                return 0
+            pending, self._pending = self._pending, []
+        batches = {}
+        for event in pending:
+            batches.setdefault(event.topic, []).append(event)
+        for topic, batch in batches.items():
+            for handler, asynchronous in self._subscribers.get(topic, ()):
+                if asynchronous:
+                    self._queue.put((handler, batch))
+                else:
+                    self._deliver(handler, batch)
+        return len(pending)
+
+    @staticmethod
+    def _deliver(handler: Callable[[list[Event]], None], batch: list[Event]) -> None:
+        """Calls a handler, logging rather than propagating its errors."""
+        try:
+            handler(batch)
+        except Exception:
+            logger.exception("Event handler %r failed on %d event(s)", handler, len(batch))
+
+    def _run_worker(self) -> None:
+        """Delivers queued batches to asynchronous subscribers until close() is called."""
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._deliver(*item)
+            finally:
+                self._queue.task_done()
+
+    def join(self) -> None:
+        """Blocks until every batch handed to asynchronous subscribers has been delivered."""
+        if self._queue is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        """Delivers what is pending, then stops the background worker."""
+        self.flush()
+        if self._worker is not None:
+            self._queue.put(None)
+            self._worker.join()
+            self._worker = None
+            self._queue = None
@@ -0,0 +1,95 @@
+from dataclasses import dataclass
+from enums import Direction, DoorState
+
+
+@dataclass(frozen=True, slots=True)
+class CarSnapshot:
+    """The state of one car at the end of a tick."""
+    car_id: int
+    floor: int
+    direction: Direction
+    state: str
+    door_state: DoorState
+    up_requests: tuple[int, ...]
+    down_requests: tuple[int, ...]
+    position: float | None = None # Shaft position in metres for kinematic cars, else None
+    load: int = 0 # Passengers aboard
+
+
+@dataclass(frozen=True, slots=True)
+class FleetSnapshot:
+    """An immutable, versioned view of the whole fleet, published by ElevatorSystem after every tick.
+
+    Snapshots are never modified once built; the system replaces its reference with a new one, so a
+    reader holding a snapshot sees one consistent tick without taking any lock.
+    """
+    version: int
+    timestamp: float
+    cars: tuple[CarSnapshot, ...]
+    pending_up_calls: tuple[int, ...]
+    pending_down_calls: tuple[int, ...]
+
+    @classmethod
+    def capture(cls, version: int, timestamp: float, cars: list, up_calls: list[int], down_calls: list[int]) -> 'FleetSnapshot':
+        """Builds a snapshot from the live cars and hall calls. Must run on the thread that drives the cars.
+
+        Args:
+            version (int): The snapshot's sequence number.
+            timestamp (float): The time of capture.
+            cars (list): The ElevatorCar instances.
+            up_calls (list[int]): The pending up hall calls.
+            down_calls (list[int]): The pending down hall calls.
+
+        Returns:
+            FleetSnapshot: The new snapshot.
+        """
+        return cls(
+            version=version,
+            timestamp=timestamp,
+            cars=tuple(CarSnapshot(car_id=car.car_id,
+                                   floor=car.current_floor,
+                                   direction=car.direction,
+                                   state=car.state.__class__.__name__,
+                                   door_state=car.door.get_state(),
+                                   up_requests=tuple(car.up_requests),
+                                   down_requests=tuple(car.down_requests),
+                                   position=car.motion.position if car.motion is not None else None,
+                                   load=car.load)
+                       for car in cars),
+            pending_up_calls=tuple(up_calls),
+            pending_down_calls=tuple(down_calls),
+        )
+
+    def to_dict(self) -> dict:
+        """Converts the snapshot to plain JSON-ready values, with enums as their names.
+
+        Returns:
+            dict: The snapshot's fields, with "cars" as a list of per-car dicts.
+        """
+        return {
+            "version": self.version,
+            "timestamp": self.timestamp,
+            "cars": [{"car_id": car.car_id, "floor": car.floor, "direction": car.direction.name, "state": car.state,
+                      "door_state": car.door_state.name, "up_requests": list(car.up_requests),
+                      "down_requests": list(car.down_requests), "position": car.position, "load": car.load}
+                     for car in self.cars],
+            "pending_up_calls": list(self.pending_up_calls),
+            "pending_down_calls": list(self.pending_down_calls),
+        }
+
+    def get_car(self, car_id: int) -> CarSnapshot:
+        """Gets the snapshot of one car.
+
+        Args:
+            car_id (int): The ID of the car.
+
+        Returns:
+            CarSnapshot: The car's state in this snapshot.
+
+        Raises:
+            ValueError: If no car has this ID.
+        """
+        for car in self.cars:
+            if car.car_id == car_id:
+                return car
+        raise ValueError(f"Unknown elevator car: {car_id}")
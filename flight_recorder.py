@@ -0,0 +1,223 @@
+"""Always-on binary flight recorder for post-incident analysis.
+
+Records every executed car Command, dispatch decision and hall-call change as a fixed-size packed
+record (timestamp, car id, opcode, argument) in a preallocated ring buffer, overwriting the oldest
+records when full. The buffer can be dumped to a file on demand, on a signal or on an uncaught
+exception, and decoded with:
+
+    python3 flight_recorder.py flight_recorder.bin [--car N] [--tail N]
+"""
+import argparse
+import itertools
+import os
+import struct
+import sys
+import threading
+import time
+from enums import Direction
+from commands import Command
+from elevator_state import STATES_BY_CODE
+
+RECORD = struct.Struct('<dHHi') # timestamp, car id, opcode, argument: 16 bytes, so offsets are index << 4
+HEADER = struct.Struct('<8sIIQ') # magic, record size, capacity, records written
+MAGIC = b'ELEVFR01'
+NO_CAR = 0xFFFF # Car id of system-level records
+NO_ARG = -1
+
+# Opcodes beyond the Command range
+DISPATCH_UP = 32 # Hall call (arg = floor) assigned to a car
+DISPATCH_DOWN = 33
+HALL_CALL_UP = 34 # Hall call registered (arg = floor)
+HALL_CALL_DOWN = 35
+HALL_CALLS_CLEARED = 36 # Hall calls at a floor (arg) served by a car
+
+OPCODE_NAMES = {command.value: command.name for command in Command}
+OPCODE_NAMES.update({DISPATCH_UP: "DISPATCH_UP", DISPATCH_DOWN: "DISPATCH_DOWN", HALL_CALL_UP: "HALL_CALL_UP",
+                     HALL_CALL_DOWN: "HALL_CALL_DOWN", HALL_CALLS_CLEARED: "HALL_CALLS_CLEARED"})
+
+# Integer encodings of commands and their non-integer arguments, keyed by id(): these objects are
+# long-lived singletons, and hashing an id is several times cheaper than hashing or converting an Enum.
+_CODES = {id(None): NO_ARG}
+_CODES.update({id(command): command.value for command in Command})
+_CODES.update({id(direction): direction.value for direction in Direction})
+_CODES.update({id(state): state.code for state in STATES_BY_CODE})
+
+
+class FlightRecorder:
+    """A fixed-size ring buffer of packed binary records.
+
+    Recording is one counter increment, one clock read and one struct.pack_into into a preallocated
+    bytearray, so it can stay enabled on the control path.
+    """
+    def __init__(self, capacity: int = 262144, clock=time.time) -> None:
+        """Initializes a FlightRecorder.
+
+        Args:
+            capacity (int, optional): Number of records kept; older records are overwritten. Defaults to 262144 (4 MiB).
+            clock (callable, optional): Returns the timestamp of each record. Defaults to time.time.
+        """
+        self.capacity = max(1, capacity)
+        self.clock = clock
+        self._buffer = bytearray(RECORD.size * self.capacity)
+        self._counter = itertools.count() # next() is atomic, so concurrent writers get distinct slots
+        self._written = 0
+        self._pack_into = RECORD.pack_into
+
+    def __len__(self) -> int:
+        """Returns the number of records currently held."""
+        return min(self._written, self.capacity)
+
+    def record(self, car_id: int, opcode: int, arg: int = NO_ARG) -> None:
+        """Appends a record, overwriting the oldest one when the buffer is full.
+
+        Args:
+            car_id (int): The car the record concerns, or NO_CAR.
+            opcode (int): A Command value or one of the module's extra opcodes.
+            arg (int, optional): The integer argument. Defaults to NO_ARG.
+        """
+        index = next(self._counter)
+        self._pack_into(self._buffer, (index % self.capacity) << 4, self.clock(), car_id, opcode, arg)
+        self._written = index + 1
+
+    def record_command(self, car_id: int, command: Command, arg: object) -> None:
+        """Records an executed car command, encoding direction and state arguments as integers.
+
+        Args:
+            car_id (int): The car executing the command.
+            command (Command): The command.
+            arg (object): The command's argument: None, a floor, a Direction or an ElevatorState.
+        """
+        codes = _CODES
+        index = next(self._counter) # Inlined record(): this runs for every command a car executes
+        self._pack_into(self._buffer, (index % self.capacity) << 4, self.clock(), car_id,
+                        codes.get(id(command), command), codes.get(id(arg), arg))
+        self._written = index + 1
+
+    def to_bytes(self) -> bytes:
+        """Returns the held records, oldest first, as packed bytes."""
+        written = self._written
+        if written <= self.capacity:
+            return bytes(self._buffer[:written * RECORD.size])
+        split = (written % self.capacity) * RECORD.size
+        return bytes(self._buffer[split:] + self._buffer[:split])
+
+    def dump(self, path: str) -> None:
+        """Atomically writes the held records to a file.
+
+        Args:
+            path (str): The destination file path.
+        """
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, RECORD.size, self.capacity, self._written))
+            f.write(self.to_bytes())
+        os.replace(tmp_path, path)
+
+
+def decode(data: bytes):
+    """Decodes packed records.
+
+    Args:
+        data (bytes): Records as produced by FlightRecorder.to_bytes().
+
+    Yields:
+        tuple[float, int, int, int]: (timestamp, car id, opcode, argument) per record.
+    """
+    yield from RECORD.iter_unpack(data[:len(data) - len(data) % RECORD.size])
+
+
+def read_dump(path: str):
+    """Decodes a file written by FlightRecorder.dump().
+
+    Args:
+        path (str): The dump file path.
+
+    Yields:
+        tuple[float, int, int, int]: (timestamp, car id, opcode, argument) per record, oldest first.
+
+    Raises:
+        ValueError: If the file is not a flight recorder dump.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    magic, record_size, _, _ = HEADER.unpack_from(data)
+    if magic != MAGIC or record_size != RECORD.size:
+        raise ValueError(f"{path} is not a flight recorder dump")
+    yield from decode(data[HEADER.size:])
+
+
+def format_record(record: tuple[float, int, int, int]) -> str:
+    """Formats a decoded record as one line of text.
+
+    Args:
+        record (tuple[float, int, int, int]): A decoded (timestamp, car id, opcode, argument) record.
+
+    Returns:
+        str: The formatted line.
+    """
+    timestamp, car_id, opcode, arg = record
+    car = "-" if car_id == NO_CAR else str(car_id)
+    name = OPCODE_NAMES.get(opcode, f"OP_{opcode}")
+    return f"{timestamp:.6f} car={car:>3} {name:<20} {'' if arg == NO_ARG else arg}".rstrip()
+
+
+def install_crash_dump(recorder: FlightRecorder, path: str) -> None:
+    """Dumps the recorder whenever an uncaught exception reaches the top of any thread.
+
+    Args:
+        recorder (FlightRecorder): The recorder to dump.
+        path (str): The dump file path.
+    """
+    previous_hook = sys.excepthook
+    previous_thread_hook = threading.excepthook
+
+    def excepthook(exc_type, exc_value, exc_traceback):
+        recorder.dump(path)
+        previous_hook(exc_type, exc_value, exc_traceback)
+
+    def thread_excepthook(args):
+        recorder.dump(path)
+        previous_thread_hook(args)
+
+    sys.excepthook = excepthook
+    threading.excepthook = thread_excepthook
+
+
+def install_signal_dump(recorder: FlightRecorder, path: str, signum: int = None) -> bool:
+    """Dumps the recorder on demand when the process receives a signal (SIGUSR1 by default).
+
+    Args:
+        recorder (FlightRecorder): The recorder to dump.
+        path (str): The dump file path.
+        signum (int, optional): The signal number. Defaults to SIGUSR1.
+
+    Returns:
+        bool: False if the platform has no such signal.
+    """
+    import signal
+    signum = signum if signum is not None else getattr(signal, "SIGUSR1", None)
+    if signum is None:
+        return False
+    signal.signal(signum, lambda received, frame: recorder.dump(path))
+    return True
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Decode an elevator flight recorder dump.")
+    parser.add_argument("path", help="Dump file written by FlightRecorder.dump().")
+    parser.add_argument("--car", type=int, help="Only show records for this car.")
+    parser.add_argument("--tail", type=int, help="Only show the last N records.")
+    args = parser.parse_args()
+
+    records = read_dump(args.path)
+    if args.car is not None:
+        records = (record for record in records if record[1] == args.car)
+    records = list(records)
+    if args.tail is not None:
+        records = records[-args.tail:]
+    for record in records:
+        print(format_record(record))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,25 @@
-from elevator_panel import HallPanel
+from elevator_panel import HallPanel, HallCallBoard
 from display import Display
 from observer import Subject
 from elevator_component_factory import ElevatorComponentFactory # Import the new factory
 
 class Floor:
     """Represents a floor in the building, including its hall panel and display."""
-    def __init__(self, floor_number: int, top_floor: int, factory: ElevatorComponentFactory = None) -> None:
+    __slots__ = ("floor_number", "factory", "panel", "display")
+
+    def __init__(self, floor_number: int, top_floor: int, factory: ElevatorComponentFactory = None,
+                 hall_call_board: HallCallBoard = None) -> None:
         """Initializes a new Floor instance.
 
         Args:
             floor_number (int): The number of this floor.
             top_floor (int): The highest floor number in the building.
+            factory (ElevatorComponentFactory, optional): The factory for the floor's components.
+            hall_call_board (HallCallBoard, optional): The building-wide hall button state. Defaults to a private board.
         """
         self.floor_number = floor_number
         self.factory = factory if factory else ElevatorComponentFactory() # Store the factory
-        self.panel = self.factory.create_hall_panel(floor_number, top_floor)
+        self.panel = self.factory.create_hall_panel(floor_number, top_floor, hall_call_board)
         self.display = self.factory.create_floor_display()
 
     def get_floor_number(self) -> int:
@@ -40,3 +45,71 @@ class Floor:
             Display: The Display instance for this floor.
         """
         return self.display
+
+
+class FloorDirectory:
+    """A lazily populated, sparse sequence of a building's floors.
+
+    Floors are only constructed the first time they are indexed, and then cached. Hall button state
+    for every floor already lives in the building-wide HallCallBoard, so an unvisited floor costs
+    nothing but its bits there; startup and memory scale with the floors actually used.
+    """
+    __slots__ = ("num_floors", "factory", "hall_call_board", "_floors")
+
+    def __init__(self, num_floors: int, factory: ElevatorComponentFactory = None,
+                 hall_call_board: HallCallBoard = None) -> None:
+        """Initializes a FloorDirectory without constructing any floors.
+
+        Args:
+            num_floors (int): The total number of floors in the building.
+            factory (ElevatorComponentFactory, optional): The factory shared by every floor. Defaults to a new ElevatorComponentFactory.
+            hall_call_board (HallCallBoard, optional): The building-wide hall button state. Defaults to a new HallCallBoard.
+        """
+        self.num_floors = num_floors
+        self.factory = factory if factory else ElevatorComponentFactory()
+        self.hall_call_board = hall_call_board if hall_call_board else HallCallBoard()
+        self._floors = {}
+
+    def __len__(self) -> int:
+        """Returns the number of floors in the building, materialized or not."""
+        return self.num_floors
+
+    def __getitem__(self, floor_number: int) -> Floor:
+        """Returns a floor, constructing it on first access.
+
+        Args:
+            floor_number (int): The floor number; negative numbers count from the top as for a list.
+
+        Returns:
+            Floor: The Floor instance.
+
+        Raises:
+            IndexError: If the floor does not exist.
+        """
+        floor = self._floors.get(floor_number)
+        if floor is not None:
+            return floor
+        if floor_number < 0:
+            floor_number += self.num_floors
+        if not 0 <= floor_number < self.num_floors:
+            raise IndexError(f"Floor {floor_number} does not exist")
+        floor = self._floors.get(floor_number)
+        if floor is None:
+            floor = Floor(floor_number, self.num_floors, self.factory, self.hall_call_board)
+            self._floors[floor_number] = floor
+        return floor
+
+    def is_materialized(self, floor_number: int) -> bool:
+        """Checks whether a floor has been constructed yet.
+
+        Args:
+            floor_number (int): The floor number.
+
+        Returns:
+            bool: True if the Floor object exists.
+        """
+        return floor_number in self._floors
+
+    def materialized_count(self) -> int:
+        """Returns the number of Floor objects constructed so far."""
+        return len(self._floors)
@@ -0,0 +1,225 @@
+import math
+from array import array
+from enums import Direction
+from time_provider import TimeProvider
+
+_UNSET = float('nan')
+_NO_FLOOR = -1
+
+
+def _summarize(samples: list[float]) -> dict:
+    """Reduces a list of durations to count, mean, percentiles and max.
+
+    Args:
+        samples (list[float]): The durations in seconds.
+
+    Returns:
+        dict: A dict with "count", "mean", "p50", "p90", "p95" and "max".
+    """
+    samples = sorted(samples)
+    count = len(samples)
+
+    def percentile(p: float) -> float:
+        return samples[min(count - 1, max(0, math.ceil(p * count) - 1))]
+
+    return {
+        "count": count,
+        "mean": sum(samples) / count,
+        "p50": percentile(0.50),
+        "p90": percentile(0.90),
+        "p95": percentile(0.95),
+        "max": samples[-1],
+    }
+
+
+class JourneyTracker:
+    """Tracks each passenger journey from hall call to arrival, in compact column arrays.
+
+    Every hall call opens one record. The record is stamped when a car is first assigned, when a car
+    opens its door at the origin floor (pickup), and when the car opens its door at the destination
+    chosen with a car button (arrival). Records live in parallel preallocated `array` columns indexed
+    by record number rather than in per-passenger objects; unset timestamps are NaN.
+    """
+    def __init__(self, capacity: int = 4096, time_provider: TimeProvider = None) -> None:
+        """Initializes a JourneyTracker.
+
+        Args:
+            capacity (int, optional): Number of records to preallocate; the columns double when full. Defaults to 4096.
+            time_provider (TimeProvider, optional): The clock used to stamp records. Defaults to TimeProvider().
+        """
+        self.time_provider = time_provider if time_provider else TimeProvider()
+        self._capacity = max(1, capacity)
+        self._size = 0
+        self.created_at = array('d', [_UNSET]) * self._capacity
+        self.assigned_at = array('d', [_UNSET]) * self._capacity
+        self.picked_up_at = array('d', [_UNSET]) * self._capacity
+        self.arrived_at = array('d', [_UNSET]) * self._capacity
+        self.origin = array('i', [_NO_FLOOR]) * self._capacity
+        self.destination = array('i', [_NO_FLOOR]) * self._capacity
+        self.car = array('i', [-1]) * self._capacity
+        self.direction = array('b', [0]) * self._capacity
+        # Open records only: (floor, direction) -> waiting record numbers, car_id -> riding record numbers
+        self._waiting = {}
+        self._riding = {}
+
+    def __len__(self) -> int:
+        """Returns the number of records."""
+        return self._size
+
+    def _grow(self) -> None:
+        """Doubles the capacity of every column."""
+        extra = self._capacity
+        for column, fill in ((self.created_at, _UNSET), (self.assigned_at, _UNSET), (self.picked_up_at, _UNSET),
+                             (self.arrived_at, _UNSET), (self.origin, _NO_FLOOR), (self.destination, _NO_FLOOR),
+                             (self.car, -1), (self.direction, 0)):
+            column.extend(array(column.typecode, [fill]) * extra)
+        self._capacity += extra
+
+    def open_call(self, floor: int, direction: Direction) -> int:
+        """Opens a record for a new hall call.
+
+        Args:
+            floor (int): The floor the call was made from.
+            direction (Direction): The requested direction (UP or DOWN).
+
+        Returns:
+            int: The record number.
+        """
+        if self._size == self._capacity:
+            self._grow()
+        record = self._size
+        self._size += 1
+        self.created_at[record] = self.time_provider.get_time()
+        self.origin[record] = floor
+        self.direction[record] = direction.value
+        self._waiting.setdefault((floor, direction), []).append(record)
+        return record
+
+    def mark_assigned(self, floor: int, direction: Direction, car_id: int) -> None:
+        """Stamps the first car assignment for the calls waiting at a floor.
+
+        Args:
+            floor (int): The floor of the hall call.
+            direction (Direction): The direction of the hall call.
+            car_id (int): The car the dispatcher assigned.
+        """
+        waiting = self._waiting.get((floor, direction))
+        if not waiting:
+            return
+        now = self.time_provider.get_time()
+        for record in waiting:
+            if math.isnan(self.assigned_at[record]):
+                self.assigned_at[record] = now
+                self.car[record] = car_id
+
+    def mark_pickup(self, floor: int, car_id: int) -> None:
+        """Stamps the pickup of every call waiting at a floor where a car opened its door.
+
+        Args:
+            floor (int): The floor where the door opened.
+            car_id (int): The car that opened its door.
+        """
+        now = None
+        for direction in (Direction.UP, Direction.DOWN):
+            waiting = self._waiting.pop((floor, direction), None)
+            if not waiting:
+                continue
+            if now is None:
+                now = self.time_provider.get_time()
+            riding = self._riding.setdefault(car_id, [])
+            for record in waiting:
+                self.picked_up_at[record] = now
+                self.car[record] = car_id
+                riding.append(record)
+
+    def mark_destination(self, car_id: int, floor: int) -> None:
+        """Assigns a car-button destination to the longest-riding passenger without one.
+
+        Args:
+            car_id (int): The car whose button was pressed.
+            floor (int): The destination floor.
+        """
+        for record in self._riding.get(car_id, ()):
+            if self.destination[record] == _NO_FLOOR:
+                self.destination[record] = floor
+                return
+
+    def mark_arrival(self, floor: int, car_id: int) -> None:
+        """Stamps the arrival of every rider in a car whose destination is this floor.
+
+        Riders who boarded at an earlier stop but never pressed a car button are dropped from the car.
+
+        Args:
+            floor (int): The floor where the door opened.
+            car_id (int): The car that opened its door.
+        """
+        riding = self._riding.get(car_id)
+        if not riding:
+            return
+        now = self.time_provider.get_time()
+        remaining = []
+        for record in riding:
+            destination = self.destination[record]
+            if destination == floor:
+                self.arrived_at[record] = now
+            elif destination != _NO_FLOOR or self.picked_up_at[record] >= now:
+                remaining.append(record)
+            # Otherwise the rider boarded at an earlier stop and never chose a floor: stop tracking them.
+        self._riding[car_id] = remaining
+
+    def record_door_open(self, floor: int, car_id: int) -> None:
+        """Handles a car opening its door: riders bound for this floor alight, then waiting callers board.
+
+        Args:
+            floor (int): The floor where the door opened.
+            car_id (int): The car that opened its door.
+        """
+        self.mark_arrival(floor, car_id)
+        self.mark_pickup(floor, car_id)
+
+    def _group_key(self, record: int, group_by: str) -> int:
+        """Returns the rollup key of a record: its origin floor or its hour of day (UTC)."""
+        if group_by == "floor":
+            return self.origin[record]
+        if group_by == "hour":
+            return int(self.created_at[record] // 3600) % 24
+        raise ValueError(f"Unknown group_by: {group_by}")
+
+    def _distribution(self, end_column: array, group_by: str) -> dict[int, dict]:
+        """Groups durations from creation to the given end stamp and summarizes each group."""
+        groups = {}
+        created_at = self.created_at
+        for record in range(self._size):
+            end = end_column[record]
+            if math.isnan(end):
+                continue
+            groups.setdefault(self._group_key(record, group_by), []).append(end - created_at[record])
+        return {key: _summarize(samples) for key, samples in sorted(groups.items())}
+
+    def wait_time_distribution(self, group_by: str = "floor") -> dict[int, dict]:
+        """Summarizes wait time (hall call to pickup) per origin floor or per hour.
+
+        Args:
+            group_by (str, optional): "floor" or "hour". Defaults to "floor".
+
+        Returns:
+            dict[int, dict]: Maps each floor or hour to count, mean, p50, p90, p95 and max in seconds.
+
+        Raises:
+            ValueError: If group_by is not "floor" or "hour".
+        """
+        return self._distribution(self.picked_up_at, group_by)
+
+    def journey_time_distribution(self, group_by: str = "floor") -> dict[int, dict]:
+        """Summarizes journey time (hall call to arrival at destination) per origin floor or per hour.
+
+        Args:
+            group_by (str, optional): "floor" or "hour". Defaults to "floor".
+
+        Returns:
+            dict[int, dict]: Maps each floor or hour to count, mean, p50, p90, p95 and max in seconds.
+
+        Raises:
+            ValueError: If group_by is not "floor" or "hour".
+        """
+        return self._distribution(self.arrived_at, group_by)
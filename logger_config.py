@@ -1,12 +1,46 @@
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from config import LOG_LEVEL, LOG_LEVELS, LOG_QUEUE_ENABLED, LOG_FILE
 
-def setup_logging():
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler()
-        ]
-    )
-    # Optional: Set specific levels for certain loggers
-    logging.getLogger('sqlite3').setLevel(logging.WARNING)
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+def setup_logging(use_queue: bool = LOG_QUEUE_ENABLED, level: str = LOG_LEVEL,
+                  levels: dict[str, str] = None, log_file: str = LOG_FILE) -> QueueListener | None:
+    """Configures the root logger and per-subsystem levels.
+
+    In queue mode the root logger only gets a QueueHandler, which enqueues records without doing any
+    I/O; a QueueListener thread formats them and writes to the terminal (and log file). This keeps
+    slow terminals and disks from blocking a tick.
+
+    Args:
+        use_queue (bool, optional): Route records through a queue and a listener thread. Defaults to config.LOG_QUEUE_ENABLED.
+        level (str, optional): The root level. Defaults to config.LOG_LEVEL.
+        levels (dict[str, str], optional): Levels per logger name (module), e.g. {"database_manager": "WARNING"}.
+                                           Defaults to config.LOG_LEVELS.
+        log_file (str, optional): Also write to this file when set. Defaults to config.LOG_FILE.
+
+    Returns:
+        QueueListener | None: The running listener in queue mode, else None. Call its stop() at shutdown to drain the queue.
+    """
+    handlers = [logging.StreamHandler()]
+    if log_file:
+        handlers.append(logging.FileHandler(log_file))
+    formatter = logging.Formatter(LOG_FORMAT)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    listener = None
+    if use_queue:
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter('%(message)s')) # Only merge args here; the listener applies LOG_FORMAT
+        handlers = [queue_handler]
+
+    logging.basicConfig(level=level, handlers=handlers, force=True)
+    for name, logger_level in (LOG_LEVELS if levels is None else levels).items():
+        logging.getLogger(name).setLevel(logger_level)
+    return listener
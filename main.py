@@ -1,34 +1,84 @@
+import signal
+import threading
 import time
 from elevator_system import ElevatorSystem
 from enums import Direction
 from database_manager import DatabaseManager # Import DatabaseManager
 from logger_config import setup_logging # Import setup_logging
-from config import NUM_FLOORS, NUM_CARS # Import configuration values
+from config import NUM_FLOORS, NUM_CARS, METRICS_TEXTFILE_PATH, METRICS_HTTP_PORT # Import configuration values
+from config import TICK_PROFILING_ENABLED, TICK_PROFILE_DIR, TICK_PROFILE_OUTLIER_SECONDS, TICK_PROFILE_SAMPLE_EVERY, JOURNEY_TRACKING_ENABLED
 from elevator_component_factory import ElevatorComponentFactory # Import the new factory
+from metrics import start_http_server, write_textfile
+from tick_profiler import TickProfiler
+from flight_recorder import install_crash_dump, install_signal_dump
+from config import (FLIGHT_RECORDER_DUMP_PATH, DASHBOARD_ENABLED, DASHBOARD_MAX_FPS, TRAFFIC_TRACE_PATH,
+                    TELEMETRY_DIR, TELEMETRY_SEGMENT_SECONDS, TELEMETRY_RETENTION_SECONDS,
+                    CONTROLLER_LEASE_PATH, CONTROLLER_LEASE_SECONDS,
+                    CALL_ADMISSION_ENABLED, API_SERVER_PORT, API_SERVER_HOST, API_SERVER_UNIX_PATH,
+                    IDLE_WAIT_ENABLED, IDLE_WAIT_SECONDS)
+from dashboard import TerminalDashboard
+from traffic_trace import TrafficRecorder
+from telemetry_store import TelemetryStore
+from standby import HotStandby, Lease
+from api_server import ApiServer
+import logging
 
-def run_simulation(system):
+logger = logging.getLogger(__name__)
+
+def run_simulation(system, standby=None, api_server=None, stop=None):
     # Simulate some calls
     system.call_elevator(7, Direction.UP)
     system.call_elevator(3, Direction.DOWN)
     system.call_elevator(9, Direction.UP)
 
+    # A controller serving the call API or holding the lease runs until stopped; the plain
+    # simulation is a 20-step demo
+    long_lived = api_server is not None or standby is not None
+    stop = stop if stop is not None else threading.Event()
+
+    idle_timeout = IDLE_WAIT_SECONDS
+    if standby is not None:
+        idle_timeout = min(idle_timeout, standby.lease.duration / 3) # Keep renewing the lease while asleep
+
     # Main simulation loop
-    for i in range(20): # Simulate for 20 time steps
-        print(f"\n--- Time Step {i+1} ---") # Keep this print for simulation step clarity
-        system.dispatcher()
-        for car in system.get_cars():
-            car.move()
-        system.monitoring()
-        system.save_state() # Save state at the end of each time step
-        time.sleep(1)
+    step = 0
+    while (long_lived or step < 20) and not stop.is_set():
+        step += 1
+        if system.dashboard is None:
+            print(f"\n--- Time Step {step} ---") # Keep this print for simulation step clarity
+        system.tick() # Dispatch, move cars, monitor and save state
+        if standby is not None and not standby.heartbeat():
+            if api_server is not None:
+                api_server.stop() # Stop admitting calls this process will no longer serve
+            break # Another controller took the lease over
+        if METRICS_TEXTFILE_PATH:
+            write_textfile(METRICS_TEXTFILE_PATH)
+        if IDLE_WAIT_ENABLED and system.is_quiescent():
+            if not long_lived:
+                break # Every call is served and nothing else can place one
+            system.wait_for_activity(idle_timeout) # Sleep until a call, a button press, a stop or the timeout
+        else:
+            # Tick again as soon as an open dispatch window closes; not stop.wait(), as request_stop()
+            # sets stop on this thread and Event's lock is not reentrant
+            window = system.dispatch_window_remaining()
+            time.sleep(window if window > 0 else 1)
 
 def main():
-    setup_logging() # Setup logging at the start of main
-    
+    log_listener = setup_logging() # Setup logging at the start of main; None unless queue mode is on
+    try:
+        run_system()
+    finally:
+        if log_listener is not None:
+            log_listener.stop() # Flush queued log records before exiting
+
+def run_system():
     # Use configuration values
     num_floors = NUM_FLOORS
     num_cars = NUM_CARS
 
+    if METRICS_HTTP_PORT is not None:
+        start_http_server(METRICS_HTTP_PORT)
+
     # Initialize DatabaseManager
     db_manager = DatabaseManager()
 
@@ -37,7 +87,62 @@ def main():
 
     system = ElevatorSystem.initialize(num_floors, num_cars, dispatching_strategy=None, database_manager=db_manager, factory=factory)
 
-    run_simulation(system)
+    install_crash_dump(system.flight_recorder, FLIGHT_RECORDER_DUMP_PATH)
+    install_signal_dump(system.flight_recorder, FLIGHT_RECORDER_DUMP_PATH)
+
+    if TICK_PROFILING_ENABLED:
+        system.enable_profiling(TickProfiler(output_dir=TICK_PROFILE_DIR,
+                                             outlier_threshold=TICK_PROFILE_OUTLIER_SECONDS,
+                                             sample_every=TICK_PROFILE_SAMPLE_EVERY))
+
+    if JOURNEY_TRACKING_ENABLED:
+        system.enable_journey_tracking()
+    if CALL_ADMISSION_ENABLED:
+        system.enable_call_admission()
+    if DASHBOARD_ENABLED:
+        system.enable_dashboard(TerminalDashboard(max_fps=DASHBOARD_MAX_FPS))
+    trace_recorder = TrafficRecorder(TRAFFIC_TRACE_PATH).attach(system) if TRAFFIC_TRACE_PATH else None
+    if TELEMETRY_DIR:
+        system.enable_telemetry(TelemetryStore(TELEMETRY_DIR, TELEMETRY_SEGMENT_SECONDS, TELEMETRY_RETENTION_SECONDS))
+
+    standby = None
+    if CONTROLLER_LEASE_PATH:
+        # Stand by as a warm replica until the primary's lease expires (immediately if there is no primary)
+        standby = HotStandby(system, db_manager, Lease(CONTROLLER_LEASE_PATH, CONTROLLER_LEASE_SECONDS))
+        standby.wait_for_takeover()
+
+    # Only the primary serves the call API: a standby would queue calls it never serves (and, on a
+    # Unix socket, unlink the primary's socket file)
+    api_server = None
+    if API_SERVER_PORT is not None or API_SERVER_UNIX_PATH:
+        api_server = ApiServer(system, API_SERVER_HOST, API_SERVER_PORT or 0, API_SERVER_UNIX_PATH)
+        api_server.start()
+
+    # SIGTERM and Ctrl-C end the loop after the current tick, so the API server stops and the lease
+    # is released instead of the process dying mid-save
+    stop = threading.Event()
+    def request_stop(signum, frame):
+        stop.set()
+        system.notify_activity() # Wake an idle loop so it sees the stop at once
+    signal.signal(signal.SIGTERM, request_stop)
+    signal.signal(signal.SIGINT, request_stop)
+
+    run_simulation(system, standby, api_server, stop)
+    if api_server is not None:
+        api_server.stop()
+    if standby is not None:
+        standby.step_down()
+    system.disable_dashboard()
+    system.event_bus.close() # Deliver the last batch and stop any asynchronous subscribers
+    if trace_recorder is not None:
+        trace_recorder.close()
+    if system.telemetry is not None:
+        system.telemetry.close()
+
+    if system.journey_tracker is not None:
+        logger.info("Hall-call wait time by floor: %s", system.journey_tracker.wait_time_distribution(group_by='floor'))
+    if system.profiler is not None:
+        logger.info("Tick profile:\n%s", system.profiler.report())
 
     # Commit and close the database connection when done
     db_manager.commit()
@@ -0,0 +1,382 @@
+import os
+import bisect
+import logging
+from threading import Lock, Thread
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+WAIT_TIME_BUCKETS = (1.0, 2.0, 5.0, 10.0, 15.0, 20.0, 30.0, 45.0, 60.0, 90.0, 120.0, 180.0, 300.0)
+
+
+def _format_value(value: float) -> str:
+    """Formats a sample value the way the Prometheus text format expects."""
+    if value == float('inf'):
+        return "+Inf"
+    if value == float('-inf'):
+        return "-Inf"
+    return repr(float(value))
+
+
+def _escape_label_value(value: str) -> str:
+    """Escapes backslashes, quotes and newlines in a label value."""
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+class _Metric:
+    """Base class for a metric family, optionally split into labelled children."""
+    metric_type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()) -> None:
+        """Initializes a metric family.
+
+        Args:
+            name (str): The metric name as exported.
+            documentation (str): The HELP text for the metric.
+            labelnames (tuple, optional): Names of the labels this metric is split by. Defaults to ().
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children = {}
+        self._children_lock = Lock()
+        self._lock = Lock()
+        self._init_value()
+
+    def _init_value(self) -> None:
+        """Initializes the storage for a single child's value."""
+        raise NotImplementedError
+
+    def _new_child(self) -> '_Metric':
+        """Creates an unlabelled child sharing this metric's configuration."""
+        return type(self)(self.name, self.documentation)
+
+    def labels(self, *labelvalues) -> '_Metric':
+        """Returns the child metric for the given label values, creating it on first use.
+
+        Callers on hot paths should keep the returned child instead of calling this repeatedly.
+
+        Args:
+            *labelvalues: One value per label name, in declaration order.
+
+        Returns:
+            _Metric: The child metric for these label values.
+
+        Raises:
+            ValueError: If the number of values does not match the label names.
+        """
+        child = self._children.get(labelvalues)
+        if child is not None:
+            return child
+        if len(labelvalues) != len(self.labelnames):
+            raise ValueError(f"Metric {self.name} expects labels {self.labelnames}, got {labelvalues}")
+        key = tuple(str(value) for value in labelvalues)
+        child = self._children.get(key)
+        if child is None:
+            with self._children_lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = self._new_child()
+                    self._children[key] = child
+        return child
+
+    def _samples(self) -> list[tuple[str, dict, float]]:
+        """Returns the (suffix, labels, value) samples of a single child."""
+        raise NotImplementedError
+
+    def collect(self) -> list[tuple[str, dict, float]]:
+        """Collects all samples of this metric family.
+
+        Returns:
+            list[tuple[str, dict, float]]: A list of (sample_name, labels, value) tuples.
+        """
+        samples = []
+        if self.labelnames:
+            with self._children_lock:
+                children = list(self._children.items())
+            for labelvalues, child in children:
+                base_labels = dict(zip(self.labelnames, labelvalues))
+                for suffix, labels, value in child._samples():
+                    samples.append((self.name + suffix, {**base_labels, **labels}, value))
+        else:
+            for suffix, labels, value in self._samples():
+                samples.append((self.name + suffix, labels, value))
+        return samples
+
+
+class Counter(_Metric):
+    """A monotonically increasing counter."""
+    metric_type = "counter"
+
+    def _init_value(self) -> None:
+        self._value = 0.0
+
+    def inc(self, amount: float = 1) -> None:
+        """Increments the counter.
+
+        Args:
+            amount (float, optional): The non-negative amount to add. Defaults to 1.
+
+        Raises:
+            ValueError: If amount is negative.
+        """
+        if amount < 0:
+            raise ValueError("Counters can only be incremented by non-negative amounts.")
+        with self._lock:
+            self._value += amount
+
+    def get(self) -> float:
+        """Returns the current counter value."""
+        return self._value
+
+    def _samples(self) -> list[tuple[str, dict, float]]:
+        return [("_total", {}, self._value)]
+
+
+class Gauge(_Metric):
+    """A value that can go up and down."""
+    metric_type = "gauge"
+
+    def _init_value(self) -> None:
+        self._value = 0.0
+
+    def set(self, value: float) -> None:
+        """Sets the gauge to the given value.
+
+        Args:
+            value (float): The new value.
+        """
+        self._value = float(value)
+
+    def inc(self, amount: float = 1) -> None:
+        """Increments the gauge.
+
+        Args:
+            amount (float, optional): The amount to add. Defaults to 1.
+        """
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        """Decrements the gauge.
+
+        Args:
+            amount (float, optional): The amount to subtract. Defaults to 1.
+        """
+        with self._lock:
+            self._value -= amount
+
+    def get(self) -> float:
+        """Returns the current gauge value."""
+        return self._value
+
+    def _samples(self) -> list[tuple[str, dict, float]]:
+        return [("", {}, self._value)]
+
+
+class Histogram(_Metric):
+    """A histogram with fixed, cumulative buckets."""
+    metric_type = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = (), buckets: tuple = DEFAULT_BUCKETS) -> None:
+        """Initializes a histogram family.
+
+        Args:
+            name (str): The metric name as exported.
+            documentation (str): The HELP text for the metric.
+            labelnames (tuple, optional): Names of the labels this metric is split by. Defaults to ().
+            buckets (tuple, optional): Upper bounds of the buckets. Defaults to DEFAULT_BUCKETS.
+        """
+        self.buckets = tuple(sorted(float(bound) for bound in buckets))
+        super().__init__(name, documentation, labelnames)
+
+    def _init_value(self) -> None:
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._count = 0
+
+    def _new_child(self) -> 'Histogram':
+        return Histogram(self.name, self.documentation, buckets=self.buckets)
+
+    def observe(self, value: float) -> None:
+        """Records one observation.
+
+        Args:
+            value (float): The observed value.
+        """
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+            self._count += 1
+
+    def get_count(self) -> int:
+        """Returns the number of observations."""
+        return self._count
+
+    def get_sum(self) -> float:
+        """Returns the sum of all observations."""
+        return self._sum
+
+    def _samples(self) -> list[tuple[str, dict, float]]:
+        with self._lock:
+            counts = self._counts[:]
+            total_sum = self._sum
+            total_count = self._count
+        samples = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, counts):
+            cumulative += count
+            samples.append(("_bucket", {"le": _format_value(bound)}, cumulative))
+        samples.append(("_bucket", {"le": "+Inf"}, total_count))
+        samples.append(("_sum", {}, total_sum))
+        samples.append(("_count", {}, total_count))
+        return samples
+
+
+class MetricsRegistry:
+    """Holds metric families and renders them in the Prometheus text exposition format."""
+    def __init__(self) -> None:
+        """Initializes an empty registry."""
+        self._metrics = {}
+        self._lock = Lock()
+
+    def _get_or_create(self, metric_class: type, name: str, documentation: str, labelnames: tuple, **kwargs) -> _Metric:
+        """Returns the existing metric with this name, or registers a new one.
+
+        Raises:
+            ValueError: If a metric with the same name but a different type or labels already exists.
+        """
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = metric_class(name, documentation, tuple(labelnames), **kwargs)
+                self._metrics[name] = metric
+            elif type(metric) is not metric_class or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric {name} is already registered with a different type or labels.")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: tuple = ()) -> Counter:
+        """Gets or creates a counter.
+
+        Args:
+            name (str): The metric name, without the `_total` suffix.
+            documentation (str): The HELP text.
+            labelnames (tuple, optional): Label names. Defaults to ().
+
+        Returns:
+            Counter: The registered counter.
+        """
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: tuple = ()) -> Gauge:
+        """Gets or creates a gauge.
+
+        Args:
+            name (str): The metric name.
+            documentation (str): The HELP text.
+            labelnames (tuple, optional): Label names. Defaults to ().
+
+        Returns:
+            Gauge: The registered gauge.
+        """
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames: tuple = (), buckets: tuple = DEFAULT_BUCKETS) -> Histogram:
+        """Gets or creates a histogram.
+
+        Args:
+            name (str): The metric name.
+            documentation (str): The HELP text.
+            labelnames (tuple, optional): Label names. Defaults to ().
+            buckets (tuple, optional): Bucket upper bounds. Defaults to DEFAULT_BUCKETS.
+
+        Returns:
+            Histogram: The registered histogram.
+        """
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def get(self, name: str) -> _Metric | None:
+        """Looks up a registered metric by name.
+
+        Args:
+            name (str): The metric name.
+
+        Returns:
+            _Metric | None: The metric, or None if it is not registered.
+        """
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Renders every registered metric in the Prometheus text exposition format.
+
+        Returns:
+            str: The exposition text, terminated by a newline.
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.metric_type}")
+            for sample_name, labels, value in metric.collect():
+                if labels:
+                    label_text = ",".join(f'{key}="{_escape_label_value(str(val))}"' for key, val in labels.items())
+                    lines.append(f"{sample_name}{{{label_text}}} {_format_value(value)}")
+                else:
+                    lines.append(f"{sample_name} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+
+def write_textfile(path: str, registry: MetricsRegistry = None) -> None:
+    """Atomically writes the registry to a file, for the node_exporter textfile collector or a sidecar.
+
+    Args:
+        path (str): The destination file path.
+        registry (MetricsRegistry, optional): The registry to export. Defaults to REGISTRY.
+    """
+    registry = registry if registry else REGISTRY
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(registry.render())
+    os.replace(tmp_path, path)
+
+
+def start_http_server(port: int, addr: str = "127.0.0.1", registry: MetricsRegistry = None) -> ThreadingHTTPServer:
+    """Serves the registry over HTTP on a daemon thread so a sidecar can scrape it.
+
+    Args:
+        port (int): The TCP port to listen on. Use 0 to pick a free port.
+        addr (str, optional): The address to bind. Defaults to "127.0.0.1".
+        registry (MetricsRegistry, optional): The registry to export. Defaults to REGISTRY.
+
+    Returns:
+        ThreadingHTTPServer: The running server. Call shutdown() to stop it.
+    """
+    registry = registry if registry else REGISTRY
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+            body = registry.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args) -> None:
+            logger.debug("Metrics endpoint: " + format, *args)
+
+    server = ThreadingHTTPServer((addr, port), MetricsHandler)
+    server.daemon_threads = True
+    thread = Thread(target=server.serve_forever, name="metrics-http", daemon=True)
+    thread.start()
+    logger.info("Serving metrics on http://%s:%s/metrics", addr, server.server_address[1])
+    return server
@@ -0,0 +1,256 @@
+import math
+
+_TOLERANCE = 1e-6 # metres, m/s and m/s^2 when comparing motion states
+
+
+class MotionProfile:
+    """A jerk-limited (S-curve) rest-to-rest trip over a fixed distance, evaluated analytically.
+
+    The trip is split into seven segments with constant jerk +J, 0, -J, 0, -J, 0, +J: ramp up the
+    acceleration, accelerate, ramp down to cruise, cruise, and the mirror image to stop. Segments
+    collapse to zero length when the distance is too short to reach the acceleration or velocity
+    limit. Positions are measured from the start of the trip in the direction of travel.
+    """
+    __slots__ = ("distance", "durations", "jerks", "_starts", "_boundaries", "duration")
+
+    def __init__(self, distance: float, max_velocity: float, max_acceleration: float, max_jerk: float) -> None:
+        """Computes the segment durations and boundary states of a trip.
+
+        Args:
+            distance (float): The trip length in metres (non-negative).
+            max_velocity (float): The velocity limit in m/s.
+            max_acceleration (float): The acceleration limit in m/s^2.
+            max_jerk (float): The jerk limit in m/s^3.
+        """
+        self.distance = distance
+        peak_velocity = max_velocity
+        jerk_time, accel_time = self._ramp_times(peak_velocity, max_acceleration, max_jerk)
+        ramp_distance = peak_velocity * (2 * jerk_time + accel_time) # Accelerating plus braking
+        if distance >= ramp_distance:
+            cruise_time = (distance - ramp_distance) / peak_velocity
+        else:
+            # The velocity limit is not reached: solve for the peak velocity that covers the distance.
+            cruise_time = 0.0
+            peak_velocity = (distance * math.sqrt(max_jerk) / 2) ** (2 / 3)
+            if peak_velocity * max_jerk > max_acceleration ** 2:
+                ratio = max_acceleration / max_jerk
+                peak_velocity = max_acceleration * (-ratio + math.sqrt(ratio * ratio + 4 * distance / max_acceleration)) / 2
+            jerk_time, accel_time = self._ramp_times(peak_velocity, max_acceleration, max_jerk)
+
+        self.durations = (jerk_time, accel_time, jerk_time, cruise_time, jerk_time, accel_time, jerk_time)
+        self.jerks = (max_jerk, 0.0, -max_jerk, 0.0, -max_jerk, 0.0, max_jerk)
+        # Start time and (position, velocity, acceleration) at the start of each segment
+        starts = []
+        boundaries = []
+        t = p = v = a = 0.0
+        for segment_time, jerk in zip(self.durations, self.jerks):
+            starts.append(t)
+            boundaries.append((p, v, a))
+            p, v, a = self._integrate(p, v, a, jerk, segment_time)
+            t += segment_time
+        self._starts = tuple(starts)
+        self._boundaries = tuple(boundaries)
+        self.duration = t
+
+    @staticmethod
+    def _ramp_times(velocity: float, max_acceleration: float, max_jerk: float) -> tuple[float, float]:
+        """Returns the jerk and constant-acceleration segment durations to reach a velocity from rest."""
+        if velocity * max_jerk < max_acceleration ** 2:
+            return math.sqrt(velocity / max_jerk), 0.0
+        return max_acceleration / max_jerk, velocity / max_acceleration - max_acceleration / max_jerk
+
+    @staticmethod
+    def _integrate(p: float, v: float, a: float, jerk: float, t: float) -> tuple[float, float, float]:
+        """Advances a (position, velocity, acceleration) state under constant jerk for t seconds."""
+        return (p + v * t + a * t * t / 2 + jerk * t * t * t / 6,
+                v + a * t + jerk * t * t / 2,
+                a + jerk * t)
+
+    def state_at(self, t: float) -> tuple[float, float, float]:
+        """Returns the (position, velocity, acceleration) of the trip t seconds after it started.
+
+        Args:
+            t (float): Seconds since the start of the trip.
+
+        Returns:
+            tuple[float, float, float]: Position in metres, velocity in m/s and acceleration in m/s^2.
+        """
+        if t <= 0:
+            return 0.0, 0.0, 0.0
+        if t >= self.duration:
+            return self.distance, 0.0, 0.0
+        segment = 6
+        while self._starts[segment] > t:
+            segment -= 1
+        p, v, a = self._boundaries[segment]
+        return self._integrate(p, v, a, self.jerks[segment], t - self._starts[segment])
+
+
+def travel_time(distance: float, max_velocity: float, max_acceleration: float, max_jerk: float) -> float:
+    """Returns the rest-to-rest travel time over a distance under the given limits.
+
+    Args:
+        distance (float): The distance in metres.
+        max_velocity (float): The velocity limit in m/s.
+        max_acceleration (float): The acceleration limit in m/s^2.
+        max_jerk (float): The jerk limit in m/s^3.
+
+    Returns:
+        float: The travel time in seconds.
+    """
+    return MotionProfile(abs(distance), max_velocity, max_acceleration, max_jerk).duration
+
+
+class KinematicMotion:
+    """The continuous position of one car in its shaft, driven by jerk-limited trips between floors.
+
+    A trip starts from rest and follows a MotionProfile to its target floor. The target can be moved
+    while travelling only to a floor the car can still brake for: one whose profile from the trip's
+    origin coincides with the motion so far, i.e. the car has not yet passed its braking point.
+    """
+    __slots__ = ("floor_height", "max_velocity", "max_acceleration", "max_jerk",
+                 "position", "velocity", "acceleration", "target_floor", "last_update",
+                 "_profile", "_origin", "_sign", "_elapsed")
+
+    def __init__(self, floor_height: float, max_velocity: float, max_acceleration: float, max_jerk: float,
+                 floor: int = 0) -> None:
+        """Initializes the motion of a car at rest on a floor.
+
+        Args:
+            floor_height (float): The distance between floors in metres.
+            max_velocity (float): The velocity limit in m/s.
+            max_acceleration (float): The acceleration limit in m/s^2.
+            max_jerk (float): The jerk limit in m/s^3.
+            floor (int, optional): The floor the car rests on. Defaults to 0.
+
+        Raises:
+            ValueError: If any of the limits is not positive.
+        """
+        if min(floor_height, max_velocity, max_acceleration, max_jerk) <= 0:
+            raise ValueError("Floor height and motion limits must be positive")
+        self.floor_height = floor_height
+        self.max_velocity = max_velocity
+        self.max_acceleration = max_acceleration
+        self.max_jerk = max_jerk
+        self.last_update = None # Clock time of the last advance, for callers that derive dt from a clock
+        self.stop_at(floor)
+
+    def stop_at(self, floor: int) -> None:
+        """Places the car at rest on a floor, abandoning any trip in progress.
+
+        Args:
+            floor (int): The floor number.
+        """
+        self.position = floor * self.floor_height
+        self.velocity = 0.0
+        self.acceleration = 0.0
+        self.target_floor = floor
+        self._profile = None
+        self._origin = self.position
+        self._sign = 0
+        self._elapsed = 0.0
+
+    def is_moving(self) -> bool:
+        """Checks whether a trip is in progress.
+
+        Returns:
+            bool: True until the car comes to rest at its target floor.
+        """
+        return self._profile is not None
+
+    def _profile_to(self, floor: int) -> MotionProfile:
+        """Builds the rest-to-rest profile from the current trip's origin to a floor."""
+        return MotionProfile(abs(floor * self.floor_height - self._origin),
+                             self.max_velocity, self.max_acceleration, self.max_jerk)
+
+    def can_stop_at(self, floor: int) -> bool:
+        """Checks whether the car can still come to rest exactly at a floor.
+
+        A car at rest can travel to any floor. A moving car can stop at its target, or at another
+        floor ahead of it whose braking point has not yet been passed.
+
+        Args:
+            floor (int): The floor number.
+
+        Returns:
+            bool: True if the car can stop at the floor.
+        """
+        if self._profile is None or floor == self.target_floor:
+            return True
+        if (floor * self.floor_height - self._origin) * self._sign <= 0:
+            return False
+        planned = self._profile_to(floor).state_at(self._elapsed)
+        actual = self._profile.state_at(self._elapsed)
+        return all(abs(x - y) <= _TOLERANCE for x, y in zip(planned, actual))
+
+    def travel_to(self, floor: int) -> bool:
+        """Starts a trip to a floor, or moves the target of the trip in progress.
+
+        Args:
+            floor (int): The target floor.
+
+        Returns:
+            bool: True if the car is now heading for (or resting at) the floor, False if it can no longer stop there.
+        """
+        if floor == self.target_floor:
+            return True
+        if self._profile is None:
+            self._origin = self.position
+            self._sign = 1 if floor * self.floor_height > self.position else -1
+            self._elapsed = 0.0
+        elif not self.can_stop_at(floor):
+            return False
+        self._profile = self._profile_to(floor)
+        self.target_floor = floor
+        return True
+
+    def advance(self, dt: float) -> None:
+        """Advances the trip in progress by dt seconds; arriving snaps the car to rest at its target.
+
+        Args:
+            dt (float): Elapsed time in seconds.
+        """
+        if self._profile is None or dt <= 0:
+            return
+        self._elapsed += dt
+        if self._elapsed >= self._profile.duration:
+            self.stop_at(self.target_floor)
+            return
+        offset, velocity, acceleration = self._profile.state_at(self._elapsed)
+        self.position = self._origin + self._sign * offset
+        self.velocity = self._sign * velocity
+        self.acceleration = self._sign * acceleration
+
+    def floor_passed(self) -> int:
+        """Returns the last floor the car has reached in its direction of travel (its floor when at rest).
+
+        Returns:
+            int: The floor number.
+        """
+        level = self.position / self.floor_height
+        if self._sign < 0:
+            return math.ceil(level - _TOLERANCE)
+        return math.floor(level + _TOLERANCE)
+
+    def time_to_arrival(self) -> float:
+        """Returns the seconds left until the car comes to rest at its target floor.
+
+        Returns:
+            float: The remaining travel time, 0 when at rest.
+        """
+        if self._profile is None:
+            return 0.0
+        return self._profile.duration - self._elapsed
+
+    def travel_time(self, from_floor: int, to_floor: int) -> float:
+        """Returns the rest-to-rest travel time between two floors under this car's limits.
+
+        Args:
+            from_floor (int): The starting floor.
+            to_floor (int): The destination floor.
+
+        Returns:
+            float: The travel time in seconds.
+        """
+        return travel_time((to_floor - from_floor) * self.floor_height,
+                           self.max_velocity, self.max_acceleration, self.max_jerk)
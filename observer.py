@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 
 class Subject(ABC):
     """The Subject interface declares a set of methods for managing subscribers."""
+    __slots__ = ()
 
     @abstractmethod
     def attach(self, observer) -> None:
@@ -26,6 +27,7 @@ class Subject(ABC):
 
 class Observer(ABC):
     """The Observer interface declares the update method, used by subjects."""
+    __slots__ = ()
 
     @abstractmethod
     def update(self, subject: Subject, event: str, data: dict = None) -> None:
@@ -0,0 +1,48 @@
+"""Wake-ups for an idle control loop.
+
+When the whole fleet is quiescent (see ElevatorSystem.is_quiescent()) a tick changes nothing, so
+the main loop stops ticking and blocks on an ActivitySignal instead. Anything that can give the
+cars work (a hall call, a car-button press, the door close button, a fleet change, or an external
+timer calling notify()) sets the signal from whatever thread it runs on, and the loop wakes at once.
+"""
+from threading import Condition
+
+
+class ActivitySignal:
+    """A sticky wake-up flag on a condition variable: set by producers, waited on and cleared by the control loop."""
+    def __init__(self) -> None:
+        """Initializes an ActivitySignal with no activity pending."""
+        self._condition = Condition()
+        self._pending = False
+
+    def notify(self) -> None:
+        """Records activity and wakes the waiting loop. Safe to call from any thread."""
+        with self._condition:
+            self._pending = True
+            self._condition.notify_all()
+
+    def wait(self, timeout: float = None) -> bool:
+        """Blocks until activity is recorded, returning at once if some already is.
+
+        The flag is not cleared here: the next tick clears it, so activity that arrives between the
+        last tick and this call is never lost.
+
+        Args:
+            timeout (float, optional): The longest wait in seconds. Defaults to waiting indefinitely.
+
+        Returns:
+            bool: True if there is activity, False if the timeout passed first.
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self._pending, timeout)
+
+    def clear(self) -> bool:
+        """Takes the pending activity, if any.
+
+        Returns:
+            bool: True if activity was recorded since the last clear().
+        """
+        with self._condition:
+            pending = self._pending
+            self._pending = False
+            return pending
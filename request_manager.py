@@ -1,56 +1,162 @@
 from threading import Lock
 from enums import Direction
 from database_manager import DatabaseManager
+from time_provider import TimeProvider
+from metrics import MetricsRegistry, REGISTRY, WAIT_TIME_BUCKETS
 import logging
 
+logger = logging.getLogger(__name__)
+
 class RequestManager:
     """
     Manages system-wide hall call requests (up and down requests).
     Encapsulates request storage, manipulation, and persistence.
     """
-    def __init__(self, database_manager: DatabaseManager) -> None:
+    def __init__(self, database_manager: DatabaseManager, time_provider: TimeProvider = None, metrics: MetricsRegistry = None) -> None:
         self.database_manager = database_manager
+        self.time_provider = time_provider if time_provider else TimeProvider()
         self.up_requests = []
         self.down_requests = []
         self._up_requests_lock = Lock()
         self._down_requests_lock = Lock()
+        # (floor, direction) -> time the hall call was registered, for wait-time metrics
+        self._request_times = {}
+
+        metrics = metrics if metrics else REGISTRY
+        calls_received = metrics.counter("elevator_calls_received", "Hall calls registered.", ("direction",))
+        calls_served = metrics.counter("elevator_calls_served", "Hall calls fulfilled by a car.", ("direction",))
+        hall_call_wait = metrics.histogram("elevator_hall_call_wait_seconds", "Time from hall call registration to fulfilment.",
+                                           ("direction",), buckets=WAIT_TIME_BUCKETS)
+        self._calls_received = {direction: calls_received.labels(direction.name) for direction in (Direction.UP, Direction.DOWN)}
+        self._calls_served = {direction: calls_served.labels(direction.name) for direction in (Direction.UP, Direction.DOWN)}
+        self._hall_call_wait = {direction: hall_call_wait.labels(direction.name) for direction in (Direction.UP, Direction.DOWN)}
+
         self._load_requests_from_db()
 
     def _load_requests_from_db(self) -> None:
         """Loads system-wide hall call requests from the database."""
         loaded_system_requests = self.database_manager.load_system_requests()
         if loaded_system_requests:
-            self.up_requests = [req[0] for req in loaded_system_requests if req[1] == Direction.UP]
-            self.down_requests = [req[0] for req in loaded_system_requests if req[1] == Direction.DOWN]
-            self.up_requests.sort()
-            self.down_requests.sort(reverse=True)
-            logging.info(f"Loaded system requests: Up - {self.up_requests}, Down - {self.down_requests}")
+            self.apply_persisted_requests(loaded_system_requests)
+            logger.info("Loaded system requests: Up - %s, Down - %s", self.up_requests, self.down_requests)
         else:
             self.database_manager.save_system_requests([]) # Save empty lists initially
 
+    def apply_persisted_requests(self, requests: list[tuple[int, Direction]]) -> bool:
+        """Replaces the pending hall calls with a persisted set, e.g. one written by another controller.
+
+        Args:
+            requests (list[tuple[int, Direction]]): The persisted (floor, direction) hall calls.
+
+        Returns:
+            bool: True if the pending calls changed.
+        """
+        up_requests = sorted(floor for floor, direction in requests if direction == Direction.UP)
+        down_requests = sorted((floor for floor, direction in requests if direction == Direction.DOWN), reverse=True)
+        changed = False
+        with self._up_requests_lock:
+            if up_requests != self.up_requests:
+                self.up_requests = up_requests
+                changed = True
+        with self._down_requests_lock:
+            if down_requests != self.down_requests:
+                self.down_requests = down_requests
+                changed = True
+        return changed
+
     def add_request(self, floor: int, direction: Direction) -> None:
         """Adds a new hall call request."""
+        added = False
         if direction == Direction.UP:
             with self._up_requests_lock:
                 if floor not in self.up_requests:
                     self.up_requests.append(floor)
                     self.up_requests.sort()
+                    added = True
         elif direction == Direction.DOWN:
             with self._down_requests_lock:
                 if floor not in self.down_requests:
                     self.down_requests.append(floor)
                     self.down_requests.sort(reverse=True)
+                    added = True
+        if added:
+            self._request_times[(floor, direction)] = self.time_provider.get_time()
+            self._calls_received[direction].inc()
+
+    def add_requests(self, calls: list[tuple[int, Direction]]) -> list[tuple[int, Direction]]:
+        """Adds a batch of hall call requests, merging each direction in one pass under its lock.
+
+        Args:
+            calls (list[tuple[int, Direction]]): The (floor, direction) calls, in any order, duplicates allowed.
+
+        Returns:
+            list[tuple[int, Direction]]: The calls that were not already pending.
+        """
+        up_floors = {floor for floor, direction in calls if direction == Direction.UP}
+        down_floors = {floor for floor, direction in calls if direction == Direction.DOWN}
+        added_up = added_down = ()
+        if up_floors:
+            with self._up_requests_lock:
+                added_up = up_floors.difference(self.up_requests)
+                if added_up:
+                    self.up_requests = sorted(up_floors.union(self.up_requests))
+        if down_floors:
+            with self._down_requests_lock:
+                added_down = down_floors.difference(self.down_requests)
+                if added_down:
+                    self.down_requests = sorted(down_floors.union(self.down_requests), reverse=True)
+        added = [(floor, Direction.UP) for floor in sorted(added_up)]
+        added += [(floor, Direction.DOWN) for floor in sorted(added_down, reverse=True)]
+        if added:
+            now = self.time_provider.get_time()
+            for call in added:
+                self._request_times[call] = now
+            self._calls_received[Direction.UP].inc(len(added_up))
+            self._calls_received[Direction.DOWN].inc(len(added_down))
+        return added
 
     def remove_request(self, floor: int, direction: Direction) -> None:
         """Removes a fulfilled hall call request."""
+        removed = False
         if direction == Direction.UP:
             with self._up_requests_lock:
                 if floor in self.up_requests:
                     self.up_requests.remove(floor)
+                    removed = True
         elif direction == Direction.DOWN:
             with self._down_requests_lock:
                 if floor in self.down_requests:
                     self.down_requests.remove(floor)
+                    removed = True
+        if removed:
+            self._calls_served[direction].inc()
+            requested_at = self._request_times.pop((floor, direction), None)
+            if requested_at is not None:
+                self._hall_call_wait[direction].observe(self.time_provider.get_time() - requested_at)
+
+    def remove_requests_at(self, floors: dict[int, float]) -> None:
+        """Removes the up and down hall calls at a batch of served floors, taking each lock once.
+
+        Args:
+            floors (dict[int, float]): Maps each floor where a car opened its door to the time it opened,
+                                       which ends the wait recorded for the calls there.
+        """
+        with self._up_requests_lock:
+            served_up = [floor for floor in self.up_requests if floor in floors]
+            if served_up:
+                self.up_requests = [floor for floor in self.up_requests if floor not in floors]
+        with self._down_requests_lock:
+            served_down = [floor for floor in self.down_requests if floor in floors]
+            if served_down:
+                self.down_requests = [floor for floor in self.down_requests if floor not in floors]
+        if not served_up and not served_down:
+            return
+        for direction, served in ((Direction.UP, served_up), (Direction.DOWN, served_down)):
+            for floor in served:
+                self._calls_served[direction].inc()
+                requested_at = self._request_times.pop((floor, direction), None)
+                if requested_at is not None:
+                    self._hall_call_wait[direction].observe(floors[floor] - requested_at)
 
     def get_up_requests(self) -> list[int]:
         """Returns a copy of the current up requests."""
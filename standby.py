@@ -0,0 +1,176 @@
+"""Hot standby for the elevator controller.
+
+Two controller processes share the SQLite state store and a lease file on one machine. The one
+holding the lease is the primary: after every tick it commits the tick's saves with a new state
+revision and renews the lease. The other is a standby: it keeps a warm ElevatorSystem replica by
+re-reading the store whenever the revision changes, and takes over as soon as the lease expires,
+after one last catch-up read.
+"""
+import logging
+import os
+import socket
+import time
+from elevator_system import ElevatorSystem
+from database_manager import DatabaseManager
+
+logger = logging.getLogger(__name__)
+
+
+class Lease:
+    """An expiring ownership claim stored in a local file as "<holder> <expiry time>".
+
+    The file is replaced atomically on every write. It arbitrates between one primary and one
+    standby; it is not a general-purpose distributed lock.
+    """
+    def __init__(self, path: str, duration: float = 3.0, holder: str = None, clock=time.time) -> None:
+        """Initializes a Lease.
+
+        Args:
+            path (str): The lease file path.
+            duration (float, optional): Seconds a claim stays valid without renewal. Defaults to 3.0.
+            holder (str, optional): This process's identity. Defaults to "<hostname>:<pid>".
+            clock (callable, optional): Wall clock shared by the processes. Defaults to time.time.
+
+        Raises:
+            ValueError: If duration is not positive.
+        """
+        if duration <= 0:
+            raise ValueError("Lease duration must be positive")
+        self.path = path
+        self.duration = duration
+        self.holder = holder if holder else f"{socket.gethostname()}:{os.getpid()}"
+        self.clock = clock
+
+    def read(self) -> tuple[str, float] | None:
+        """Reads the current claim.
+
+        Returns:
+            tuple[str, float] | None: (holder, expiry time), or None if there is no readable claim.
+        """
+        try:
+            with open(self.path) as f:
+                holder, expires_at = f.read().rsplit(" ", 1)
+            return holder, float(expires_at)
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, expires_at: float) -> None:
+        """Atomically writes this process's claim."""
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(f"{self.holder} {expires_at!r}")
+        os.replace(tmp_path, self.path)
+
+    def try_acquire(self) -> bool:
+        """Claims the lease if it is free, expired or already ours.
+
+        Returns:
+            bool: True if this process now holds the lease.
+        """
+        now = self.clock()
+        claim = self.read()
+        if claim is not None and claim[0] != self.holder and claim[1] > now:
+            return False
+        self._write(now + self.duration)
+        return True
+
+    def renew(self) -> bool:
+        """Extends this process's claim (the primary's heartbeat).
+
+        Returns:
+            bool: False if another process has taken the lease, in which case it is left alone.
+        """
+        claim = self.read()
+        if claim is not None and claim[0] != self.holder:
+            return False
+        self._write(self.clock() + self.duration)
+        return True
+
+    def release(self) -> None:
+        """Gives the lease up immediately, if held, so a standby can take over without waiting for expiry."""
+        claim = self.read()
+        if claim is not None and claim[0] == self.holder:
+            self._write(0.0)
+
+
+class HotStandby:
+    """Runs one controller process as primary or as a warm standby.
+
+    As a standby it polls the state revision once per poll interval and, when it changed, applies the
+    primary's persisted hall calls and car states to the local system. The takeover check runs on the
+    same interval, so the standby starts ticking within one tick of the lease expiring.
+    """
+    def __init__(self, system: ElevatorSystem, database_manager: DatabaseManager, lease: Lease,
+                 poll_interval: float = 1.0) -> None:
+        """Initializes a HotStandby.
+
+        Args:
+            system (ElevatorSystem): The local system, built from the shared database.
+            database_manager (DatabaseManager): This process's connection to the shared database.
+            lease (Lease): The lease arbitrating between the primary and the standby.
+            poll_interval (float, optional): Seconds between revision polls while standing by. Defaults to 1.0.
+        """
+        self.system = system
+        self.database_manager = database_manager
+        self.lease = lease
+        self.poll_interval = poll_interval
+        self.revision = None # Revision of the store the replica reflects
+        self.is_primary = False
+        self.database_manager.enable_wal()
+        self.database_manager.commit() # Never hold a write transaction open against the primary
+
+    def follow(self) -> bool:
+        """Applies the primary's latest published state to the replica, if it changed.
+
+        Returns:
+            bool: True if a new revision was applied.
+        """
+        revision = self.database_manager.load_revision()
+        if revision == self.revision:
+            return False
+        changed = self.system.load_persisted_state()
+        self.revision = revision
+        logger.debug("Replica at revision %s (%s car(s) changed)", revision, changed)
+        return True
+
+    def wait_for_takeover(self, sleep=time.sleep, max_polls: int = None) -> bool:
+        """Follows the primary until the lease can be acquired, then becomes the primary.
+
+        Args:
+            sleep (callable, optional): Used to wait between polls. Defaults to time.sleep.
+            max_polls (int, optional): Give up after this many polls. Defaults to waiting indefinitely.
+
+        Returns:
+            bool: True once this process is the primary, False if max_polls ran out first.
+        """
+        polls = 0
+        while not self.lease.try_acquire():
+            self.follow()
+            polls += 1
+            if max_polls is not None and polls >= max_polls:
+                return False
+            sleep(self.poll_interval)
+        self.follow() # Catch up with the last state the old primary published
+        self.is_primary = True
+        logger.warning("Acquired controller lease %s as %s at revision %s", self.lease.path, self.lease.holder, self.revision)
+        return True
+
+    def heartbeat(self) -> bool:
+        """Publishes the tick just saved and renews the lease. Call after every tick while primary.
+
+        Returns:
+            bool: False if the lease was lost to another process; the caller must stop ticking.
+        """
+        if not self.lease.renew():
+            self.is_primary = False
+            logger.error("Controller lease %s was taken over; stopping", self.lease.path)
+            return False
+        self.revision = self.database_manager.publish_revision(self.system.time_provider.get_time())
+        return True
+
+    def step_down(self) -> None:
+        """Commits the final state and releases the lease so the standby takes over immediately."""
+        if self.is_primary:
+            self.database_manager.publish_revision(self.system.time_provider.get_time())
+            self.lease.release()
+            self.is_primary = False
@@ -0,0 +1,205 @@
+"""Columnar, memory-mapped telemetry history.
+
+TelemetryStore appends one row per car per tick (time, car, floor, direction, state code, door
+state and pending-call counts) to fixed-width column files. Columns live in segment directories
+named after the time of their first row; a new segment starts every `segment_seconds`, and whole
+segments older than `retention_seconds` are deleted. Readers memory-map the column files: with
+NumPy installed each column is a zero-copy numpy.memmap, otherwise a memoryview cast to the
+column's type.
+"""
+import mmap
+import os
+import shutil
+from array import array
+from typing import Iterator
+
+try:
+    import numpy
+except ImportError: # NumPy is optional: readers fall back to memoryviews
+    numpy = None
+
+# Column name -> array typecode (native byte order and width, matching numpy.dtype(typecode))
+COLUMNS = {
+    "timestamp": "d",
+    "car_id": "H",
+    "floor": "i",
+    "direction": "b", # Direction value
+    "state": "B", # ElevatorState code
+    "door": "B", # DoorState value
+    "car_calls_up": "H", # The car's pending up requests
+    "car_calls_down": "H",
+    "hall_calls_up": "H", # Pending up hall calls in the building
+    "hall_calls_down": "H",
+}
+_SEGMENT_PREFIX = "segment-"
+_WRITE_BUFFER = 65536 # bytes per column file
+
+
+def _segment_name(start: float) -> str:
+    """Returns the directory name of a segment whose first row is at `start` (sortable, millisecond resolution)."""
+    return f"{_SEGMENT_PREFIX}{int(start * 1000):016d}"
+
+
+def list_segments(directory: str) -> list[tuple[float, str]]:
+    """Lists the segments in a telemetry directory.
+
+    Args:
+        directory (str): The telemetry directory.
+
+    Returns:
+        list[tuple[float, str]]: (start time, path) per segment, oldest first.
+    """
+    if not os.path.isdir(directory):
+        return []
+    segments = []
+    for name in sorted(os.listdir(directory)):
+        if name.startswith(_SEGMENT_PREFIX) and name[len(_SEGMENT_PREFIX):].isdigit():
+            segments.append((int(name[len(_SEGMENT_PREFIX):]) / 1000, os.path.join(directory, name)))
+    return segments
+
+
+class TelemetryStore:
+    """Appends per-tick car telemetry to rolling columnar segments.
+
+    Each tick's rows are packed column by column into `array`s and appended to the column files
+    through a write buffer, so recording costs one small buffered write per column.
+    """
+    def __init__(self, directory: str, segment_seconds: float = 3600.0, retention_seconds: float = 7 * 86400.0) -> None:
+        """Initializes a TelemetryStore. The first recorded tick starts a new segment.
+
+        Args:
+            directory (str): The telemetry directory; created if missing.
+            segment_seconds (float, optional): Time span of one segment. Defaults to one hour.
+            retention_seconds (float, optional): Segments whose rows are all older than this are deleted. Defaults to one week.
+
+        Raises:
+            ValueError: If segment_seconds or retention_seconds is not positive.
+        """
+        if segment_seconds <= 0 or retention_seconds <= 0:
+            raise ValueError("Segment length and retention must be positive")
+        self.directory = directory
+        self.segment_seconds = segment_seconds
+        self.retention_seconds = retention_seconds
+        self.rows_written = 0
+        os.makedirs(directory, exist_ok=True)
+        self._segments = list_segments(directory)
+        self._segment_start = None
+        self._files = None
+
+    def record_tick(self, timestamp: float, cars: list, hall_calls_up: int, hall_calls_down: int) -> None:
+        """Appends one row per car.
+
+        Args:
+            timestamp (float): The time of the tick.
+            cars (list): The ElevatorCar instances.
+            hall_calls_up (int): The number of pending up hall calls.
+            hall_calls_down (int): The number of pending down hall calls.
+        """
+        if self._files is None or timestamp - self._segment_start >= self.segment_seconds:
+            self._roll(timestamp)
+        count = len(cars)
+        columns = (
+            [timestamp] * count,
+            [car.car_id for car in cars],
+            [car.current_floor for car in cars],
+            [car.direction.value for car in cars],
+            [car.state.code for car in cars],
+            [car.door.get_state().value for car in cars],
+            [len(car.up_requests) for car in cars],
+            [len(car.down_requests) for car in cars],
+            [hall_calls_up] * count,
+            [hall_calls_down] * count,
+        )
+        for (f, typecode), values in zip(self._files, columns):
+            f.write(array(typecode, values))
+        self.rows_written += count
+
+    def _roll(self, timestamp: float) -> None:
+        """Closes the current segment, starts one at `timestamp` and applies the retention policy."""
+        self.close()
+        path = os.path.join(self.directory, _segment_name(timestamp))
+        if self._segments and path == self._segments[-1][1]:
+            # Reopened within the same millisecond as an existing segment: keep appending to it
+            self._segments.pop()
+        os.makedirs(path, exist_ok=True)
+        self._files = [(open(os.path.join(path, f"{name}.col"), "ab", buffering=_WRITE_BUFFER), typecode)
+                       for name, typecode in COLUMNS.items()]
+        self._segment_start = timestamp
+        self._segments.append((timestamp, path))
+        # A segment only holds rows older than the cutoff once its successor started before it
+        cutoff = timestamp - self.retention_seconds
+        while len(self._segments) > 1 and self._segments[1][0] <= cutoff:
+            shutil.rmtree(self._segments.pop(0)[1], ignore_errors=True)
+
+    def flush(self) -> None:
+        """Writes buffered rows of the current segment to its column files."""
+        for f, _ in self._files or ():
+            f.flush()
+
+    def close(self) -> None:
+        """Flushes and closes the current segment; the next recorded tick starts a new one."""
+        for f, _ in self._files or ():
+            f.close()
+        self._files = None
+
+
+def _map_column(path: str, typecode: str, rows: int):
+    """Memory-maps the first `rows` values of a column file, read-only."""
+    if numpy is not None:
+        if rows == 0:
+            return numpy.empty(0, dtype=typecode)
+        return numpy.memmap(path, dtype=typecode, mode="r", shape=(rows,))
+    if rows == 0:
+        return memoryview(array(typecode))
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) # The mapping outlives the file handle
+    return memoryview(mapped)[:rows * array(typecode).itemsize].cast(typecode)
+
+
+def read_segment(path: str, columns: list[str] = None) -> dict:
+    """Maps the columns of one segment without copying them.
+
+    Rows are counted from the shortest column, so a row half-written by a crash is ignored.
+
+    Args:
+        path (str): The segment directory.
+        columns (list[str], optional): The columns to map. Defaults to all of COLUMNS.
+
+    Returns:
+        dict: Column name -> numpy.memmap (or memoryview without NumPy) of equal length.
+
+    Raises:
+        ValueError: If a column name is unknown.
+    """
+    names = list(COLUMNS) if columns is None else columns
+    for name in names:
+        if name not in COLUMNS:
+            raise ValueError(f"Unknown telemetry column: {name}")
+    rows = None
+    for name, typecode in COLUMNS.items():
+        file_path = os.path.join(path, f"{name}.col")
+        size = os.path.getsize(file_path) if os.path.exists(file_path) else 0
+        column_rows = size // array(typecode).itemsize
+        rows = column_rows if rows is None else min(rows, column_rows)
+    return {name: _map_column(os.path.join(path, f"{name}.col"), COLUMNS[name], rows) for name in names}
+
+
+def scan(directory: str, columns: list[str] = None, start: float = None, end: float = None) -> Iterator[dict]:
+    """Maps the segments of a telemetry directory one at a time, oldest first.
+
+    Args:
+        directory (str): The telemetry directory.
+        columns (list[str], optional): The columns to map. Defaults to all of COLUMNS.
+        start (float, optional): Skip segments that ended before this time.
+        end (float, optional): Skip segments that started at or after this time.
+
+    Yields:
+        dict: Column name -> mapped column, per segment. Rows are not filtered by time within a segment.
+    """
+    segments = list_segments(directory)
+    for index, (segment_start, path) in enumerate(segments):
+        if end is not None and segment_start >= end:
+            return
+        if start is not None and index + 1 < len(segments) and segments[index + 1][0] <= start:
+            continue
+        yield read_segment(path, columns)
@@ -0,0 +1,39 @@
+"""Shared fixtures for tests that need a whole ElevatorSystem."""
+import sys
+import os
+from unittest.mock import Mock
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from elevator_system import ElevatorSystem
+from elevator_component_factory import ElevatorComponentFactory
+from database_manager import DatabaseManager
+
+
+def make_mock_db_manager() -> Mock:
+    """Returns a Mock DatabaseManager whose store is empty, so systems built on it start fresh."""
+    db_manager = Mock(spec=DatabaseManager)
+    db_manager.load_system_state.return_value = None
+    db_manager.load_car_state.return_value = None
+    db_manager.load_car_requests.return_value = []
+    db_manager.load_system_requests.return_value = []
+    db_manager.load_car_ids.return_value = []
+    return db_manager
+
+
+def make_system(num_cars: int = 1, time_provider=None, db_manager: Mock = None, num_floors: int = 10) -> ElevatorSystem:
+    """Builds a fresh ElevatorSystem, discarding any existing singleton instance.
+
+    Args:
+        num_cars (int, optional): The number of cars. Defaults to 1.
+        time_provider (TimeProvider, optional): The clock shared by the system and its cars. Defaults to real clocks.
+        db_manager (Mock, optional): The database manager. Defaults to a new make_mock_db_manager().
+        num_floors (int, optional): The number of floors. Defaults to 10.
+
+    Returns:
+        ElevatorSystem: The new system.
+    """
+    ElevatorSystem._instance = None
+    return ElevatorSystem(num_floors=num_floors, num_cars=num_cars,
+                          database_manager=db_manager if db_manager is not None else make_mock_db_manager(),
+                          factory=ElevatorComponentFactory(time_provider))
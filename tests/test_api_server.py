@@ -0,0 +1,80 @@
+import unittest
+import sys
+import os
+import tempfile
+import time
+from unittest.mock import patch
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from api_server import ApiServer, ApiClient
+from call_admission import CallAdmission
+from enums import Direction
+from metrics import MetricsRegistry
+from time_provider import MockTimeProvider
+from tests.helpers import make_system
+
+
+class TestApiServer(unittest.TestCase):
+    def setUp(self):
+        self.time_provider = MockTimeProvider()
+        self.system = make_system(num_cars=2, time_provider=self.time_provider)
+        self.system.enable_call_admission(CallAdmission(self.time_provider, rate=1000.0, burst=100000, queue_size=100000,
+                                                        is_pending=self.system.hall_calls.is_pressed,
+                                                        metrics=MetricsRegistry()))
+        self.server = ApiServer(self.system)
+        self.client = ApiClient(self.server.start())
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    @patch('builtins.print')
+    def test_calls_are_queued_for_the_control_loop(self, mock_print):
+        self.assertEqual(self.client.request("call", floor=3, direction="UP"), {"id": 0, "ok": True, "result": "ADMITTED"})
+        response = self.client.request("call_batch", calls=[[3, "UP"], [7, "DOWN"]])
+        self.assertEqual(response["result"], ["COALESCED", "ADMITTED"])
+        self.assertEqual(self.client.request("car_call", car_id=1, floor=9)["result"], "ADMITTED")
+        self.assertEqual(self.system.request_manager.get_up_requests(), []) # Nothing registered off the control loop
+        self.time_provider.advance_time(1)
+        self.system.tick()
+        self.assertEqual(self.system.request_manager.get_up_requests(), [3])
+        self.assertEqual(self.system.request_manager.get_down_requests(), [7])
+        self.assertIn(9, self.system.get_car(1).up_requests)
+
+        status = self.client.request("status")["result"]
+        self.assertEqual(status["version"], self.system.get_snapshot().version)
+        self.assertEqual(status["pending_up_calls"], [3])
+        car = self.client.request("status", car_id=1)["result"]
+        self.assertEqual(car["direction"], "UP")
+
+    def test_invalid_requests_get_errors(self):
+        self.assertFalse(self.client.request("call", floor=30, direction="UP")["ok"])
+        self.assertFalse(self.client.request("call", floor=3, direction="SIDEWAYS")["ok"])
+        self.assertFalse(self.client.request("car_call", car_id=5, floor=3)["ok"])
+        self.assertFalse(self.client.request("status", car_id=5)["ok"])
+        response = self.client.request("teleport")
+        self.assertEqual(response["error"], "ValueError: Unknown operation: teleport")
+        self.assertFalse(self.client.request("call", floor=3)["ok"]) # Missing field
+        self.assertTrue(self.client.request("status")["ok"]) # The connection survives errors
+
+    def test_pipelined_requests(self):
+        requests = [{"op": "call", "floor": i % 10, "direction": "UP" if i % 20 < 10 else "DOWN"} for i in range(2000)]
+        start = time.perf_counter()
+        responses = self.client.pipeline(requests)
+        elapsed = time.perf_counter() - start
+        self.assertEqual([response["id"] for response in responses], list(range(2000)))
+        self.assertTrue(all(response["ok"] for response in responses))
+        self.assertEqual(self.server.requests_served, 2000)
+        self.assertLess(elapsed, 5.0)
+
+    def test_unix_socket(self):
+        with tempfile.TemporaryDirectory() as directory:
+            server = ApiServer(self.system, unix_path=os.path.join(directory, "api.sock"))
+            with ApiClient(server.start()) as client:
+                self.assertEqual(client.request("call", floor=2, direction="DOWN")["result"], "ADMITTED")
+            server.stop()
+        self.assertEqual(self.system.call_admission.drain()[0], [(2, Direction.DOWN)])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from call_admission import CallAdmission
+from enums import Direction, Admission
+from metrics import MetricsRegistry
+from time_provider import MockTimeProvider
+
+
+class TestCallAdmission(unittest.TestCase):
+    def setUp(self):
+        self.time_provider = MockTimeProvider()
+        self.metrics = MetricsRegistry()
+        self.admission = CallAdmission(self.time_provider, debounce_seconds=0.5, rate=2.0, burst=3, queue_size=4,
+                                       metrics=self.metrics)
+
+    def test_duplicate_presses_are_coalesced(self):
+        self.assertEqual(self.admission.submit(3, Direction.UP), Admission.ADMITTED)
+        self.assertEqual(self.admission.submit(3, Direction.UP), Admission.COALESCED) # Still queued
+        self.assertEqual(self.admission.submit(3, Direction.DOWN), Admission.ADMITTED)
+        self.assertEqual(self.admission.drain(), ([(3, Direction.UP), (3, Direction.DOWN)], []))
+        self.time_provider.advance_time(0.2)
+        self.assertEqual(self.admission.submit(3, Direction.UP), Admission.COALESCED) # Within the debounce window
+        self.time_provider.advance_time(0.4)
+        self.assertEqual(self.admission.submit(3, Direction.UP), Admission.ADMITTED)
+        self.assertEqual(self.metrics.get("elevator_calls_coalesced").get(), 2)
+        self.assertEqual(self.metrics.get("elevator_calls_admitted").get(), 3)
+
+    def test_lit_buttons_are_coalesced(self):
+        admission = CallAdmission(self.time_provider, is_pending=lambda floor, direction: floor == 5, metrics=self.metrics)
+        self.assertEqual(admission.submit(5, Direction.UP), Admission.COALESCED)
+        self.assertEqual(admission.submit(6, Direction.UP), Admission.ADMITTED)
+
+    def test_token_bucket_per_source(self):
+        for floor in range(3):
+            self.assertEqual(self.admission.submit(floor, Direction.UP, "gateway"), Admission.ADMITTED)
+        self.assertEqual(self.admission.submit(3, Direction.UP, "gateway"), Admission.RATE_LIMITED)
+        self.assertEqual(self.admission.submit(3, Direction.UP, "lobby"), Admission.ADMITTED) # Other sources unaffected
+        self.admission.drain()
+        self.time_provider.advance_time(0.5) # One token refilled at 2 presses per second
+        self.assertEqual(self.admission.submit(4, Direction.UP, "gateway"), Admission.ADMITTED)
+        self.assertEqual(self.admission.submit(5, Direction.UP, "gateway"), Admission.RATE_LIMITED)
+        rejected = self.metrics.get("elevator_calls_rejected")
+        self.assertEqual(rejected.labels("rate_limited").get(), 2)
+
+    def test_bounded_queue_rejects_when_full(self):
+        for floor in range(4):
+            self.assertEqual(self.admission.submit(floor, Direction.DOWN, f"panel-{floor}"), Admission.ADMITTED)
+        self.assertEqual(self.admission.submit(9, Direction.DOWN, "panel-9"), Admission.QUEUE_FULL)
+        self.assertEqual(self.admission.pending(), 4)
+        self.assertEqual(self.metrics.get("elevator_intake_queue_depth").get(), 4)
+        self.assertEqual(len(self.admission.drain()[0]), 4)
+        self.assertEqual(self.admission.submit(9, Direction.DOWN, "panel-9"), Admission.ADMITTED)
+        self.assertEqual(self.metrics.get("elevator_calls_rejected").labels("queue_full").get(), 1)
+
+    def test_car_calls_share_limits_and_queue(self):
+        self.assertEqual(self.admission.submit_car_call(1, 7, "app"), Admission.ADMITTED)
+        self.assertEqual(self.admission.submit_car_call(1, 7, "app"), Admission.COALESCED)
+        self.assertEqual(self.admission.submit_car_call(2, 7, "app"), Admission.ADMITTED)
+        self.assertEqual(self.admission.submit(7, Direction.UP, "app"), Admission.ADMITTED)
+        self.assertEqual(self.admission.submit_car_call(3, 7, "app"), Admission.RATE_LIMITED)
+        self.assertEqual(self.admission.drain(), ([(7, Direction.UP)], [(1, 7), (2, 7)]))
+
+    def test_drain_timed_reports_first_hall_call(self):
+        self.admission.submit_car_call(1, 7)
+        self.time_provider.advance_time(0.1)
+        self.admission.submit(4, Direction.UP)
+        self.time_provider.advance_time(0.1)
+        self.admission.submit(6, Direction.DOWN)
+        self.assertEqual(self.admission.drain_timed(), ([(4, Direction.UP), (6, Direction.DOWN)], [(1, 7)], 0.1))
+        self.assertEqual(self.admission.drain_timed(), ([], [], None))
+
+    def test_submit_many(self):
+        results = self.admission.submit_many([(1, Direction.UP), (1, Direction.UP), (2, Direction.UP), (3, Direction.UP),
+                                              (4, Direction.UP)], "burst")
+        self.assertEqual(results, [Admission.ADMITTED, Admission.COALESCED, Admission.ADMITTED, Admission.ADMITTED,
+                                   Admission.RATE_LIMITED])
+        self.assertEqual(self.admission.pending(), 3)
+
+    def test_rejects_invalid_limits(self):
+        with self.assertRaises(ValueError):
+            CallAdmission(self.time_provider, rate=0)
+        with self.assertRaises(ValueError):
+            CallAdmission(self.time_provider, queue_size=0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+import sys
+import os
+from unittest.mock import Mock
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from elevator_car import ElevatorCar
+from door import Door
+from elevator_panel import ElevatorPanel
+from enums import Direction, DoorState
+from elevator_state import MovingUpState, MovingDownState
+from car_scheduler import LookScheduler, CLookScheduler, ShortestTimeFirstScheduler, create_scheduler
+from time_provider import MockTimeProvider
+
+
+class TestCarScheduler(unittest.TestCase):
+    def setUp(self):
+        self.time_provider = MockTimeProvider()
+
+    def _make_car(self, scheduler, floor=0):
+        db_manager = Mock()
+        db_manager.load_car_state.return_value = None
+        db_manager.load_car_requests.return_value = []
+        car = ElevatorCar(car_id=0, num_floors=20, door_open_duration=1, time_provider=self.time_provider,
+                          door=Door(), panel=ElevatorPanel(20), display=Mock(), database_manager=db_manager,
+                          scheduler=scheduler)
+        car.current_floor = floor
+        return car
+
+    def _run_to_completion(self, car, max_moves=200):
+        """Moves the car until its stops are served, returning the floors where its door opened."""
+        served = []
+        for _ in range(max_moves):
+            if not car.get_stop_plan() and car.door.get_state() == DoorState.CLOSED:
+                break
+            self.time_provider.advance_time(2) # Longer than the door dwell
+            car.move()
+            if car.door.get_state() == DoorState.OPEN and (not served or served[-1] != car.current_floor):
+                served.append(car.current_floor)
+        return served
+
+    def test_look_plans_both_sweeps(self):
+        car = self._make_car(LookScheduler(), floor=5)
+        for floor in (8, 2, 12, 6):
+            car.register_request(floor)
+        self.assertEqual(car.get_stop_plan(), (6, 8, 12, 2))
+        car.set_direction(Direction.DOWN)
+        car.invalidate_stop_plan()
+        self.assertEqual(car.get_stop_plan(), (2, 6, 8, 12))
+
+    def test_c_look_sweeps_up_only(self):
+        car = self._make_car(CLookScheduler(), floor=5)
+        for floor in (8, 2, 12, 3):
+            car.register_request(floor)
+        self.assertEqual(car.get_stop_plan(), (8, 12, 2, 3))
+        self.assertEqual(self._run_to_completion(car), [8, 12, 2, 3])
+
+    def test_shortest_time_first(self):
+        car = self._make_car(ShortestTimeFirstScheduler(), floor=5)
+        for floor in (9, 3, 1, 15):
+            car.register_request(floor)
+        self.assertEqual(car.get_stop_plan(), (3, 1, 9, 15))
+        self.assertEqual(self._run_to_completion(car), [3, 1, 9, 15])
+
+    def test_plan_is_cached_until_stops_change(self):
+        car = self._make_car(LookScheduler())
+        car.register_request(4)
+        plan = car.get_stop_plan()
+        car.move() # Idle -> moving up
+        car.move()
+        self.assertIs(car.get_stop_plan(), plan) # Moving between stops does not replan
+        car.register_request(7)
+        self.assertEqual(car.get_stop_plan(), (4, 7))
+
+    def test_car_call_behind_is_served_on_return_sweep(self):
+        car = self._make_car(LookScheduler())
+        car.register_request(6)
+        car.move() # Idle -> moving up
+        car.move()
+        car.move() # floor 2
+        self.assertIsInstance(car.get_state(), MovingUpState)
+        car.register_request(1) # Behind the car: kept, not dropped
+        self.assertEqual(car.down_requests, [1])
+        self.assertEqual(self._run_to_completion(car), [6, 1])
+
+    def test_turnaround_without_stop(self):
+        car = self._make_car(LookScheduler(), floor=5)
+        car.register_request(9)
+        car.move() # Idle -> moving up
+        car.remove_up_request(9)
+        car.add_down_request(2)
+        car.move() # Nothing left above: the plan turns the car around
+        self.assertIsInstance(car.get_state(), MovingDownState)
+        self.assertEqual(self._run_to_completion(car), [2])
+
+    def test_create_scheduler(self):
+        self.assertIsInstance(create_scheduler("c-look"), CLookScheduler)
+        with self.assertRaises(ValueError):
+            create_scheduler("elevator-algorithm")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import unittest
+import sys
+import os
+import io
+from types import SimpleNamespace
+from unittest.mock import patch
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from dashboard import TerminalDashboard
+from display import Display
+from enums import Direction
+from elevator_state import IDLE
+from tests.helpers import make_system
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestTerminalDashboard(unittest.TestCase):
+    def setUp(self):
+        self.stream = io.StringIO()
+        self.clock = FakeClock()
+        self.dashboard = TerminalDashboard(stream=self.stream, max_fps=10, clock=self.clock)
+        self.cars = []
+        for car_id in range(3):
+            display = Display()
+            display.update(0, Direction.STOP, IDLE)
+            self.cars.append(SimpleNamespace(car_id=car_id, display=display))
+
+    def take_output(self):
+        output = self.stream.getvalue()
+        self.stream.seek(0)
+        self.stream.truncate()
+        return output
+
+    def test_first_frame_draws_everything_and_cleans_displays(self):
+        self.assertTrue(self.dashboard.render(self.cars, [7], []))
+        output = self.take_output()
+        self.assertIn("\x1b[2J", output)
+        self.assertIn("Hall calls  up: 7  down: -", output)
+        for car_id in range(3):
+            self.assertIn(f"Car {car_id:>3}  Floor   0", output)
+        self.assertFalse(any(car.display.is_dirty() for car in self.cars))
+
+    def test_only_changed_cells_are_rewritten(self):
+        self.dashboard.render(self.cars)
+        self.take_output()
+        self.clock.now = 1.0
+        self.cars[1].display.update(12, Direction.UP, self.cars[1].display.state)
+        self.assertTrue(self.dashboard.render(self.cars))
+        output = self.take_output()
+        self.assertNotIn("\x1b[2J", output)
+        self.assertTrue(output.startswith("\x1b[3;17H")) # Row 3 (car 1), from the first changed character
+        self.assertIn("12  UP  ", output)
+        self.assertNotIn("Car", output)
+
+        self.clock.now = 2.0
+        self.assertTrue(self.dashboard.render(self.cars)) # Nothing changed: no bytes written
+        self.assertEqual(self.take_output(), "")
+
+    def test_frame_rate_is_capped(self):
+        self.dashboard.render(self.cars)
+        self.take_output()
+        self.cars[0].display.update(3, Direction.UP, self.cars[0].display.state)
+        self.clock.now = 0.05
+        self.assertFalse(self.dashboard.render(self.cars))
+        self.assertEqual(self.take_output(), "")
+        self.assertTrue(self.cars[0].display.is_dirty()) # Left for the next frame
+        self.clock.now = 0.1
+        self.assertTrue(self.dashboard.render(self.cars))
+        self.assertIn("\x1b[2;18H3  UP", self.take_output())
+        self.assertEqual(self.dashboard.frames_drawn, 2)
+
+    def test_shorter_row_is_blanked(self):
+        self.dashboard.render(self.cars, [1, 2, 3], [])
+        self.take_output()
+        self.clock.now = 1.0
+        self.dashboard.render(self.cars, [1], [])
+        output = self.take_output()
+        self.assertTrue(output.startswith("\x1b[1;19H"))
+        self.assertIn(" down: -    \x1b[", output)
+
+class TestSystemDashboard(unittest.TestCase):
+    def setUp(self):
+        self.system = make_system(num_cars=2)
+
+    @patch('builtins.print')
+    def test_monitoring_draws_dashboard_instead_of_printing(self, mock_print):
+        stream = io.StringIO()
+        dashboard = self.system.enable_dashboard(TerminalDashboard(stream=stream, max_fps=0))
+        self.system.call_elevator(5, Direction.UP)
+        self.system.tick()
+        mock_print.assert_not_called()
+        self.assertIn("Hall calls", stream.getvalue())
+        self.assertEqual(dashboard.frames_drawn, 1)
+
+        self.system.disable_dashboard()
+        self.assertIsNone(self.system.dashboard)
+        self.system.tick()
+        self.assertEqual(mock_print.call_count, 2) # One display line per car again
+
+if __name__ == '__main__':
+    unittest.main()
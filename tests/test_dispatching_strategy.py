@@ -14,8 +14,10 @@ class TestClosestCarStrategy(unittest.TestCase):
     def setUp(self):
         self.strategy = ClosestCarStrategy()
 
-    def create_mock_car(self, car_id, current_floor, direction, state_instance, up_requests=None, down_requests=None):
+    def create_mock_car(self, car_id, current_floor, direction, state_instance, up_requests=None, down_requests=None, load_factor=0.0):
         mock_car = Mock()
+        mock_car.is_full.return_value = load_factor >= 1.0
+        mock_car.get_load_factor.return_value = load_factor
         mock_car.car_id = car_id
         mock_car.get_current_floor.return_value = current_floor
         mock_car.get_direction.return_value = direction # Use getter
@@ -166,5 +168,15 @@ class TestClosestCarStrategy(unittest.TestCase):
         best_car = self.strategy.find_best_car(cars, 4, Direction.UP)
         self.assertEqual(best_car, car2) # Moving car is closer and on the way
 
+    def test_full_car_is_never_assigned(self):
+        full_car = self.create_mock_car(1, 5, Direction.STOP, IdleState(None), load_factor=1.0)
+        self.assertIsNone(self.strategy.find_best_car([full_car], 5, Direction.UP))
+
+    def test_fuller_car_is_penalized(self):
+        crowded = self.create_mock_car(1, 4, Direction.UP, MovingUpState(None), up_requests=[9], load_factor=0.75)
+        empty = self.create_mock_car(2, 2, Direction.UP, MovingUpState(None), up_requests=[9])
+        self.assertEqual(self.strategy.find_best_car([crowded, empty], 6, Direction.UP), empty) # 2 + 3 floors vs 4
+        self.assertEqual(ClosestCarStrategy(load_penalty=0).find_best_car([crowded, empty], 6, Direction.UP), crowded)
+
 if __name__ == '__main__':
     unittest.main()
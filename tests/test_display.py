@@ -31,5 +31,15 @@ class TestDisplay(unittest.TestCase):
         self.assertEqual(self.display.direction, Direction.UP)
         self.assertEqual(self.display.state.__class__.__name__, "MockMovingUpState") # Assert string value
 
+    def test_dirty_only_on_change(self):
+        state = object()
+        self.assertTrue(self.display.is_dirty())
+        self.assertTrue(self.display.update(3, Direction.UP, state))
+        self.display.mark_clean()
+        self.assertFalse(self.display.update(3, Direction.UP, state))
+        self.assertFalse(self.display.is_dirty())
+        self.assertTrue(self.display.update(4, Direction.UP, state))
+        self.assertTrue(self.display.is_dirty())
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+import sys
+import os
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from door_dwell import FixedDwellPolicy, AdaptiveDwellPolicy
+
+
+def _local_time(hour):
+    """Returns the epoch time of a given local hour on a fixed day."""
+    return time.mktime((2026, 3, 4, hour, 30, 0, 0, 0, -1))
+
+
+class TestDoorDwell(unittest.TestCase):
+    def setUp(self):
+        self.policy = AdaptiveDwellPolicy(car_call_dwell=1.0, hall_call_dwell=2.0, lobby_peak_dwell=4.0,
+                                          lobby_floor=0, peak_hours=((7, 10), (16, 19)), min_dwell=0.5)
+
+    def test_fixed_policy(self):
+        policy = FixedDwellPolicy(3)
+        self.assertEqual(policy.dwell_time(0, True, False, _local_time(8)), 3)
+        self.assertEqual(policy.min_dwell, 0.0)
+
+    def test_drop_off_is_shorter_than_pickup(self):
+        off_peak = _local_time(12)
+        self.assertEqual(self.policy.dwell_time(5, True, False, off_peak), 1.0)
+        self.assertEqual(self.policy.dwell_time(5, False, True, off_peak), 2.0)
+        self.assertEqual(self.policy.dwell_time(5, True, True, off_peak), 2.0)
+
+    def test_lobby_during_peak(self):
+        self.assertTrue(self.policy.is_peak(_local_time(8)))
+        self.assertTrue(self.policy.is_peak(_local_time(17)))
+        self.assertFalse(self.policy.is_peak(_local_time(12)))
+        self.assertEqual(self.policy.dwell_time(0, True, False, _local_time(8)), 4.0)
+        self.assertEqual(self.policy.dwell_time(0, True, False, _local_time(12)), 1.0)
+        self.assertEqual(self.policy.dwell_time(3, False, True, _local_time(8)), 2.0)
+
+if __name__ == '__main__':
+    unittest.main()
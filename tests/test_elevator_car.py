@@ -7,7 +7,11 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from elevator_car import ElevatorCar
 from enums import Direction, DoorState
 from elevator_state import IdleState, MovingUpState, MovingDownState, MaintenanceState
+from elevator_state_factory import ElevatorStateFactory
+from commands import Command
 from time_provider import MockTimeProvider
+from door_dwell import AdaptiveDwellPolicy
+from elevator_panel import ElevatorPanel, HallCallBoard
 from unittest.mock import Mock
 
 class TestElevatorCar(unittest.TestCase):
@@ -61,6 +65,9 @@ class TestElevatorCar(unittest.TestCase):
         self.assertEqual(len(self.elevator_car.up_requests), 0)
         self.assertEqual(len(self.elevator_car.down_requests), 0)
 
+    def test_car_is_slotted(self):
+        self.assertFalse(hasattr(self.elevator_car, '__dict__'))
+
     def test_register_request_up(self):
         self.elevator_car.register_request(5)
         self.assertEqual(self.elevator_car.up_requests, [5])
@@ -169,8 +176,124 @@ class TestElevatorCar(unittest.TestCase):
         self.assertEqual(len(self.elevator_car.up_requests), 0) # All up requests should be fulfilled
         self.assertIsInstance(self.elevator_car.get_state(), IdleState) # Should be idle after fulfilling all requests
 
-if __name__ == '__main__':
-    unittest.main()
+    def test_command_buffer_is_reused(self):
+        self.elevator_car.register_request(3)
+        self.elevator_car.move()
+        buffer = self.elevator_car._move_commands
+        self.elevator_car.move()
+        self.assertIs(self.elevator_car._move_commands, buffer)
+        self.assertEqual(buffer, [Command.INCREMENT_FLOOR, None])
+
+    def test_validation_mode_skips_unknown_commands(self):
+        class AddRequestOnMoveState(IdleState):
+            def move(self, car, out):
+                out.append(Command.ADD_UP_REQUEST)
+                out.append(7)
+                out.append(Command.SET_DIRECTION)
+                out.append(Direction.UP)
+
+        self.elevator_car.validate_commands = True
+        self.elevator_car.set_state(AddRequestOnMoveState())
+        with self.assertLogs(level='WARNING') as logs:
+            self.elevator_car.move()
+        self.assertIn("Unknown command received in move", logs.output[0])
+        self.assertEqual(self.elevator_car.up_requests, [])
+        self.assertEqual(self.elevator_car.direction, Direction.UP)
+
+    def test_states_are_shared_flyweights(self):
+        self.assertIs(IdleState(self.elevator_car), IdleState(None))
+        self.elevator_car.register_request(3)
+        self.elevator_car.move() # Transition to MovingUpState
+        moving_state = self.elevator_car.get_state()
+        self.elevator_car.move()
+        self.assertIs(self.elevator_car.get_state(), moving_state)
+        self.assertIs(moving_state, MovingUpState())
+
+    def test_save_state_persists_state_code(self):
+        self.elevator_car.enter_maintenance()
+        self.elevator_car.save_state()
+        saved_state = self.mock_db_manager.save_car_state.call_args[0][3]
+        self.assertEqual(saved_state, MaintenanceState.code)
+        self.assertIs(ElevatorStateFactory.create_state(saved_state), MaintenanceState())
+
+    def test_load_state_accepts_codes_and_legacy_names(self):
+        self.assertIsInstance(ElevatorStateFactory.create_state(MovingDownState.code), MovingDownState)
+        self.assertIsInstance(ElevatorStateFactory.create_state(str(MovingUpState.code)), MovingUpState) # TEXT column
+        self.assertIsInstance(ElevatorStateFactory.create_state("IdleState"), IdleState)
+        with self.assertRaises(ValueError):
+            ElevatorStateFactory.create_state(42)
+        with self.assertRaises(ValueError):
+            ElevatorStateFactory.create_state("FlyingState")
+
+    def test_load_tracking(self):
+        self.assertEqual(self.elevator_car.update_load(boarded=5, alighted=0), 5)
+        self.assertAlmostEqual(self.elevator_car.get_load_factor(), 5 / self.elevator_car.capacity)
+        self.assertEqual(self.elevator_car.update_load(boarded=0, alighted=9), 0) # Clamped at empty
+        self.elevator_car.update_load(boarded=self.elevator_car.capacity + 3, alighted=0)
+        self.assertTrue(self.elevator_car.is_full())
+        with self.assertRaises(ValueError):
+            self.elevator_car.update_load(boarded=-1, alighted=0)
+
+    def test_full_car_passes_hall_stops(self):
+        self.mock_panel.is_floor_button_pressed.side_effect = lambda floor: floor == 3 # Someone aboard wants 3
+        self.elevator_car.update_load(boarded=self.elevator_car.capacity, alighted=0)
+        self.elevator_car.register_request(2) # Hall call nobody could board
+        self.elevator_car.register_request(3)
+        self.elevator_car.move() # Transition to MovingUpState
+        self.elevator_car.move() # Floor 1
+        self.elevator_car.move() # Floor 2: passed without opening
+        self.assertEqual(self.elevator_car.get_current_floor(), 2)
+        self.assertFalse(self.elevator_car.door.is_open())
+        self.assertEqual(self.elevator_car.up_requests, [3])
+        self.elevator_car.move() # Floor 3: car call, door opens
+        self.assertTrue(self.elevator_car.door.is_open())
+
+    def _make_dwell_car(self):
+        """Builds a car with a real panel, a hall call board and an adaptive dwell policy (no peaks)."""
+        self.hall_calls = HallCallBoard()
+        policy = AdaptiveDwellPolicy(car_call_dwell=1.0, hall_call_dwell=3.0, peak_hours=(), min_dwell=0.5)
+        return ElevatorCar(car_id=2, num_floors=10, door_open_duration=2, time_provider=self.time_provider,
+                           door=self.mock_door, panel=ElevatorPanel(10), display=self.mock_display,
+                           database_manager=self.mock_db_manager, dwell_policy=policy, hall_calls=self.hall_calls)
+
+    def test_adaptive_dwell_per_stop(self):
+        car = self._make_dwell_car()
+        car.panel.press_floor_button(0)
+        car.open_door_and_notify()
+        self.assertEqual(car.door_dwell, 1.0) # Drop-off only
+        self.assertFalse(car.panel.is_floor_button_pressed(0))
+        self.time_provider.advance_time(1.1)
+        car.move()
+        self.assertEqual(car.door.get_state(), DoorState.CLOSED)
+
+        self.hall_calls.press(0, Direction.UP)
+        car.open_door_and_notify()
+        self.assertEqual(car.door_dwell, 3.0) # Passengers boarding
+        self.time_provider.advance_time(1.1)
+        car.move()
+        self.assertEqual(car.door.get_state(), DoorState.OPEN)
+
+    def test_close_button_cuts_dwell_short(self):
+        car = self._make_dwell_car()
+        car.open_door_and_notify()
+        car.press_close_button()
+        self.assertEqual(car.door_dwell, 0.5) # Never below the policy's minimum
+        self.assertTrue(car.panel.close_button.is_pressed())
+        self.time_provider.advance_time(0.6)
+        car.move()
+        self.assertEqual(car.door.get_state(), DoorState.CLOSED)
+        self.assertFalse(car.panel.close_button.is_pressed())
+
+    def test_reopening_restarts_dwell(self):
+        car = self._make_dwell_car()
+        car.open_door_and_notify()
+        self.time_provider.advance_time(2.5)
+        self.assertTrue(car.is_serving_floor(0, Direction.UP))
+        car.open_door_and_notify() # A new hall call at the floor holds the door
+        self.time_provider.advance_time(2.5)
+        car.move()
+        self.assertEqual(car.door.get_state(), DoorState.OPEN)
+        self.assertFalse(car.is_serving_floor(1, Direction.UP))
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -5,7 +5,7 @@ import os
 # Add the parent directory to the sys.path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from elevator_panel import ElevatorPanel, HallPanel
+from elevator_panel import ElevatorPanel, HallPanel, HallCallBoard
 from button import ElevatorButton, DoorButton, EmergencyButton, HallButton
 from enums import Direction
 
@@ -44,6 +44,29 @@ class TestElevatorPanel(unittest.TestCase):
         self.assertTrue(self.panel.emergency_button.is_pressed())
         self.panel.emergency_button.reset()
 
+    def test_floor_button_bitmask_queries(self):
+        self.assertFalse(self.panel.any_floor_button_pressed())
+        self.assertIsNone(self.panel.next_pressed_above(0))
+        for floor in (2, 7, 4):
+            self.panel.press_floor_button(floor)
+        self.assertTrue(self.panel.any_floor_button_pressed())
+        self.assertEqual(self.panel.get_pressed_floors(), [2, 4, 7])
+        self.assertEqual(self.panel.next_pressed_above(2), 4)
+        self.assertEqual(self.panel.next_pressed_above(7), None)
+        self.assertEqual(self.panel.next_pressed_below(7), 4)
+        self.assertEqual(self.panel.next_pressed_below(2), None)
+        self.panel.floor_buttons[4].reset()
+        self.assertFalse(self.panel.is_floor_button_pressed(4))
+        self.assertEqual(self.panel.next_pressed_above(2), 7)
+        self.panel.clear_floor_button(2)
+        self.assertEqual(self.panel.get_pressed_floors(), [7])
+
+    def test_press_out_of_range_floor_button(self):
+        with self.assertRaises(IndexError):
+            self.panel.press_floor_button(self.num_floors)
+        with self.assertRaises(IndexError):
+            self.panel.floor_buttons[self.num_floors]
+
 class TestHallPanel(unittest.TestCase):
     def test_initialization_middle_floor(self):
         panel = HallPanel(floor_number=5, top_floor=10)
@@ -90,5 +113,30 @@ class TestHallPanel(unittest.TestCase):
         panel_bottom.press_down_button() # This should not raise an error
         # No assertion on button state, as it doesn't exist.
 
+    def test_panels_share_a_hall_call_board(self):
+        board = HallCallBoard()
+        panels = [HallPanel(floor_number=i, top_floor=9, board=board) for i in range(10)]
+        panels[6].press_down_button()
+        panels[3].press_up_button()
+        self.assertTrue(board.is_pressed(6, Direction.DOWN))
+        self.assertTrue(panels[3].get_up_button().is_pressed())
+        self.assertTrue(board.any_pressed())
+        self.assertTrue(board.any_pressed(Direction.DOWN))
+        self.assertEqual(board.next_pressed_above(3), 6)
+        self.assertIsNone(board.next_pressed_above(3, Direction.UP))
+        self.assertEqual(board.next_pressed_below(6, Direction.UP), 3)
+        board.clear_floor(6)
+        self.assertFalse(panels[6].get_down_button().is_pressed())
+        panels[3].get_up_button().reset()
+        self.assertFalse(board.any_pressed())
+
+    def test_hall_call_board_press_many(self):
+        board = HallCallBoard()
+        board.press_many([(2, Direction.UP), (7, Direction.DOWN), (2, Direction.DOWN)])
+        self.assertTrue(board.is_pressed(2, Direction.UP))
+        self.assertTrue(board.is_pressed(2, Direction.DOWN))
+        self.assertTrue(board.is_pressed(7, Direction.DOWN))
+        self.assertFalse(board.is_pressed(7, Direction.UP))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
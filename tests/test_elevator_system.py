@@ -1,16 +1,21 @@
 import unittest
 import sys
 import os
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
+import dataclasses
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from elevator_system import ElevatorSystem
-from enums import Direction
+from enums import Direction, DoorState, Admission
+from call_admission import CallAdmission
+from metrics import MetricsRegistry
 from elevator_state import MovingUpState, MovingDownState
 from dispatching_strategy import ClosestCarStrategy
 from database_manager import DatabaseManager # Import DatabaseManager
 from config import NUM_FLOORS # Import NUM_FLOORS from config
+from time_provider import MockTimeProvider
+from tests.helpers import make_system
 
 class TestElevatorSystem(unittest.TestCase):
     def setUp(self):
@@ -86,5 +91,198 @@ class TestElevatorSystem(unittest.TestCase):
         self.assertEqual(car.up_requests, [])
         self.assertEqual(self.system.request_manager.get_up_requests(), [5])
 
+    def test_hall_call_board_tracks_calls(self):
+        self.assertFalse(self.system.has_pending_hall_calls())
+        self.system.call_elevator(5, Direction.UP)
+        self.assertTrue(self.system.has_pending_hall_calls(Direction.UP))
+        self.assertFalse(self.system.has_pending_hall_calls(Direction.DOWN))
+        self.assertTrue(self.system.floors[5].get_panel().get_up_button().is_pressed())
+        car = self.system.get_cars()[0]
+        car.current_floor = 5
+        car.open_door_and_notify()
+        self.assertTrue(self.system.has_pending_hall_calls()) # Delivered with the next batch
+        self.system.event_bus.flush()
+        self.assertFalse(self.system.has_pending_hall_calls())
+
+    @patch('builtins.print')
+    def test_tick_publishes_immutable_snapshot(self, mock_print):
+        initial = self.system.get_snapshot()
+        self.assertEqual(initial.version, 0)
+        self.system.call_elevator(3, Direction.UP)
+        self.system.tick()
+        snapshot = self.system.get_snapshot()
+        self.assertEqual(snapshot.version, 1)
+        self.assertEqual(snapshot.pending_up_calls, (3,))
+        car = snapshot.get_car(0)
+        self.assertEqual(car.state, "MovingUpState")
+        self.assertEqual(car.up_requests, (3,))
+        self.assertEqual(initial.pending_up_calls, ()) # Old snapshots never change
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            snapshot.version = 5
+        with self.assertRaises(ValueError):
+            snapshot.get_car(9)
+
+    @patch('builtins.print')
+    def test_add_and_retire_cars_at_runtime(self, mock_print):
+        time_provider = MockTimeProvider()
+        self.system = make_system(time_provider=time_provider, db_manager=self.mock_db_manager)
+        new_car = self.system.add_car()
+        self.assertEqual(new_car.car_id, 1)
+        self.assertIs(self.system.get_car(1), new_car)
+        self.assertEqual(self.system.num_cars, 2)
+        self.mock_db_manager.save_system_state.assert_called_with(self.system.num_floors, 2)
+        with self.assertRaises(ValueError):
+            self.system.add_car(1)
+
+        # Car 0 gets a passenger going to 6 and the hall call at 4; retiring it hands the hall call to car 1
+        car = self.system.get_car(0)
+        self.system.press_car_button(0, 6)
+        self.system.call_elevator(4, Direction.UP)
+        self.system.dispatcher()
+        self.assertEqual(car.up_requests, [4, 6])
+        self.system.retire_car(0)
+        self.assertTrue(self.system.is_retiring(0))
+        self.assertEqual(car.up_requests, [6])
+        self.system.dispatcher()
+        self.assertEqual(new_car.up_requests, [4])
+
+        for _ in range(20):
+            if not self.system.is_retiring(0):
+                break
+            time_provider.advance_time(3) # Longer than the door dwell
+            self.system.tick()
+        self.assertFalse(self.system.is_retiring(0))
+        self.assertEqual(car.get_current_floor(), 6) # The passenger was delivered before the car left
+        self.assertEqual([c.car_id for c in self.system.get_cars()], [1])
+        self.mock_db_manager.delete_car.assert_called_once_with(0)
+        with self.assertRaises(ValueError):
+            self.system.get_car(0)
+        with self.assertRaises(ValueError):
+            self.system.retire_car(0)
+
+    def test_saved_car_ids_survive_restart(self):
+        self.mock_db_manager.load_system_state.return_value = {"num_floors": 10, "num_cars": 2}
+        self.mock_db_manager.load_car_ids.return_value = [0, 2]
+        system = make_system(num_cars=5, db_manager=self.mock_db_manager)
+        self.assertEqual([car.car_id for car in system.get_cars()], [0, 2])
+        self.assertEqual(system.add_car().car_id, 3)
+
+    @patch('builtins.print')
+    def test_hall_call_holds_open_door(self, mock_print):
+        time_provider = MockTimeProvider()
+        self.system = make_system(time_provider=time_provider, db_manager=self.mock_db_manager)
+        car = self.system.get_car(0)
+        car.open_door_and_notify()
+        time_provider.advance_time(car.door_dwell - 0.1)
+        self.system.call_elevator(0, Direction.UP)
+        self.assertEqual(car.door_open_time, time_provider.get_time()) # Dwell restarted for the new passengers
+        time_provider.advance_time(0.5)
+        self.system.tick()
+        self.assertEqual(car.door.get_state(), DoorState.OPEN)
+        self.system.press_door_close(0)
+        time_provider.advance_time(car.dwell_policy.min_dwell)
+        self.system.tick()
+        self.assertEqual(car.door.get_state(), DoorState.CLOSED)
+        with self.assertRaises(ValueError):
+            self.system.press_door_close(7)
+
+    def test_call_admission_queues_until_next_tick(self):
+        self.system.enable_call_admission(CallAdmission(self.system.time_provider, rate=1.0, burst=1, metrics=MetricsRegistry()))
+        self.assertEqual(self.system.call_elevator(5, Direction.UP, source="gateway"), Admission.ADMITTED)
+        self.assertEqual(self.system.call_elevator(5, Direction.UP, source="gateway"), Admission.COALESCED)
+        self.assertEqual(self.system.call_elevator(6, Direction.UP, source="gateway"), Admission.RATE_LIMITED)
+        self.assertEqual(self.system.request_manager.get_up_requests(), [])
+        self.system.dispatcher()
+        self.assertEqual(self.system.request_manager.get_up_requests(), [5])
+        self.assertTrue(self.system.hall_calls.is_pressed(5, Direction.UP))
+        self.assertEqual(self.system.call_elevator(5, Direction.UP, source="lobby"), Admission.COALESCED) # Already lit
+
+    def test_call_to_missing_floor_changes_nothing(self):
+        for floor in (-1, self.system.num_floors):
+            with self.assertRaises(ValueError):
+                self.system.call_elevator(floor, Direction.UP)
+        with self.assertRaises(ValueError):
+            self.system.call_elevator_many([(2, Direction.UP), (-1, Direction.DOWN)])
+        self.assertEqual(self.system.request_manager.get_up_requests(), [])
+        self.assertEqual(self.system.request_manager.get_down_requests(), [])
+        self.assertFalse(self.system.has_pending_hall_calls())
+        car = self.system.get_car(0)
+        for floor in (-1, self.system.num_floors):
+            with self.assertRaises(ValueError):
+                self.system.press_car_button(0, floor)
+        self.assertEqual(car.up_requests + car.down_requests, [])
+        self.assertEqual(car.panel.get_pressed_floors(), [])
+
+    def test_call_elevator_many_merges_a_batch(self):
+        self.system.call_elevator(4, Direction.UP)
+        results = self.system.call_elevator_many([(8, Direction.UP), (4, Direction.UP), (2, Direction.UP), (6, Direction.DOWN),
+                                                  (9, Direction.DOWN), (6, Direction.DOWN)])
+        self.assertEqual(results, [Admission.ADMITTED] * 6)
+        self.assertEqual(self.system.request_manager.get_up_requests(), [2, 4, 8])
+        self.assertEqual(self.system.request_manager.get_down_requests(), [9, 6])
+        self.assertTrue(self.system.hall_calls.is_pressed(9, Direction.DOWN))
+
+    def test_dispatch_window_assigns_bursts_together(self):
+        time_provider = MockTimeProvider()
+        system = make_system(time_provider=time_provider, db_manager=self.mock_db_manager)
+        system.dispatch_window = 0.005
+        car = system.get_car(0)
+        system.call_elevator(3, Direction.UP)
+        system.dispatcher()
+        self.assertEqual(car.up_requests, []) # Held back while the window is open
+        self.assertAlmostEqual(system.dispatch_window_remaining(), 0.005)
+        time_provider.advance_time(0.003)
+        system.call_elevator_many([(7, Direction.UP), (5, Direction.DOWN)]) # Joins the open batch
+        system.dispatcher()
+        self.assertEqual(car.up_requests, [])
+        time_provider.advance_time(0.002)
+        self.assertEqual(system.dispatch_window_remaining(), 0.0)
+        system.dispatcher()
+        self.assertEqual(car.up_requests, [3, 5, 7])
+
+    def test_dispatch_window_runs_from_the_admitted_press(self):
+        time_provider = MockTimeProvider()
+        system = make_system(time_provider=time_provider, db_manager=self.mock_db_manager)
+        system.enable_call_admission(CallAdmission(time_provider, metrics=MetricsRegistry()))
+        system.dispatch_window = 0.005
+        car = system.get_car(0)
+        system.call_elevator(3, Direction.UP)
+        time_provider.advance_time(0.003)
+        system.dispatcher() # Drains the call; its window opened at the press
+        self.assertEqual(car.up_requests, [])
+        self.assertAlmostEqual(system.dispatch_window_remaining(), 0.002)
+        time_provider.advance_time(0.002)
+        system.call_elevator(7, Direction.UP) # Queued as the window closes: joins this pass
+        system.dispatcher()
+        self.assertEqual(car.up_requests, [3, 7])
+        self.assertEqual(system.dispatch_window_remaining(), 0.0)
+
+    @patch('builtins.print')
+    def test_quiescent_ticks_skip_saving(self, mock_print):
+        time_provider = MockTimeProvider()
+        system = make_system(time_provider=time_provider, db_manager=self.mock_db_manager)
+        self.assertTrue(system.is_quiescent())
+        saves = self.mock_db_manager.save_system_state.call_count
+        system.tick()
+        system.tick()
+        self.assertEqual(self.mock_db_manager.save_system_state.call_count, saves + 1) # Only the first idle tick saves
+
+        system.call_elevator(2, Direction.UP)
+        self.assertFalse(system.is_quiescent())
+        self.assertTrue(system.wait_for_activity(timeout=0)) # The call is not slept through
+        for _ in range(10):
+            system.tick()
+            time_provider.advance_time(1)
+        self.assertEqual(system.get_car(0).get_current_floor(), 2)
+        self.assertTrue(system.is_quiescent()) # Served, door closed again
+        saves = self.mock_db_manager.save_system_state.call_count
+        system.tick()
+        self.assertEqual(self.mock_db_manager.save_system_state.call_count, saves)
+        self.assertFalse(system.wait_for_activity(timeout=0))
+
+        system.notify_activity() # E.g. an external timer: the next tick saves again
+        system.tick()
+        self.assertEqual(self.mock_db_manager.save_system_state.call_count, saves + 1)
+
 if __name__ == '__main__':
     unittest.main()
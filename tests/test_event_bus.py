@@ -0,0 +1,96 @@
+import unittest
+import sys
+import os
+import threading
+from unittest.mock import Mock, patch
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from event_bus import EventBus, HallCallRegistered, RequestFulfilled
+from enums import Direction
+from request_manager import RequestManager
+from metrics import MetricsRegistry
+from time_provider import MockTimeProvider
+from tests.helpers import make_mock_db_manager, make_system
+
+class TestEventBus(unittest.TestCase):
+    def setUp(self):
+        self.bus = EventBus()
+
+    def tearDown(self):
+        self.bus.close()
+
+    def test_events_are_batched_per_topic_until_flush(self):
+        fulfilled = []
+        calls = []
+        self.bus.subscribe(RequestFulfilled.topic, fulfilled.append)
+        self.bus.subscribe(HallCallRegistered.topic, calls.append)
+        self.bus.publish(RequestFulfilled(car_id=0, floor=3, timestamp=1.0))
+        self.bus.publish(HallCallRegistered(floor=5, direction=Direction.UP, timestamp=1.0))
+        self.bus.publish(RequestFulfilled(car_id=1, floor=7, timestamp=2.0))
+        self.assertEqual(fulfilled, [])
+        self.assertEqual(self.bus.pending_count(), 3)
+
+        self.assertEqual(self.bus.flush(), 3)
+        self.assertEqual(len(fulfilled), 1) # One batch...
+        self.assertEqual([event.floor for event in fulfilled[0]], [3, 7]) # ...in publish order
+        self.assertEqual(calls, [[HallCallRegistered(5, Direction.UP, 1.0)]])
+        self.assertEqual(self.bus.flush(), 0)
+
+    def test_asynchronous_subscribers_run_on_worker_thread(self):
+        threads = []
+        self.bus.subscribe(RequestFulfilled.topic, lambda batch: threads.append(threading.current_thread()), asynchronous=True)
+        self.bus.publish(RequestFulfilled(car_id=0, floor=3, timestamp=1.0))
+        self.bus.flush()
+        self.bus.join()
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], threading.current_thread())
+
+    @patch('event_bus.logger.exception')
+    def test_failing_handler_does_not_stop_delivery(self, mock_log):
+        received = []
+        self.bus.subscribe(RequestFulfilled.topic, Mock(side_effect=RuntimeError("boom")))
+        self.bus.subscribe(RequestFulfilled.topic, received.append)
+        self.bus.publish(RequestFulfilled(car_id=0, floor=3, timestamp=1.0))
+        self.bus.flush()
+        self.assertEqual(len(received), 1)
+        mock_log.assert_called_once()
+
+    def test_unsubscribe(self):
+        received = []
+        self.bus.subscribe(RequestFulfilled.topic, received.append)
+        self.bus.unsubscribe(RequestFulfilled.topic, received.append)
+        self.bus.publish(RequestFulfilled(car_id=0, floor=3, timestamp=1.0))
+        self.bus.flush()
+        self.assertEqual(received, [])
+
+class TestBatchedRequestRemoval(unittest.TestCase):
+    def test_remove_requests_at_clears_both_directions(self):
+        metrics = MetricsRegistry()
+        time_provider = MockTimeProvider(100)
+        request_manager = RequestManager(make_mock_db_manager(), time_provider, metrics=metrics)
+        for floor, direction in ((2, Direction.UP), (5, Direction.UP), (5, Direction.DOWN), (8, Direction.DOWN)):
+            request_manager.add_request(floor, direction)
+        time_provider.advance_time(10) # The batch is flushed after the doors opened
+        request_manager.remove_requests_at({5: 103.0, 8: 104.0, 9: 105.0})
+        self.assertEqual(request_manager.get_up_requests(), [2])
+        self.assertEqual(request_manager.get_down_requests(), [])
+        self.assertEqual(metrics.get("elevator_calls_served").labels("DOWN").get(), 2)
+        down_wait = metrics.get("elevator_hall_call_wait_seconds").labels("DOWN")
+        self.assertAlmostEqual(down_wait.get_sum(), 3.0 + 4.0) # Waits end at the door openings, not the flush
+
+class TestSystemEventDelivery(unittest.TestCase):
+    def setUp(self):
+        self.system = make_system()
+
+    @patch('builtins.print')
+    def test_tick_delivers_fulfilment_after_moves(self, mock_print):
+        batches = []
+        self.system.event_bus.subscribe(RequestFulfilled.topic, batches.append)
+        self.system.call_elevator(0, Direction.UP) # Car is already there
+        self.system.tick()
+        self.assertEqual([[(event.car_id, event.floor) for event in batch] for batch in batches], [[(0, 0)]])
+        self.assertEqual(self.system.request_manager.get_up_requests(), [])
+
+if __name__ == '__main__':
+    unittest.main()
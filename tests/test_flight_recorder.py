@@ -0,0 +1,87 @@
+import unittest
+import sys
+import os
+import tempfile
+from unittest.mock import Mock, patch
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import flight_recorder
+from flight_recorder import (FlightRecorder, decode, read_dump, format_record, install_crash_dump,
+                             DISPATCH_UP, HALL_CALL_UP, HALL_CALLS_CLEARED, NO_CAR, NO_ARG)
+from commands import Command
+from enums import Direction
+from elevator_state import MOVING_UP
+from time_provider import MockTimeProvider
+from tests.helpers import make_system
+
+class TestFlightRecorder(unittest.TestCase):
+    def setUp(self):
+        self.time_provider = MockTimeProvider()
+        self.recorder = FlightRecorder(capacity=4, clock=self.time_provider.get_time)
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_ring_keeps_latest_records_in_order(self):
+        for floor in range(6):
+            self.time_provider.advance_time(1)
+            self.recorder.record(0, Command.ADD_UP_REQUEST, floor)
+        self.assertEqual(len(self.recorder), 4)
+        records = list(decode(self.recorder.to_bytes()))
+        self.assertEqual([arg for _, _, _, arg in records], [2, 3, 4, 5])
+        self.assertEqual([timestamp for timestamp, _, _, _ in records], [3, 4, 5, 6])
+
+    def test_commands_encode_directions_and_states(self):
+        self.recorder.record_command(1, Command.SET_DIRECTION, Direction.UP)
+        self.recorder.record_command(1, Command.SET_STATE, MOVING_UP)
+        self.recorder.record_command(1, Command.INCREMENT_FLOOR, None)
+        self.recorder.record_command(1, Command.ADD_UP_REQUEST, 7)
+        self.assertEqual([record[2:] for record in decode(self.recorder.to_bytes())],
+                         [(Command.SET_DIRECTION, Direction.UP.value), (Command.SET_STATE, MOVING_UP.code),
+                          (Command.INCREMENT_FLOOR, NO_ARG), (Command.ADD_UP_REQUEST, 7)])
+
+    def test_dump_round_trip_and_formatting(self):
+        path = os.path.join(self.tmp_dir.name, "flight.bin")
+        self.recorder.record(NO_CAR, HALL_CALL_UP, 5)
+        self.recorder.record(2, Command.OPEN_DOOR_AND_NOTIFY)
+        self.recorder.dump(path)
+        records = list(read_dump(path))
+        self.assertEqual(len(records), 2)
+        self.assertEqual(format_record(records[0]), "0.000000 car=  - HALL_CALL_UP         5")
+        self.assertEqual(format_record(records[1]), "0.000000 car=  2 OPEN_DOOR_AND_NOTIFY")
+
+        bogus = os.path.join(self.tmp_dir.name, "bogus.bin")
+        with open(bogus, "wb") as f:
+            f.write(b"\0" * 64)
+        with self.assertRaises(ValueError):
+            list(read_dump(bogus))
+
+    def test_crash_hook_dumps_before_delegating(self):
+        path = os.path.join(self.tmp_dir.name, "crash.bin")
+        previous_hook = Mock()
+        self.recorder.record(0, Command.INCREMENT_FLOOR)
+        with patch.object(sys, 'excepthook', previous_hook), patch.object(flight_recorder.threading, 'excepthook'):
+            install_crash_dump(self.recorder, path)
+            sys.excepthook(RuntimeError, RuntimeError("boom"), None)
+        previous_hook.assert_called_once()
+        self.assertEqual(len(list(read_dump(path))), 1)
+
+class TestSystemFlightRecording(unittest.TestCase):
+    def setUp(self):
+        self.system = make_system()
+
+    @patch('builtins.print')
+    def test_records_calls_dispatch_commands_and_service(self, mock_print):
+        self.system.call_elevator(2, Direction.UP)
+        for _ in range(3):
+            self.system.tick()
+        opcodes = [opcode for _, _, opcode, _ in decode(self.system.flight_recorder.to_bytes())]
+        self.assertEqual(opcodes[:2], [HALL_CALL_UP, DISPATCH_UP])
+        self.assertIn(Command.SET_STATE, opcodes)
+        self.assertIn(Command.OPEN_DOOR_AND_NOTIFY, opcodes)
+        self.assertEqual(opcodes[-1], HALL_CALLS_CLEARED)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,9 +4,10 @@ import os
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from floor import Floor
+from floor import Floor, FloorDirectory
 from elevator_panel import HallPanel
 from display import Display
+from enums import Direction
 
 class TestFloor(unittest.TestCase):
     def setUp(self):
@@ -17,5 +18,31 @@ class TestFloor(unittest.TestCase):
         self.assertIsInstance(self.floor.get_panel(), HallPanel)
         self.assertIsInstance(self.floor.get_display(), Display)
 
+    def test_components_are_slotted(self):
+        for component in (self.floor, self.floor.get_panel(), self.floor.get_panel().get_up_button(), self.floor.get_display()):
+            self.assertFalse(hasattr(component, '__dict__'), type(component).__name__)
+
+class TestFloorDirectory(unittest.TestCase):
+    def setUp(self):
+        self.floors = FloorDirectory(num_floors=5000)
+
+    def test_floors_are_built_on_first_access(self):
+        self.assertEqual(len(self.floors), 5000)
+        self.assertEqual(self.floors.materialized_count(), 0)
+        floor = self.floors[4200]
+        self.assertEqual(floor.get_floor_number(), 4200)
+        self.assertIs(self.floors[4200], floor)
+        self.assertIs(self.floors[-1], self.floors[4999])
+        self.assertTrue(self.floors.is_materialized(4200))
+        self.assertFalse(self.floors.is_materialized(10))
+        self.assertEqual(self.floors.materialized_count(), 2)
+        with self.assertRaises(IndexError):
+            self.floors[5000]
+
+    def test_floors_share_factory_and_hall_call_board(self):
+        self.floors[7].get_panel().press_up_button()
+        self.assertIs(self.floors[7].factory, self.floors[8].factory)
+        self.assertTrue(self.floors.hall_call_board.is_pressed(7, Direction.UP))
+
 if __name__ == '__main__':
     unittest.main()
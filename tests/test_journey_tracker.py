@@ -0,0 +1,97 @@
+import unittest
+import sys
+import os
+import math
+from unittest.mock import patch
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from journey_tracker import JourneyTracker
+from time_provider import MockTimeProvider
+from enums import Direction
+from tests.helpers import make_system
+
+class TestJourneyTracker(unittest.TestCase):
+    def setUp(self):
+        self.time_provider = MockTimeProvider()
+        self.tracker = JourneyTracker(capacity=2, time_provider=self.time_provider)
+
+    def test_full_journey(self):
+        record = self.tracker.open_call(3, Direction.UP)
+        self.time_provider.advance_time(2)
+        self.tracker.mark_assigned(3, Direction.UP, car_id=1)
+        self.time_provider.advance_time(8)
+        self.tracker.record_door_open(3, car_id=1)
+        self.tracker.mark_destination(1, 9)
+        self.time_provider.advance_time(15)
+        self.tracker.record_door_open(9, car_id=1)
+
+        self.assertEqual(self.tracker.assigned_at[record], 2)
+        self.assertEqual(self.tracker.picked_up_at[record], 10)
+        self.assertEqual(self.tracker.arrived_at[record], 25)
+        self.assertEqual(self.tracker.destination[record], 9)
+        self.assertEqual(self.tracker.car[record], 1)
+        self.assertEqual(self.tracker.wait_time_distribution()[3]["mean"], 10)
+        self.assertEqual(self.tracker.journey_time_distribution()[3]["max"], 25)
+
+    def test_assignment_is_stamped_once(self):
+        record = self.tracker.open_call(3, Direction.UP)
+        self.tracker.mark_assigned(3, Direction.UP, car_id=0)
+        self.time_provider.advance_time(5)
+        self.tracker.mark_assigned(3, Direction.UP, car_id=1)
+        self.assertEqual(self.tracker.assigned_at[record], 0)
+        self.assertEqual(self.tracker.car[record], 0)
+
+    def test_columns_grow_past_capacity(self):
+        for floor in range(5):
+            self.tracker.open_call(floor, Direction.UP)
+        self.assertEqual(len(self.tracker), 5)
+        self.assertEqual(list(self.tracker.origin[:5]), [0, 1, 2, 3, 4])
+        self.assertTrue(math.isnan(self.tracker.picked_up_at[4]))
+
+    def test_distributions_by_floor_and_hour(self):
+        for wait in (10, 20, 30):
+            self.tracker.open_call(2, Direction.DOWN)
+            self.time_provider.advance_time(wait)
+            self.tracker.record_door_open(2, car_id=0)
+        self.time_provider.advance_time(3600)
+        self.tracker.open_call(5, Direction.UP) # Still waiting, not part of the rollup
+
+        by_floor = self.tracker.wait_time_distribution(group_by="floor")
+        self.assertEqual(list(by_floor), [2])
+        self.assertEqual(by_floor[2]["count"], 3)
+        self.assertEqual(by_floor[2]["p50"], 20)
+        self.assertEqual(by_floor[2]["max"], 30)
+        self.assertEqual(list(self.tracker.wait_time_distribution(group_by="hour")), [0])
+        with self.assertRaises(ValueError):
+            self.tracker.wait_time_distribution(group_by="car")
+
+class TestSystemJourneyTracking(unittest.TestCase):
+    def setUp(self):
+        self.time_provider = MockTimeProvider()
+        self.system = make_system(time_provider=self.time_provider)
+        self.tracker = self.system.enable_journey_tracking()
+
+    @patch('builtins.print')
+    def test_call_pickup_and_arrival(self, mock_print):
+        self.system.call_elevator(2, Direction.UP)
+        for _ in range(2): # Dispatch and start moving, then reach floor 1
+            self.time_provider.advance_time(1)
+            self.system.tick()
+        self.time_provider.advance_time(1)
+        self.system.tick() # Reach floor 2, door opens
+        self.system.press_car_button(0, 4)
+        for _ in range(10):
+            if not math.isnan(self.tracker.arrived_at[0]):
+                break
+            self.time_provider.advance_time(1)
+            self.system.tick()
+
+        self.assertEqual(self.tracker.assigned_at[0], 1)
+        self.assertEqual(self.tracker.picked_up_at[0], 3)
+        self.assertEqual(self.tracker.destination[0], 4)
+        self.assertGreater(self.tracker.arrived_at[0], self.tracker.picked_up_at[0])
+        self.assertEqual(self.system.get_car(0).get_current_floor(), 4)
+
+if __name__ == '__main__':
+    unittest.main()
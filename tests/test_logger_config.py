@@ -0,0 +1,47 @@
+import unittest
+import sys
+import os
+import logging
+import tempfile
+from logging.handlers import QueueHandler
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from logger_config import setup_logging
+
+class TestSetupLogging(unittest.TestCase):
+    def setUp(self):
+        root = logging.getLogger()
+        self.saved_handlers = root.handlers[:]
+        self.saved_level = root.level
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.log_file = os.path.join(self.tmp_dir.name, "elevator.log")
+
+    def tearDown(self):
+        root = logging.getLogger()
+        for handler in root.handlers:
+            handler.close()
+        root.handlers = self.saved_handlers
+        root.setLevel(self.saved_level)
+        logging.getLogger("test_subsystem").setLevel(logging.NOTSET)
+        self.tmp_dir.cleanup()
+
+    def test_queue_mode_writes_through_listener(self):
+        listener = setup_logging(use_queue=True, level="INFO", levels={"test_subsystem": "WARNING"}, log_file=self.log_file)
+        self.assertIsInstance(logging.getLogger().handlers[0], QueueHandler)
+        logger = logging.getLogger("test_subsystem")
+        logger.info("suppressed %s", "info")
+        logger.warning("car %d stuck at floor %d", 2, 7)
+        listener.stop() # Drains the queue
+        with open(self.log_file) as f:
+            contents = f.read()
+        self.assertIn("test_subsystem - WARNING - car 2 stuck at floor 7", contents)
+        self.assertNotIn("suppressed", contents)
+
+    def test_synchronous_mode(self):
+        self.assertIsNone(setup_logging(use_queue=False, level="DEBUG", levels={}, log_file=None))
+        self.assertEqual(logging.getLogger().level, logging.DEBUG)
+        self.assertIsInstance(logging.getLogger().handlers[0], logging.StreamHandler)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+import sys
+import os
+import tempfile
+import urllib.request
+from unittest.mock import Mock
+
+# Add the parent directory to the sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from metrics import MetricsRegistry, write_textfile, start_http_server
+from request_manager import RequestManager
+from time_provider import MockTimeProvider
+from enums import Direction
+
+class TestMetricsRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = MetricsRegistry()
+
+    def test_counter(self):
+        counter = self.registry.counter("test_events", "Events seen.")
+        counter.inc()
+        counter.inc(2)
+        self.assertEqual(counter.get(), 3)
+        self.assertIn("# TYPE test_events counter", self.registry.render())
+        self.assertIn("test_events_total 3.0", self.registry.render())
+        with self.assertRaises(ValueError):
+            counter.inc(-1)
+
+    def test_get_or_create_returns_same_metric(self):
+        first = self.registry.counter("test_events", "Events seen.", ("car",))
+        second = self.registry.counter("test_events", "Events seen.", ("car",))
+        self.assertIs(first, second)
+        with self.assertRaises(ValueError):
+            self.registry.gauge("test_events", "Events seen.")
+
+    def test_labelled_gauge(self):
+        gauge = self.registry.gauge("test_floor", "Floor.", ("car",))
+        gauge.labels("1").set(4)
+        gauge.labels(1).inc()
+        self.assertEqual(gauge.labels("1").get(), 5)
+        self.assertIn('test_floor{car="1"} 5.0', self.registry.render())
+
+    def test_histogram_buckets_are_cumulative(self):
+        histogram = self.registry.histogram("test_latency_seconds", "Latency.", buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.5, 5.0):
+            histogram.observe(value)
+        text = self.registry.render()
+        self.assertIn('test_latency_seconds_bucket{le="0.1"} 1', text)
+        self.assertIn('test_latency_seconds_bucket{le="1.0"} 3', text)
+        self.assertIn('test_latency_seconds_bucket{le="+Inf"} 4', text)
+        self.assertIn("test_latency_seconds_count 4", text)
+        self.assertEqual(histogram.get_sum(), 6.05)
+
+    def test_write_textfile(self):
+        self.registry.counter("test_events", "Events seen.").inc()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "metrics.prom")
+            write_textfile(path, self.registry)
+            with open(path, encoding="utf-8") as f:
+                self.assertIn("test_events_total 1.0", f.read())
+
+    def test_http_endpoint(self):
+        self.registry.counter("test_events", "Events seen.").inc()
+        server = start_http_server(0, registry=self.registry)
+        try:
+            port = server.server_address[1]
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+                self.assertIn("test_events_total 1.0", response.read().decode("utf-8"))
+        finally:
+            server.shutdown()
+            server.server_close()
+
+class TestRequestManagerMetrics(unittest.TestCase):
+    def test_calls_and_wait_time(self):
+        registry = MetricsRegistry()
+        time_provider = MockTimeProvider()
+        mock_db_manager = Mock()
+        mock_db_manager.load_system_requests.return_value = []
+        request_manager = RequestManager(mock_db_manager, time_provider, registry)
+
+        request_manager.add_request(5, Direction.UP)
+        request_manager.add_request(5, Direction.UP) # Duplicate press is not a new call
+        time_provider.advance_time(12)
+        request_manager.remove_request(5, Direction.UP)
+
+        self.assertEqual(registry.get("elevator_calls_received").labels("UP").get(), 1)
+        self.assertEqual(registry.get("elevator_calls_served").labels("UP").get(), 1)
+        wait = registry.get("elevator_hall_call_wait_seconds").labels("UP")
+        self.assertEqual(wait.get_count(), 1)
+        self.assertEqual(wait.get_sum(), 12)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+import unittest
+import sys
+import os
+from unittest.mock import Mock
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from motion_model import MotionProfile, KinematicMotion, travel_time
+from elevator_car import ElevatorCar
+from elevator_panel import ElevatorPanel
+from door import Door
+from enums import Direction, DoorState
+from elevator_state import IdleState
+from time_provider import MockTimeProvider
+
+class TestMotionProfile(unittest.TestCase):
+    def test_long_trip_reaches_cruise_velocity(self):
+        profile = MotionProfile(35.0, max_velocity=2.5, max_acceleration=1.0, max_jerk=1.5)
+        # Accelerating and braking take 2.5/1.0 + 1.0/1.5 s each and cover 2.5 * that distance together
+        ramp_time = 2.5 + 1.0 / 1.5
+        self.assertAlmostEqual(profile.duration, 2 * ramp_time + (35.0 - 2.5 * ramp_time) / 2.5)
+        self.assertAlmostEqual(profile.state_at(profile.duration / 2)[1], 2.5)
+        self.assertEqual(profile.state_at(profile.duration), (35.0, 0.0, 0.0))
+
+    def test_short_trip_stays_within_limits(self):
+        profile = MotionProfile(0.5, max_velocity=2.5, max_acceleration=1.0, max_jerk=1.5)
+        samples = [profile.state_at(profile.duration * i / 100) for i in range(101)]
+        self.assertLess(max(v for _, v, _ in samples), 2.5)
+        self.assertLessEqual(max(abs(a) for _, _, a in samples), 1.0 + 1e-9)
+        self.assertAlmostEqual(profile.state_at(profile.duration - 1e-9)[0], 0.5)
+        self.assertEqual(travel_time(-0.5, 2.5, 1.0, 1.5), profile.duration)
+
+class TestKinematicMotion(unittest.TestCase):
+    def setUp(self):
+        self.motion = KinematicMotion(floor_height=3.5, max_velocity=2.5, max_acceleration=1.0, max_jerk=1.5)
+
+    def test_trip_advances_any_distance(self):
+        self.motion.travel_to(10)
+        self.motion.advance(10.0)
+        self.assertTrue(self.motion.is_moving())
+        self.assertGreater(self.motion.floor_passed(), 5)
+        self.motion.advance(self.motion.time_to_arrival())
+        self.assertFalse(self.motion.is_moving())
+        self.assertEqual(self.motion.position, 35.0)
+        self.assertEqual(self.motion.floor_passed(), 10)
+
+    def test_retarget_only_before_braking_point(self):
+        self.motion.travel_to(10)
+        self.motion.advance(4.0)
+        passed = self.motion.floor_passed()
+        self.assertFalse(self.motion.can_stop_at(passed))
+        self.assertTrue(self.motion.can_stop_at(8))
+        self.assertTrue(self.motion.travel_to(8))
+        self.motion.advance(self.motion.time_to_arrival())
+        self.assertEqual(self.motion.floor_passed(), 8)
+
+        self.motion.travel_to(0)
+        self.motion.advance(self.motion.time_to_arrival() - 0.5) # Braking into floor 0
+        self.assertFalse(self.motion.travel_to(1))
+        self.assertTrue(self.motion.can_stop_at(0))
+
+    def test_rejects_non_positive_limits(self):
+        with self.assertRaises(ValueError):
+            KinematicMotion(floor_height=3.5, max_velocity=0, max_acceleration=1.0, max_jerk=1.5)
+
+class TestKinematicCar(unittest.TestCase):
+    def setUp(self):
+        self.time_provider = MockTimeProvider()
+        db_manager = Mock()
+        db_manager.load_car_state.return_value = None
+        db_manager.load_car_requests.return_value = []
+        self.car = ElevatorCar(car_id=0, num_floors=40, door_open_duration=2, time_provider=self.time_provider,
+                               door=Door(), panel=ElevatorPanel(40), display=Mock(), database_manager=db_manager,
+                               motion=KinematicMotion(3.5, 2.5, 1.0, 1.5))
+
+    def test_express_trip_takes_few_moves(self):
+        self.car.register_request(30)
+        moves = 0
+        while self.car.door.get_state() == DoorState.CLOSED:
+            self.time_provider.advance_time(5)
+            self.car.move()
+            moves += 1
+        self.assertEqual(self.car.get_current_floor(), 30)
+        self.assertLess(moves, 15) # vs. 30+ one-floor moves
+        self.assertEqual(self.car.up_requests, [])
+        self.assertIsInstance(self.car.get_state(), IdleState)
+
+    def test_requests_past_braking_point_wait_for_return_sweep(self):
+        self.car.register_request(20)
+        self.car.move(dt=0) # Idle -> moving up
+        self.car.move(dt=12.0)
+        self.assertEqual(self.car.direction, Direction.UP)
+        passed = self.car.get_current_floor()
+        self.car.register_request(passed + 1)
+        self.assertEqual(self.car.up_requests, [20])
+        self.assertEqual(self.car.down_requests, [passed + 1]) # Kept for the return sweep
+        self.car.register_request(18)
+        self.assertEqual(self.car.up_requests, [18, 20])
+        self.car.move(dt=self.car.motion.time_to_arrival())
+        self.assertEqual(self.car.get_current_floor(), 18)
+        self.assertEqual(self.car.door.get_state(), DoorState.OPEN)
+
+    def test_request_beyond_braking_target_is_served_next(self):
+        self.car.register_request(10)
+        self.car.move(dt=0) # Idle -> moving up
+        self.car.move(dt=0) # Starts the trip
+        self.car.move(dt=self.car.motion.time_to_arrival() - 0.5) # Braking into floor 10
+        self.assertFalse(self.car.can_stop_at(15))
+        self.car.register_request(15)
+        self.assertIn(15, self.car.up_requests + self.car.down_requests) # Not dropped
+        for _ in range(10):
+            self.time_provider.advance_time(5)
+            self.car.move()
+            if self.car.get_current_floor() == 15:
+                break
+        self.assertEqual(self.car.get_current_floor(), 15)
+        self.assertEqual(self.car.up_requests + self.car.down_requests, [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+import sys
+import os
+import threading
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from quiescence import ActivitySignal
+
+
+class TestActivitySignal(unittest.TestCase):
+    def test_wait_times_out_without_activity(self):
+        signal = ActivitySignal()
+        self.assertFalse(signal.wait(timeout=0.01))
+        self.assertFalse(signal.clear())
+
+    def test_activity_before_wait_is_not_lost(self):
+        signal = ActivitySignal()
+        signal.notify()
+        self.assertTrue(signal.wait(timeout=0))
+        self.assertTrue(signal.wait(timeout=0)) # Waiting does not consume it; the next tick does
+        self.assertTrue(signal.clear())
+        self.assertFalse(signal.wait(timeout=0))
+
+    def test_notify_wakes_waiting_thread(self):
+        signal = ActivitySignal()
+        woken = []
+        waiter = threading.Thread(target=lambda: woken.append((signal.wait(timeout=5), time.perf_counter())))
+        waiter.start()
+        time.sleep(0.05)
+        notified_at = time.perf_counter()
+        signal.notify()
+        waiter.join()
+        self.assertTrue(woken[0][0])
+        self.assertLess(woken[0][1] - notified_at, 0.5) # Woken by the notify, not the timeout
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,191 @@
+import unittest
+import sys
+import os
+import json
+import sqlite3
+import subprocess
+import tempfile
+import textwrap
+from unittest.mock import patch
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from standby import Lease, HotStandby
+from enums import Direction, DoorState
+from elevator_state import MOVING_UP, IDLE
+from elevator_system import ElevatorSystem
+from database_manager import DatabaseManager
+from tests.helpers import make_mock_db_manager, make_system
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+class TestLease(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "controller.lease")
+        self.clock = FakeClock()
+        self.primary = Lease(self.path, duration=3, holder="primary", clock=self.clock)
+        self.standby = Lease(self.path, duration=3, holder="standby", clock=self.clock)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_expiry_and_takeover(self):
+        self.assertTrue(self.primary.try_acquire())
+        self.assertEqual(self.primary.read(), ("primary", 1003.0))
+        self.clock.now += 2
+        self.assertFalse(self.standby.try_acquire())
+        self.assertTrue(self.primary.renew())
+        self.clock.now += 2.5
+        self.assertFalse(self.standby.try_acquire()) # Renewed until 1005
+        self.clock.now += 1
+        self.assertTrue(self.standby.try_acquire())
+        self.assertFalse(self.primary.renew()) # The old primary is fenced off
+        self.assertEqual(self.primary.read()[0], "standby")
+
+    def test_release_hands_over_immediately(self):
+        self.primary.try_acquire()
+        self.standby.release() # Not the holder: no effect
+        self.assertFalse(self.standby.try_acquire())
+        self.primary.release()
+        self.assertTrue(self.standby.try_acquire())
+
+    def test_invalid_duration(self):
+        with self.assertRaises(ValueError):
+            Lease(self.path, duration=0)
+
+class TestReplica(unittest.TestCase):
+    def test_load_persisted_state_applies_changes(self):
+        db = make_mock_db_manager()
+        system = make_system(num_cars=2, db_manager=db)
+
+        db.load_system_requests.return_value = [(4, Direction.UP), (8, Direction.DOWN)]
+        db.load_car_state.side_effect = lambda car_id: {
+            "car_id": car_id, "current_floor": 3, "direction": Direction.UP, "current_state": MOVING_UP.code,
+            "door_state": DoorState.CLOSED, "door_open_time": 0} if car_id == 1 else None
+        db.load_car_requests.side_effect = lambda car_id: [(6, Direction.UP)] if car_id == 1 else []
+        self.assertEqual(system.load_persisted_state(), 1)
+        self.assertEqual(system.request_manager.get_up_requests(), [4])
+        self.assertTrue(system.hall_calls.is_pressed(8, Direction.DOWN))
+        car = system.get_car(1)
+        self.assertEqual((car.current_floor, car.state, car.up_requests), (3, MOVING_UP, [6]))
+        self.assertIs(system.get_car(0).state, IDLE)
+        self.assertEqual(system.load_persisted_state(), 0) # Nothing new
+
+    def test_load_persisted_state_follows_retiring_cars(self):
+        db = make_mock_db_manager()
+        system = make_system(num_cars=2, db_manager=db)
+        db.load_car_state.side_effect = lambda car_id: {
+            "car_id": car_id, "current_floor": 0, "direction": Direction.STOP, "current_state": IDLE.code,
+            "door_state": DoorState.CLOSED, "door_open_time": 0, "retiring": car_id == 1}
+        db.load_car_requests.side_effect = lambda car_id: [(5, Direction.UP)] if car_id == 1 else []
+        system.load_persisted_state()
+        self.assertTrue(system.is_retiring(1))
+        system.call_elevator(2, Direction.UP)
+        system.dispatcher()
+        self.assertEqual(system.get_car(0).up_requests, [2])
+
+    def test_load_persisted_state_rejects_missing_floors(self):
+        db = make_mock_db_manager()
+        system = make_system(num_cars=1, db_manager=db)
+        system.call_elevator(4, Direction.UP)
+        db.load_system_requests.return_value = [(2, Direction.UP), (-1, Direction.DOWN)]
+        with self.assertRaises(ValueError):
+            system.load_persisted_state()
+        self.assertEqual(system.request_manager.get_up_requests(), [4]) # Replica left as it was
+        self.assertEqual(system.request_manager.get_down_requests(), [])
+        self.assertTrue(system.hall_calls.is_pressed(4, Direction.UP))
+
+PRIMARY_SCRIPT = textwrap.dedent("""
+    import json, os, sys
+    sys.path.insert(0, {root!r})
+    from database_manager import DatabaseManager
+    from elevator_system import ElevatorSystem
+    from enums import Direction
+    from standby import HotStandby, Lease
+
+    db = DatabaseManager({db!r})
+    system = ElevatorSystem.initialize(10, 2, database_manager=db)
+    standby = HotStandby(system, db, Lease({lease!r}, 0.5, holder="primary"))
+    assert standby.wait_for_takeover(max_polls=1)
+    system.call_elevator(6, Direction.UP)
+    system.call_elevator(9, Direction.DOWN)
+    for _ in range(3):
+        system.tick()
+        assert standby.heartbeat()
+    print(json.dumps({{"floors": [car.current_floor for car in system.cars],
+                      "up": system.request_manager.get_up_requests(),
+                      "revision": standby.revision}}))
+    os._exit(0) # Crash: no step_down(), so the standby has to wait for the lease to expire
+""")
+
+class TestTwoProcessTakeover(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmpdir.name, "elevator_state.db")
+        self.lease_path = os.path.join(self.tmpdir.name, "controller.lease")
+        DatabaseManager._instance = None
+        ElevatorSystem._instance = None
+
+    def tearDown(self):
+        if DatabaseManager._instance is not None:
+            DatabaseManager._instance.close()
+        DatabaseManager._instance = None
+        ElevatorSystem._instance = None
+        self.tmpdir.cleanup()
+
+    @patch('builtins.print')
+    def test_standby_follows_and_takes_over(self, mock_print):
+        script = PRIMARY_SCRIPT.format(root=REPO_ROOT, db=self.db_path, lease=self.lease_path)
+        result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, timeout=60)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        primary = json.loads(result.stdout.strip().splitlines()[-1])
+
+        db = DatabaseManager(self.db_path)
+        system = ElevatorSystem(num_floors=10, num_cars=2, database_manager=db)
+        standby = HotStandby(system, db, Lease(self.lease_path, 0.5, holder="standby"), poll_interval=0.05)
+        self.assertTrue(standby.follow())
+        self.assertEqual(standby.revision, primary["revision"])
+        self.assertEqual([car.current_floor for car in system.cars], primary["floors"])
+        self.assertEqual(system.request_manager.get_up_requests(), primary["up"])
+
+        self.assertTrue(standby.wait_for_takeover(max_polls=100))
+        self.assertTrue(standby.is_primary)
+        system.tick()
+        self.assertTrue(standby.heartbeat())
+        self.assertEqual(standby.revision, primary["revision"] + 1)
+        standby.step_down()
+        self.assertLess(Lease(self.lease_path, holder="other").read()[1], 1.0)
+
+    def test_retiring_car_survives_restart(self):
+        with sqlite3.connect(self.db_path) as conn: # A store written before the retiring flag existed
+            conn.execute("CREATE TABLE elevator_car_state (car_id INTEGER PRIMARY KEY, current_floor INTEGER, "
+                         "direction TEXT, current_state INTEGER, door_state TEXT, door_open_time REAL)")
+        db = DatabaseManager(self.db_path)
+        system = ElevatorSystem(num_floors=10, num_cars=2, database_manager=db)
+        system.save_state()
+        system.press_car_button(0, 6) # A passenger keeps car 0 draining
+        system.retire_car(0)
+        db.commit()
+        db.close()
+        DatabaseManager._instance = None
+        ElevatorSystem._instance = None
+
+        db = DatabaseManager(self.db_path)
+        system = ElevatorSystem(num_floors=10, num_cars=2, database_manager=db)
+        self.assertTrue(system.is_retiring(0))
+        self.assertEqual(system.get_car(0).up_requests, [6])
+        system.call_elevator(3, Direction.UP)
+        system.dispatcher()
+        self.assertEqual(system.get_car(0).up_requests, [6]) # No hall calls for the draining car
+        self.assertEqual(system.get_car(1).up_requests, [3])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import unittest
+import sys
+import os
+import tempfile
+from unittest.mock import Mock, patch
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import telemetry_store
+from telemetry_store import TelemetryStore, list_segments, read_segment, scan
+from enums import Direction, DoorState
+from elevator_state import IDLE, MOVING_UP
+from time_provider import MockTimeProvider
+from tests.helpers import make_system
+
+def make_car(car_id, floor, direction=Direction.STOP, state=IDLE, door=DoorState.CLOSED, up=(), down=()):
+    car = Mock()
+    car.car_id = car_id
+    car.current_floor = floor
+    car.direction = direction
+    car.state = state
+    car.door.get_state.return_value = door
+    car.up_requests = list(up)
+    car.down_requests = list(down)
+    return car
+
+class TestTelemetryStore(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self.tmpdir.name, "telemetry")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_rows_are_written_per_column(self):
+        store = TelemetryStore(self.directory)
+        cars = [make_car(0, 3, Direction.UP, MOVING_UP, up=[7, 9]), make_car(1, 0, door=DoorState.OPEN)]
+        store.record_tick(10.0, cars, 2, 1)
+        cars[0].current_floor = 4
+        store.record_tick(11.0, cars, 1, 1)
+        store.close()
+
+        [(start, path)] = list_segments(self.directory)
+        self.assertEqual(start, 10.0)
+        columns = read_segment(path)
+        self.assertEqual(list(columns["timestamp"]), [10.0, 10.0, 11.0, 11.0])
+        self.assertEqual(list(columns["car_id"]), [0, 1, 0, 1])
+        self.assertEqual(list(columns["floor"]), [3, 0, 4, 0])
+        self.assertEqual(list(columns["direction"]), [Direction.UP.value, Direction.STOP.value] * 2)
+        self.assertEqual(list(columns["state"]), [MOVING_UP.code, IDLE.code] * 2)
+        self.assertEqual(list(columns["door"]), [DoorState.CLOSED.value, DoorState.OPEN.value] * 2)
+        self.assertEqual(list(columns["car_calls_up"]), [2, 0, 2, 0])
+        self.assertEqual(list(columns["hall_calls_up"]), [2, 2, 1, 1])
+        self.assertEqual(set(read_segment(path, ["floor"])), {"floor"})
+        with self.assertRaises(ValueError):
+            read_segment(path, ["speed"])
+
+    def test_half_written_rows_are_ignored(self):
+        store = TelemetryStore(self.directory)
+        store.record_tick(0.0, [make_car(0, 5)], 0, 0)
+        store.close()
+        [(_, path)] = list_segments(self.directory)
+        with open(os.path.join(path, "floor.col"), "ab") as f:
+            f.write(b"\x01\x00\x00\x00")
+        self.assertEqual(list(read_segment(path)["floor"]), [5])
+
+    def test_segments_roll_and_expire(self):
+        store = TelemetryStore(self.directory, segment_seconds=10, retention_seconds=25)
+        cars = [make_car(0, 1)]
+        for t in range(0, 60, 5):
+            store.record_tick(float(t), cars, 0, 0)
+        store.close()
+        # Segments started at 0, 10, 20, 30, 40 and 50; those entirely older than 55 - 25 = 30 are gone
+        self.assertEqual([start for start, _ in list_segments(self.directory)], [20.0, 30.0, 40.0, 50.0])
+        timestamps = [list(segment["timestamp"]) for segment in scan(self.directory, ["timestamp"], start=35, end=50)]
+        self.assertEqual(timestamps, [[30.0, 35.0], [40.0, 45.0]])
+
+    def test_memoryview_fallback(self):
+        store = TelemetryStore(self.directory)
+        store.record_tick(1.0, [make_car(0, 2), make_car(1, 8)], 0, 0)
+        store.close()
+        [(_, path)] = list_segments(self.directory)
+        with patch.object(telemetry_store, "numpy", None):
+            floors = read_segment(path)["floor"]
+        self.assertIsInstance(floors, memoryview)
+        self.assertEqual(floors.tolist(), [2, 8])
+
+    def test_invalid_policy(self):
+        with self.assertRaises(ValueError):
+            TelemetryStore(self.directory, segment_seconds=0)
+
+class TestSystemTelemetry(unittest.TestCase):
+    @patch('builtins.print')
+    def test_tick_records_every_car(self, mock_print):
+        time_provider = MockTimeProvider(100)
+        system = make_system(num_cars=2, time_provider=time_provider)
+        with tempfile.TemporaryDirectory() as directory:
+            store = system.enable_telemetry(TelemetryStore(directory))
+            system.call_elevator(5, Direction.UP)
+            for _ in range(3):
+                time_provider.advance_time(1)
+                system.tick()
+            store.close()
+            [(_, path)] = list_segments(directory)
+            columns = read_segment(path)
+            self.assertEqual(list(columns["timestamp"]), [101.0, 101.0, 102.0, 102.0, 103.0, 103.0])
+            self.assertEqual(list(columns["car_id"]), [0, 1] * 3)
+            self.assertEqual(max(columns["floor"]), 2)
+            self.assertEqual(list(columns["hall_calls_up"]), [1] * 6)
+            del columns # Release the mappings before the directory is removed
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import unittest
+import sys
+import os
+import cProfile
+import pstats
+import tempfile
+from unittest.mock import Mock, patch
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from tick_profiler import TickProfiler
+from tests.helpers import make_system
+from enums import Direction
+
+class TestTickProfiler(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_phase_summary(self):
+        profiler = TickProfiler(output_dir=self.tmp_dir.name, sample_every=0)
+        profiler.record_phase("dispatcher", 0.002)
+        profiler.record_phase("dispatcher", 0.004)
+        profiler.record_car_move(0, 0.001)
+        profiler.end_tick(profiler.begin_tick(), 0.01)
+        summary = profiler.summary()
+        self.assertEqual(summary["dispatcher"]["count"], 2)
+        self.assertAlmostEqual(summary["dispatcher"]["mean"], 0.003)
+        self.assertAlmostEqual(summary["dispatcher"]["max"], 0.004)
+        self.assertEqual(summary["car.move[0]"]["count"], 1)
+        self.assertEqual(summary["tick"]["count"], 1)
+        self.assertIn("dispatcher", profiler.report())
+        self.assertEqual(os.listdir(self.tmp_dir.name), []) # Sampling disabled, nothing captured
+
+    def test_outlier_tick_is_captured(self):
+        profiler = TickProfiler(output_dir=self.tmp_dir.name, outlier_threshold=0.0, sample_every=1)
+        profile = profiler.begin_tick()
+        sum(i * i for i in range(1000))
+        path = profiler.end_tick(profile, 1.0)
+        self.assertTrue(os.path.exists(path))
+        self.assertGreater(len(pstats.Stats(path).stats), 0)
+        folded_path = path.replace(".pstats", ".folded")
+        with open(folded_path, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        self.assertTrue(lines)
+        for line in lines:
+            stack, weight = line.rsplit(" ", 1)
+            self.assertTrue(stack)
+            self.assertGreater(int(weight), 0)
+
+    def test_fast_sampled_tick_is_discarded(self):
+        profiler = TickProfiler(output_dir=self.tmp_dir.name, outlier_threshold=10.0, sample_every=1)
+        self.assertIsNone(profiler.end_tick(profiler.begin_tick(), 0.001))
+        self.assertEqual(profiler.captures, [])
+
+class TestProfiledTick(unittest.TestCase):
+    def setUp(self):
+        self.system = make_system(num_cars=2)
+
+    @patch('builtins.print')
+    def test_tick_records_every_phase(self, mock_print):
+        profiler = self.system.enable_profiling(TickProfiler(sample_every=0))
+        self.system.call_elevator(4, Direction.UP)
+        self.system.tick()
+        self.system.tick()
+        summary = profiler.summary()
+        for phase in ("tick", "dispatcher", "monitoring", "save_state", "car.move[0]", "car.move[1]"):
+            self.assertEqual(summary[phase]["count"], 2, phase)
+        self.system.disable_profiling()
+        self.system.tick()
+        self.assertEqual(profiler.summary()["tick"]["count"], 2)
+
+    @patch('builtins.print')
+    def test_failing_sampled_tick_stops_its_profile(self, mock_print):
+        profiler = self.system.enable_profiling(TickProfiler(outlier_threshold=10.0, sample_every=1))
+        profile = Mock(spec=cProfile.Profile)
+        with patch.object(profiler, 'begin_tick', return_value=profile), \
+                patch.object(self.system, 'dispatcher', side_effect=RuntimeError("strategy failed")):
+            with self.assertRaises(RuntimeError):
+                self.system.tick()
+        profile.disable.assert_called_once() # A leaked profile would block every later sample
+        self.assertEqual(profiler.summary()["tick"]["count"], 1)
+
+if __name__ == '__main__':
+    unittest.main()
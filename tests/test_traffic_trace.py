@@ -0,0 +1,95 @@
+import unittest
+import sys
+import os
+import tempfile
+import types
+from unittest.mock import Mock, patch
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import traffic_trace
+from traffic_trace import TrafficRecorder, read_trace, replay_trace, TraceRecord, HALL_CALL_UP, HALL_CALL_DOWN, CAR_CALL, NO_CAR
+from enums import Direction
+from time_provider import MockTimeProvider
+from tests.helpers import make_system
+
+class TestTrafficTrace(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "traffic.trace")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    @patch('builtins.print')
+    def test_records_calls_from_event_bus(self, mock_print):
+        time_provider = MockTimeProvider(100)
+        system = make_system(num_cars=2, time_provider=time_provider)
+        with TrafficRecorder(self.path).attach(system) as recorder:
+            system.call_elevator(5, Direction.UP)
+            time_provider.advance_time(2)
+            system.call_elevator(8, Direction.DOWN)
+            system.press_car_button(1, 3)
+            system.tick()
+            self.assertEqual(recorder.records_written, 3)
+
+        self.assertEqual(list(read_trace(self.path)), [
+            TraceRecord(100, HALL_CALL_UP, NO_CAR, 5),
+            TraceRecord(102, HALL_CALL_DOWN, NO_CAR, 8),
+            TraceRecord(102, CAR_CALL, 1, 3),
+        ])
+
+    def test_appends_and_streams_in_chunks(self):
+        with TrafficRecorder(self.path) as recorder:
+            recorder.record_hall_call(0, 1, Direction.UP)
+        with patch.object(traffic_trace, "_CHUNK_RECORDS", 2), TrafficRecorder(self.path) as recorder:
+            for floor in range(2, 6):
+                recorder.record_hall_call(floor, floor, Direction.DOWN)
+            recorder.flush()
+            with open(self.path, "ab") as f:
+                f.write(b"\x00" * 5) # Truncated final record
+            records = read_trace(self.path)
+            self.assertIsInstance(records, types.GeneratorType)
+            self.assertEqual([record.floor for record in records], [1, 2, 3, 4, 5])
+
+    def test_rejects_other_files(self):
+        with open(self.path, "wb") as f:
+            f.write(b"not a trace file")
+        with self.assertRaises(ValueError):
+            list(read_trace(self.path))
+        with self.assertRaises(ValueError):
+            TrafficRecorder(self.path)
+
+    @patch('builtins.print')
+    def test_replay_as_fast_as_possible(self, mock_print):
+        with TrafficRecorder(self.path) as recorder:
+            recorder.record_hall_call(1000, 6, Direction.UP)
+            recorder.record_car_call(1003, 0, 2)
+        time_provider = MockTimeProvider()
+        system = make_system(num_cars=2, time_provider=time_provider)
+        system.call_elevator = Mock(wraps=system.call_elevator)
+        system.press_car_button = Mock(wraps=system.press_car_button)
+        sleep = Mock()
+
+        self.assertEqual(replay_trace(self.path, system, time_provider, drain_ticks=2, sleep=sleep), 2)
+        system.call_elevator.assert_called_once_with(6, Direction.UP)
+        system.press_car_button.assert_called_once_with(0, 2)
+        self.assertEqual(time_provider.get_time(), 5) # 3 ticks to reach the car call, then 2 drain ticks
+        sleep.assert_not_called()
+
+    @patch('builtins.print')
+    def test_replay_in_real_time_sleeps(self, mock_print):
+        with TrafficRecorder(self.path) as recorder:
+            recorder.record_hall_call(0, 6, Direction.UP)
+            recorder.record_hall_call(4, 2, Direction.DOWN)
+        time_provider = MockTimeProvider()
+        system = make_system(num_cars=2, time_provider=time_provider)
+        sleep = Mock()
+        with patch("traffic_trace.time.monotonic", return_value=0.0):
+            replay_trace(self.path, system, time_provider, realtime=True, speed=2.0, sleep=sleep)
+        self.assertEqual([call.args[0] for call in sleep.call_args_list], [0.5, 1.0, 1.5, 2.0])
+        with self.assertRaises(ValueError):
+            replay_trace(self.path, system, time_provider, tick_interval=0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,266 @@
+import os
+import time
+import cProfile
+import pstats
+import logging
+
+logger = logging.getLogger(__name__)
+
+_MAX_STACK_DEPTH = 128
+
+
+class PhaseTimer:
+    """Accumulates call count, total and worst-case duration for one tick phase."""
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self) -> None:
+        """Initializes an empty PhaseTimer."""
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        """Records one execution of the phase.
+
+        Args:
+            seconds (float): How long the phase took.
+        """
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def mean(self) -> float:
+        """Returns the mean duration of the phase, or 0.0 if it never ran."""
+        return self.total / self.count if self.count else 0.0
+
+
+class TickProfiler:
+    """Opt-in profiler for ElevatorSystem.tick().
+
+    Times every phase of the tick (dispatcher, each car.move, monitoring and save_state) and runs
+    every `sample_every`-th tick under cProfile. Sampled ticks slower than `outlier_threshold` are
+    written to `output_dir` as a .pstats file and, optionally, a collapsed-stack .folded file that
+    flamegraph.pl or speedscope can render.
+    """
+    def __init__(self,
+                 output_dir: str = "tick_profiles",
+                 outlier_threshold: float = 0.05,
+                 sample_every: int = 10,
+                 max_captures: int = 50,
+                 write_collapsed: bool = True) -> None:
+        """Initializes a TickProfiler.
+
+        Args:
+            output_dir (str, optional): Directory captures are written to. Defaults to "tick_profiles".
+            outlier_threshold (float, optional): Minimum tick duration (seconds) for a sampled tick to be kept. Defaults to 0.05.
+            sample_every (int, optional): Run one tick in this many under cProfile; 0 disables sampling. Defaults to 10.
+            max_captures (int, optional): Stop writing captures after this many files. Defaults to 50.
+            write_collapsed (bool, optional): Also write a collapsed-stack file per capture. Defaults to True.
+        """
+        self.output_dir = output_dir
+        self.outlier_threshold = outlier_threshold
+        self.sample_every = sample_every
+        self.max_captures = max_captures
+        self.write_collapsed = write_collapsed
+        self.phases = {}
+        self.car_moves = {}
+        self.tick_timer = PhaseTimer()
+        self.tick_count = 0
+        self.captures = []
+
+    def begin_tick(self) -> cProfile.Profile | None:
+        """Starts a tick, enabling cProfile if this tick is sampled.
+
+        Returns:
+            cProfile.Profile | None: The running profile for a sampled tick, otherwise None.
+        """
+        self.tick_count += 1
+        if not self.sample_every or self.tick_count % self.sample_every or len(self.captures) >= self.max_captures:
+            return None
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Another profiler (e.g. a debugger or an outer cProfile run) is already active.
+            return None
+        return profile
+
+    def record_phase(self, name: str, seconds: float) -> None:
+        """Records the duration of a named tick phase.
+
+        Args:
+            name (str): The phase name, e.g. "dispatcher".
+            seconds (float): How long the phase took.
+        """
+        timer = self.phases.get(name)
+        if timer is None:
+            timer = self.phases[name] = PhaseTimer()
+        timer.add(seconds)
+
+    def record_car_move(self, car_id: int, seconds: float) -> None:
+        """Records the duration of one car's move() within a tick.
+
+        Args:
+            car_id (int): The ID of the car that moved.
+            seconds (float): How long car.move() took.
+        """
+        timer = self.car_moves.get(car_id)
+        if timer is None:
+            timer = self.car_moves[car_id] = PhaseTimer()
+        timer.add(seconds)
+
+    def lap(self, name: str, since: float) -> float:
+        """Records a phase that started at `since` and ends now.
+
+        Args:
+            name (str): The phase name.
+            since (float): The perf_counter() reading at the start of the phase.
+
+        Returns:
+            float: The perf_counter() reading now, i.e. the start of the next phase.
+        """
+        now = time.perf_counter()
+        self.record_phase(name, now - since)
+        return now
+
+    def lap_car_move(self, car_id: int, since: float) -> float:
+        """Records one car's move() that started at `since` and ends now.
+
+        Args:
+            car_id (int): The ID of the car that moved.
+            since (float): The perf_counter() reading before car.move().
+
+        Returns:
+            float: The perf_counter() reading now.
+        """
+        now = time.perf_counter()
+        self.record_car_move(car_id, now - since)
+        return now
+
+    def end_tick(self, profile: cProfile.Profile | None, seconds: float) -> str | None:
+        """Finishes a tick, writing the cProfile capture if the tick was an outlier.
+
+        Args:
+            profile (cProfile.Profile | None): The value returned by begin_tick().
+            seconds (float): The total tick duration.
+
+        Returns:
+            str | None: The path of the written .pstats file, or None if nothing was captured.
+        """
+        self.tick_timer.add(seconds)
+        if profile is None:
+            return None
+        profile.disable()
+        if seconds < self.outlier_threshold:
+            return None
+        os.makedirs(self.output_dir, exist_ok=True)
+        base_path = os.path.join(self.output_dir, f"tick-{self.tick_count:08d}")
+        stats_path = base_path + ".pstats"
+        profile.dump_stats(stats_path)
+        if self.write_collapsed:
+            write_collapsed_stacks(pstats.Stats(profile), base_path + ".folded")
+        self.captures.append(stats_path)
+        logger.info("Captured profile of slow tick %d (%.1f ms) to %s", self.tick_count, seconds * 1000, stats_path)
+        return stats_path
+
+    def summary(self) -> dict:
+        """Summarizes the phase timings collected so far.
+
+        Returns:
+            dict: Maps each phase name ("tick", "dispatcher", "car.move[<id>]", ...) to
+                  a dict with "count", "total", "mean" and "max" in seconds.
+        """
+        timers = {"tick": self.tick_timer}
+        timers.update(self.phases)
+        for car_id, timer in sorted(self.car_moves.items()):
+            timers[f"car.move[{car_id}]"] = timer
+        return {name: {"count": timer.count, "total": timer.total, "mean": timer.mean(), "max": timer.max}
+                for name, timer in timers.items()}
+
+    def report(self) -> str:
+        """Formats the phase summary as a fixed-width table.
+
+        Returns:
+            str: One line per phase with count, mean, max and total in milliseconds.
+        """
+        lines = [f"{'phase':<20} {'count':>8} {'mean ms':>10} {'max ms':>10} {'total ms':>12}"]
+        for name, stats in self.summary().items():
+            lines.append(f"{name:<20} {stats['count']:>8} {stats['mean'] * 1000:>10.3f} "
+                         f"{stats['max'] * 1000:>10.3f} {stats['total'] * 1000:>12.3f}")
+        return "\n".join(lines)
+
+
+class NullTickProfiler:
+    """The profiler ElevatorSystem.tick() uses while profiling is off: every hook is a no-op.
+
+    Keeps tick() a single body for both modes without reading the clock between phases.
+    """
+    def begin_tick(self) -> None:
+        return None
+
+    def lap(self, name: str, since: float) -> float:
+        return since
+
+    def lap_car_move(self, car_id: int, since: float) -> float:
+        return since
+
+    def end_tick(self, profile: None, seconds: float) -> None:
+        return None
+
+
+NULL_PROFILER = NullTickProfiler()
+
+
+def _frame_label(func: tuple) -> str:
+    """Formats a pstats function key (filename, lineno, name) as a flamegraph frame."""
+    filename, lineno, name = func
+    if filename == "~":
+        label = name
+    else:
+        label = f"{os.path.basename(filename)}:{lineno}:{name}"
+    return label.replace(";", ":").replace(" ", "_")
+
+
+def write_collapsed_stacks(stats: pstats.Stats, path: str) -> None:
+    """Writes a pstats call graph in Brendan Gregg's collapsed-stack format.
+
+    cProfile only records caller/callee edges, so each stack's self time is estimated by splitting
+    a function's time across its callers in proportion to the cumulative time of each edge.
+
+    Args:
+        stats (pstats.Stats): The statistics to convert.
+        path (str): The destination .folded file.
+    """
+    raw = stats.stats
+    children = {}
+    for callee, (_, _, _, _, callers) in raw.items():
+        for caller, edge in callers.items():
+            children.setdefault(caller, []).append((callee, edge[3]))
+
+    weights = {}
+
+    def visit(func: tuple, path_time: float, stack: list, on_stack: set) -> None:
+        _, _, tt, ct, _ = raw[func]
+        stack.append(_frame_label(func))
+        on_stack.add(func)
+        if ct > 0:
+            self_time = path_time * tt / ct
+            if self_time > 0:
+                key = ";".join(stack)
+                weights[key] = weights.get(key, 0.0) + self_time
+            for callee, edge_ct in children.get(func, ()):
+                if callee not in on_stack and callee in raw and edge_ct > 0 and len(stack) < _MAX_STACK_DEPTH:
+                    visit(callee, path_time * edge_ct / ct, stack, on_stack)
+        stack.pop()
+        on_stack.discard(func)
+
+    for func, (_, _, _, ct, callers) in raw.items():
+        if not callers:
+            visit(func, ct, [], set())
+
+    with open(path, "w", encoding="utf-8") as f:
+        for key, seconds in weights.items():
+            microseconds = int(round(seconds * 1_000_000))
+            if microseconds > 0:
+                f.write(f"{key} {microseconds}\n")